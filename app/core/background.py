@@ -0,0 +1,118 @@
+"""
+Tareas periódicas en segundo plano de Amura API
+
+Cada tarea se registra al importar su módulo y `main.py` las arranca y
+detiene en el lifespan. Al detenerse se ejecuta una última vez, así los
+buffers (contadores, colas) se vacían en un shutdown ordenado.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Ejecuta `func` cada `interval_seconds` hasta que se detiene"""
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        func: Callable[[], Awaitable[Any]],
+        run_on_stop: bool = True,
+    ):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self._func = func
+        self._run_on_stop = run_on_stop
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+        # ── Métricas ──────────────────────────────────────────
+        self._runs = 0
+        self._failures = 0
+        self._last_run_at: Optional[float] = None
+        self._last_duration = 0.0
+        self._last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._loop(), name=f"periodic:{self.name}")
+        logger.info(f"⏱️ Background task started: {self.name} (every {self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        if self._run_on_stop:
+            await self.run_once()
+        logger.info(f"⏹️ Background task stopped: {self.name}")
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                await self.run_once()
+
+    async def run_once(self) -> None:
+        """Ejecutar la tarea una vez (los errores se registran, no se propagan)"""
+        started = time.perf_counter()
+        try:
+            await self._func()
+            self._last_error = None
+        except Exception as e:
+            self._failures += 1
+            self._last_error = str(e)
+            logger.exception(f"❌ Background task {self.name} failed: {e}")
+        finally:
+            self._runs += 1
+            self._last_run_at = time.time()
+            self._last_duration = time.perf_counter() - started
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "runs": self._runs,
+            "failures": self._failures,
+            "last_run_at": self._last_run_at,
+            "last_duration_ms": round(self._last_duration * 1000, 2),
+            "last_error": self._last_error,
+        }
+
+
+# ── Registro ──────────────────────────────────────────────────
+
+_tasks: List[PeriodicTask] = []
+
+
+def register_task(task: PeriodicTask) -> PeriodicTask:
+    """Registrar una tarea para que el lifespan la arranque/detenga"""
+    _tasks.append(task)
+    return task
+
+
+def start_background_tasks() -> None:
+    for task in _tasks:
+        task.start()
+
+
+async def stop_background_tasks() -> None:
+    """Detener en orden inverso al de registro"""
+    for task in reversed(_tasks):
+        await task.stop()
+
+
+def background_stats() -> Dict[str, Dict[str, Any]]:
+    return {task.name: task.stats() for task in _tasks}
@@ -0,0 +1,492 @@
+"""
+Backplane de WebSocket para Amura API
+
+Cada proceso (nodo) solo tiene sus propias conexiones. El backplane lleva
+los mensajes a los nodos donde está conectado el destinatario y mantiene un
+registro de presencia por nodo, así `send_personal`, `broadcast`,
+`send_to_channel`, `is_online` y `get_online_users` funcionan igual con uno
+que con varios workers o réplicas.
+
+Dos implementaciones:
+- MemoryBackplane: un solo proceso (o varios nodos sobre un mismo MemoryBus
+  en tests).
+- RedisBackplane: pub/sub de Redis, con un canal común y uno por nodo.
+
+El backend se elige con WS_BACKPLANE ("memory" | "redis").
+"""
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from core.background import PeriodicTask, register_task
+from core.database.config import settings
+from core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Mensaje entre nodos: {"op": "user" | "broadcast" | "channel", ...}
+Envelope = Dict[str, Any]
+Handler = Callable[[Envelope], Awaitable[None]]
+LocalUsers = Callable[[], Iterable[str]]
+
+
+class Backplane(ABC):
+    """
+    Transporte entre nodos + presencia. El ConnectionManager del nodo
+    registra un handler que entrega cada envelope a sus conexiones locales.
+    """
+
+    def __init__(self, node_id: Optional[str] = None):
+        self.node_id = node_id or uuid.uuid4().hex[:12]
+        self._handler: Optional[Handler] = None
+        self._local_users: LocalUsers = tuple
+
+        # ── Métricas ──────────────────────────────────────────
+        self._published = 0
+        self._received = 0
+        self._errors = 0
+        self._presence_restored = 0
+
+    def set_handler(self, handler: Handler) -> None:
+        self._handler = handler
+
+    def set_local_users(self, local_users: LocalUsers) -> None:
+        """Usuarios conectados a este nodo, para rehacer su presencia"""
+        self._local_users = local_users
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def _dispatch(self, envelope: Envelope) -> None:
+        """Entregar un envelope a las conexiones de este nodo"""
+        self._received += 1
+        if self._handler is None:
+            return
+        try:
+            await self._handler(envelope)
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"⚠️ Backplane delivery failed on node {self.node_id}: {e}")
+
+    # ── Envío ─────────────────────────────────────────────────
+
+    @abstractmethod
+    async def publish_all(self, envelope: Envelope) -> None:
+        """A todos los nodos (incluido este)"""
+        pass
+
+    @abstractmethod
+    async def publish_node(self, node_id: str, envelope: Envelope) -> None:
+        pass
+
+    async def send_node(self, node_id: str, envelope: Envelope) -> None:
+        if node_id == self.node_id:
+            await self._dispatch(envelope)  # sin pasar por la red
+        else:
+            await self.publish_node(node_id, envelope)
+
+    async def publish_user(self, user_id: str, envelope: Envelope) -> None:
+        """Solo a los nodos donde `user_id` tiene conexiones"""
+        for node_id in await self.user_nodes(user_id):
+            await self.send_node(node_id, envelope)
+
+    # ── Presencia ─────────────────────────────────────────────
+
+    @abstractmethod
+    async def presence_add(self, user_id: str) -> None:
+        """Primera conexión del usuario en este nodo"""
+        pass
+
+    @abstractmethod
+    async def presence_remove(self, user_id: str) -> None:
+        """Última conexión del usuario en este nodo"""
+        pass
+
+    @abstractmethod
+    async def user_nodes(self, user_id: str) -> Set[str]:
+        """Nodos vivos donde el usuario está conectado"""
+        pass
+
+    @abstractmethod
+    async def online_users(self) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def nodes_of(self, user_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """nodo -> usuarios de `user_ids` conectados en él (los offline no aparecen)"""
+        pass
+
+    async def is_online(self, user_id: str) -> bool:
+        return bool(await self.user_nodes(user_id))
+
+    @abstractmethod
+    def online_count(self) -> int:
+        """Usuarios conectados, aproximado y sin ir a la red (informativo)"""
+        pass
+
+    async def heartbeat(self) -> None:
+        """Renovar la presencia del nodo (tarea periódica)"""
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "published": self._published,
+            "received": self._received,
+            "errors": self._errors,
+            "presence_restored": self._presence_restored,
+        }
+
+
+# ── En memoria ────────────────────────────────────────────────
+
+class MemoryBus:
+    """Bus en proceso compartido por uno o varios MemoryBackplane (nodos)"""
+
+    def __init__(self):
+        self.nodes: Dict[str, "MemoryBackplane"] = {}
+        self.presence: Dict[str, Set[str]] = {}  # user_id -> nodos
+
+
+class MemoryBackplane(Backplane):
+    """Un solo proceso; en tests, varios nodos sobre el mismo bus"""
+
+    def __init__(self, bus: Optional[MemoryBus] = None, node_id: Optional[str] = None):
+        super().__init__(node_id)
+        self._bus = bus if bus is not None else MemoryBus()
+        self._bus.nodes[self.node_id] = self
+
+    async def stop(self) -> None:
+        self._bus.nodes.pop(self.node_id, None)
+        for user_id in [u for u, nodes in self._bus.presence.items() if self.node_id in nodes]:
+            await self.presence_remove(user_id)
+
+    async def publish_all(self, envelope: Envelope) -> None:
+        self._published += 1
+        for node in list(self._bus.nodes.values()):
+            await node._dispatch(envelope)
+
+    async def publish_node(self, node_id: str, envelope: Envelope) -> None:
+        node = self._bus.nodes.get(node_id)
+        if node is not None:
+            self._published += 1
+            await node._dispatch(envelope)
+
+    async def presence_add(self, user_id: str) -> None:
+        self._bus.presence.setdefault(user_id, set()).add(self.node_id)
+
+    async def presence_remove(self, user_id: str) -> None:
+        nodes = self._bus.presence.get(user_id)
+        if nodes is not None:
+            nodes.discard(self.node_id)
+            if not nodes:
+                del self._bus.presence[user_id]
+
+    async def user_nodes(self, user_id: str) -> Set[str]:
+        return set(self._bus.presence.get(user_id, ()))
+
+    async def online_users(self) -> List[str]:
+        return list(self._bus.presence)
+
+    def online_count(self) -> int:
+        return len(self._bus.presence)
+
+    async def nodes_of(self, user_ids: Iterable[str]) -> Dict[str, List[str]]:
+        routes: Dict[str, List[str]] = {}
+        for user_id in user_ids:
+            for node_id in self._bus.presence.get(user_id, ()):
+                routes.setdefault(node_id, []).append(user_id)
+        return routes
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "nodes": len(self._bus.nodes), **super().stats()}
+
+
+# ── Redis ─────────────────────────────────────────────────────
+
+class RedisBackplane(Backplane):
+    """
+    Pub/sub de Redis: `<prefix>:all` para broadcast y canales, y
+    `<prefix>:node:<id>` para mensajes personales (solo al nodo del usuario).
+
+    Presencia:
+    - `<prefix>:presence:user:<user_id>`  SET de nodos del usuario
+    - `<prefix>:presence:node:<node_id>`  SET de usuarios del nodo
+    - `<prefix>:presence:alive:<node_id>` con TTL, renovada por heartbeat
+    - `<prefix>:presence:nodes`           SET de nodos conocidos
+    Un nodo caído deja de contar en cuanto expira su clave `alive`, y el
+    heartbeat de cualquier nodo vivo limpia sus conjuntos. Si el nodo no
+    estaba caído (solo se retrasó), su siguiente heartbeat vuelve a
+    registrar a sus usuarios conectados.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        prefix: str = "amura:ws",
+        node_id: Optional[str] = None,
+        presence_ttl: int = settings.WS_PRESENCE_TTL_SECONDS,
+    ):
+        super().__init__(node_id)
+        self._redis = client if client is not None else get_redis()
+        self._prefix = prefix
+        self._presence_ttl = presence_ttl
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        # Suma de usuarios de los nodos vivos, recalculada en cada heartbeat
+        self._online_count = 0
+
+    # ── Keys ──────────────────────────────────────────────────
+
+    @property
+    def _all_channel(self) -> str:
+        return f"{self._prefix}:all"
+
+    def _node_channel(self, node_id: str) -> str:
+        return f"{self._prefix}:node:{node_id}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self._prefix}:presence:user:{user_id}"
+
+    def _node_key(self, node_id: str) -> str:
+        return f"{self._prefix}:presence:node:{node_id}"
+
+    def _alive_key(self, node_id: str) -> str:
+        return f"{self._prefix}:presence:alive:{node_id}"
+
+    @property
+    def _nodes_key(self) -> str:
+        return f"{self._prefix}:presence:nodes"
+
+    def _on_error(self, operation: str, error: Exception) -> None:
+        self._errors += 1
+        logger.warning(f"⚠️ Redis backplane {operation} failed: {error}")
+
+    # ── Ciclo de vida ─────────────────────────────────────────
+
+    async def start(self) -> None:
+        if self._reader is not None:
+            return
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self._all_channel, self._node_channel(self.node_id))
+        await self.heartbeat()
+        self._reader = asyncio.create_task(self._read_loop(), name="ws-backplane")
+        logger.info(f"📡 WebSocket backplane started: node={self.node_id}")
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                self._on_error("close", e)
+            self._pubsub = None
+        try:
+            await self._reap(self.node_id)
+        except Exception as e:
+            self._on_error("presence cleanup", e)
+
+    async def _read_loop(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_error("read", e)
+                await asyncio.sleep(1.0)
+                continue
+            if message is None:
+                continue
+            try:
+                envelope = json.loads(message["data"])
+            except (TypeError, ValueError, KeyError):
+                continue
+            await self._dispatch(envelope)
+
+    # ── Envío ─────────────────────────────────────────────────
+
+    async def _publish(self, channel: str, envelope: Envelope) -> None:
+        try:
+            await self._redis.publish(channel, json.dumps(envelope, default=str))
+            self._published += 1
+        except Exception as e:
+            self._on_error("publish", e)
+
+    async def publish_all(self, envelope: Envelope) -> None:
+        await self._publish(self._all_channel, envelope)
+
+    async def publish_node(self, node_id: str, envelope: Envelope) -> None:
+        await self._publish(self._node_channel(node_id), envelope)
+
+    # ── Presencia ─────────────────────────────────────────────
+
+    @staticmethod
+    def _decode(values) -> Set[str]:
+        return {v.decode() if isinstance(v, bytes) else v for v in values}
+
+    async def _alive(self, node_ids: Set[str]) -> Set[str]:
+        node_ids = list(node_ids)
+        if not node_ids:
+            return set()
+        flags = await self._redis.mget([self._alive_key(n) for n in node_ids])
+        return {node_id for node_id, flag in zip(node_ids, flags) if flag is not None}
+
+    async def presence_add(self, user_id: str) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.sadd(self._user_key(user_id), self.node_id)
+                pipe.sadd(self._node_key(self.node_id), user_id)
+                await pipe.execute()
+        except Exception as e:
+            self._on_error("presence add", e)
+
+    async def presence_remove(self, user_id: str) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.srem(self._user_key(user_id), self.node_id)
+                pipe.srem(self._node_key(self.node_id), user_id)
+                await pipe.execute()
+        except Exception as e:
+            self._on_error("presence remove", e)
+
+    async def user_nodes(self, user_id: str) -> Set[str]:
+        try:
+            nodes = self._decode(await self._redis.smembers(self._user_key(user_id)))
+            return await self._alive(nodes)
+        except Exception as e:
+            self._on_error("presence lookup", e)
+            return set()
+
+    async def online_users(self) -> List[str]:
+        try:
+            nodes = await self._alive(self._decode(await self._redis.smembers(self._nodes_key)))
+            if not nodes:
+                return []
+            return list(self._decode(
+                await self._redis.sunion([self._node_key(n) for n in nodes])
+            ))
+        except Exception as e:
+            self._on_error("presence list", e)
+            return []
+
+    async def nodes_of(self, user_ids: Iterable[str]) -> Dict[str, List[str]]:
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    pipe.smembers(self._user_key(user_id))
+                memberships = [self._decode(nodes) for nodes in await pipe.execute()]
+            alive = await self._alive(set().union(*memberships))
+        except Exception as e:
+            self._on_error("presence lookup", e)
+            return {}
+        routes: Dict[str, List[str]] = {}
+        for user_id, nodes in zip(user_ids, memberships):
+            for node_id in nodes & alive:
+                routes.setdefault(node_id, []).append(user_id)
+        return routes
+
+    async def heartbeat(self) -> None:
+        """Renovar la clave `alive` de este nodo y limpiar nodos caídos"""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._alive_key(self.node_id), "1", ex=self._presence_ttl)
+            pipe.sadd(self._nodes_key, self.node_id)
+            pipe.scard(self._node_key(self.node_id))
+            _, _, registered = await pipe.execute()
+        if registered != len(self._local_users()):
+            await self._restore_presence()
+        known = self._decode(await self._redis.smembers(self._nodes_key))
+        alive = await self._alive(known)
+        for node_id in known - alive:
+            await self._reap(node_id)
+            logger.info(f"🧹 Reaped presence of dead WebSocket node {node_id}")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for node_id in alive:
+                pipe.scard(self._node_key(node_id))
+            self._online_count = sum(await pipe.execute())
+
+    def online_count(self) -> int:
+        """Un SCARD por nodo vivo en cada heartbeat (cuenta dos veces a quien
+        esté en varios nodos); sin lecturas de Redis al llamarlo"""
+        return self._online_count
+
+    async def _restore_presence(self) -> None:
+        """
+        Igualar los conjuntos de presencia de este nodo a sus conexiones
+        locales. Hace falta si otro nodo nos dio por muertos (bloqueo del
+        event loop, corte de Redis) y limpió nuestros conjuntos: sin esto
+        los usuarios de aquí serían inalcanzables hasta reconectar.
+        """
+        registered = self._decode(await self._redis.smembers(self._node_key(self.node_id)))
+        local = set(self._local_users())
+        missing, stale = local - registered, registered - local
+        if not missing and not stale:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in missing:
+                pipe.sadd(self._user_key(user_id), self.node_id)
+            for user_id in stale:
+                pipe.srem(self._user_key(user_id), self.node_id)
+            if missing:
+                pipe.sadd(self._node_key(self.node_id), *missing)
+            if stale:
+                pipe.srem(self._node_key(self.node_id), *stale)
+            await pipe.execute()
+        self._presence_restored += len(missing)
+        logger.warning(
+            f"🔁 Restored WebSocket presence on node {self.node_id}: "
+            f"+{len(missing)} / -{len(stale)} users"
+        )
+
+    async def _reap(self, node_id: str) -> None:
+        """Quitar un nodo del registro de presencia"""
+        users = self._decode(await self._redis.smembers(self._node_key(node_id)))
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in users:
+                pipe.srem(self._user_key(user_id), node_id)
+            pipe.delete(self._node_key(node_id), self._alive_key(node_id))
+            pipe.srem(self._nodes_key, node_id)
+            await pipe.execute()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "subscribed": self._reader is not None and not self._reader.done(),
+            **super().stats(),
+        }
+
+
+# ── Instancia global ──────────────────────────────────────────
+
+def _create_backplane() -> Backplane:
+    if settings.WS_BACKPLANE == "redis":
+        logger.info("📡 WebSocket backplane: redis")
+        return RedisBackplane()
+    return MemoryBackplane()
+
+
+backplane: Backplane = _create_backplane()
+
+register_task(PeriodicTask(
+    "ws_presence_heartbeat",
+    settings.WS_PRESENCE_HEARTBEAT_SECONDS,
+    lambda: backplane.heartbeat(),
+    run_on_stop=False,
+))
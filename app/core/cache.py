@@ -1,49 +1,389 @@
 """
-Cache simple en memoria para Amura API
+Cache de Amura API
+
+Interfaz común (CacheBackend) con dos implementaciones:
+- LRUCache: en proceso, acotada por número de entradas, con TTL.
+- RedisCache: compartida entre réplicas (redis.asyncio).
+
+El backend se elige con CACHE_BACKEND ("memory" | "redis").
 """
-from datetime import datetime, timezone, timedelta
-from typing import Optional, Any
 import logging
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.database.config import settings
+from core.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+Loader = Callable[[], Awaitable[Optional[Any]]]
+BulkLoader = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class CacheBackend(ABC):
+    """
+    Contrato de cache. `None` significa "no está": los valores None no se
+    cachean. Los valores devueltos pueden ser compartidos, no mutarlos.
+    """
+
+    # ── Operaciones básicas ───────────────────────────────────
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    # ── Operaciones en bloque ─────────────────────────────────
+
+    @abstractmethod
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Solo devuelve las keys encontradas"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def clear_prefix(self, prefix: str) -> None:
+        """Eliminar todas las keys que empiezan por `prefix`"""
+        pass
+
+    async def clear(self) -> None:
+        await self.clear_prefix("")
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    # ── Helpers ───────────────────────────────────────────────
+
+    def namespace(self, name: str) -> "NamespacedCache":
+        """Vista de la cache con keys prefijadas por `name:`"""
+        return NamespacedCache(self, name)
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Loader,
+        ttl_seconds: Optional[int] = None,
+    ) -> Optional[Any]:
+        """Read-through: devuelve el valor cacheado o lo carga y lo guarda"""
+        value = await self.get(key)
+        if value is not None:
+            return value
+        value = await loader()
+        if value is not None:
+            await self.set(key, value, ttl_seconds)
+        return value
+
+    async def get_many_or_set(
+        self,
+        keys: Iterable[str],
+        loader: BulkLoader,
+        ttl_seconds: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Read-through en bloque: una sola llamada a `loader` con las keys que
+        faltan (p. ej. un `WHERE id IN (...)`).
+        """
+        keys = list(dict.fromkeys(keys))
+        found = await self.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            loaded = {k: v for k, v in (await loader(missing)).items() if v is not None}
+            if loaded:
+                await self.set_many(loaded, ttl_seconds)
+            found.update(loaded)
+        return found
+
+
+class NamespacedCache(CacheBackend):
+    """Prefija las keys de otro backend con `namespace:`"""
+
+    def __init__(self, backend: CacheBackend, name: str):
+        self._backend = backend
+        self._prefix = f"{name}:"
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._backend.get(self._key(key))
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        await self._backend.set(self._key(key), value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        await self._backend.delete(self._key(key))
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found = await self._backend.get_many(self._key(k) for k in keys)
+        offset = len(self._prefix)
+        return {k[offset:]: v for k, v in found.items()}
+
+    async def set_many(self, items: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        await self._backend.set_many(
+            {self._key(k): v for k, v in items.items()}, ttl_seconds
+        )
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        await self._backend.delete_many(self._key(k) for k in keys)
+
+    async def clear_prefix(self, prefix: str) -> None:
+        await self._backend.clear_prefix(self._key(prefix))
+
+    def namespace(self, name: str) -> "NamespacedCache":
+        return NamespacedCache(self._backend, f"{self._prefix}{name}")
+
+    def stats(self) -> Dict[str, Any]:
+        return self._backend.stats()
+
+
+# ── LRU en proceso ────────────────────────────────────────────
+
+class LRUCache(CacheBackend):
+    """Cache en memoria con límite de entradas (LRU) y TTL"""
+
+    def __init__(self, max_entries: int = 10_000, default_ttl: int = 300):
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _store(self, key: str, value: Any, ttl_seconds: Optional[int]) -> None:
+        ttl = self._default_ttl if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._lookup(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        self._store(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found = {}
+        for key in keys:
+            value = self._lookup(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        for key, value in items.items():
+            self._store(key, value, ttl_seconds)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def clear_prefix(self, prefix: str) -> None:
+        if not prefix:
+            self._data.clear()
+            return
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "backend": "memory",
+            "entries": len(self._data),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+
+# ── Redis (compartida entre réplicas) ─────────────────────────
+
+class RedisCache(CacheBackend):
+    """
+    Cache sobre Redis. Los valores se serializan con pickle.
+    Si Redis falla, se registra y se trata como miss (la API sigue
+    funcionando contra MySQL).
+    """
+
+    def __init__(
+        self,
+        client=None,
+        key_prefix: str = "amura",
+        default_ttl: int = 300,
+    ):
+        self._redis = client if client is not None else get_redis()
+        self._prefix = f"{key_prefix}:"
+        self._default_ttl = default_ttl
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    @property
+    def client(self):
+        return self._redis
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    def _ttl(self, ttl_seconds: Optional[int]) -> int:
+        return self._default_ttl if ttl_seconds is None else ttl_seconds
+
+    def _on_error(self, operation: str, error: Exception) -> None:
+        self._errors += 1
+        logger.warning(f"⚠️ Redis cache {operation} failed: {error}")
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self._redis.get(self._key(key))
+        except Exception as e:
+            self._on_error("get", e)
+            self._misses += 1
+            return None
+        if raw is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        ttl = self._ttl(ttl_seconds)
+        if ttl <= 0:
+            await self.delete(key)
+            return
+        try:
+            await self._redis.set(self._key(key), pickle.dumps(value), ex=ttl)
+        except Exception as e:
+            self._on_error("set", e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._redis.delete(self._key(key))
+        except Exception as e:
+            self._on_error("delete", e)
 
-class InMemoryCache:
-    """Cache en memoria con TTL (Time To Live)"""
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = await self._redis.mget([self._key(k) for k in keys])
+        except Exception as e:
+            self._on_error("mget", e)
+            self._misses += len(keys)
+            return {}
+        found = {}
+        for key, raw in zip(keys, raws):
+            if raw is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                found[key] = pickle.loads(raw)
+        return found
 
-    def __init__(self):
-        self._cache: dict = {}
-        self._expiry: dict = {}
+    async def set_many(self, items: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        if not items:
+            return
+        ttl = self._ttl(ttl_seconds)
+        if ttl <= 0:
+            await self.delete_many(items)
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._key(key), pickle.dumps(value), ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            self._on_error("set_many", e)
 
-    def get(self, key: str) -> Optional[Any]:
-        """Obtener valor del cache"""
-        if key in self._cache:
-            # Verificar expiración
-            if key in self._expiry and datetime.now(timezone.utc) > self._expiry[key]:
-                self.delete(key)
-                return None
-            return self._cache[key]
-        return None
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        keys = [self._key(k) for k in keys]
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except Exception as e:
+            self._on_error("delete_many", e)
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
-        """Guardar valor en cache con TTL (default: 5 minutos)"""
-        self._cache[key] = value
-        self._expiry[key] = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+    async def clear_prefix(self, prefix: str) -> None:
+        try:
+            batch = []
+            async for key in self._redis.scan_iter(match=f"{self._key(prefix)}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._redis.delete(*batch)
+                    batch = []
+            if batch:
+                await self._redis.delete(*batch)
+        except Exception as e:
+            self._on_error("clear", e)
 
-    def delete(self, key: str) -> None:
-        """Eliminar valor del cache"""
-        self._cache.pop(key, None)
-        self._expiry.pop(key, None)
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "backend": "redis",
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "errors": self._errors,
+        }
 
-    def clear(self) -> None:
-        """Limpiar todo el cache"""
-        self._cache.clear()
-        self._expiry.clear()
 
-    def exists(self, key: str) -> bool:
-        """Verificar si una key existe y no ha expirado"""
-        return self.get(key) is not None
+def create_cache() -> CacheBackend:
+    """Construir el backend configurado en CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache(
+            key_prefix=settings.CACHE_KEY_PREFIX,
+            default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+        )
+    return LRUCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+    )
 
 
 # Instancia global
-cache = InMemoryCache()
\ No newline at end of file
+cache = create_cache()
@@ -1,7 +1,12 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Union
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.database.config import settings
+from core.executors import db_executor
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -13,12 +18,109 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engine asíncrono (aiomysql). Solo se crea si DB_ASYNC está activo, así el
+# modo síncrono no necesita el driver async instalado.
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        echo=settings.DEBUG,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
 Base = declarative_base()
 
-def get_db():
+
+class SyncSessionAdapter:
+    """
+    Envuelve una Session síncrona con la misma interfaz awaitable que
+    AsyncSession, para que los repositorios funcionen en ambos modos.
+    Todo lo que toca la conexión corre en el pool `db` (core.executors).
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    @property
+    def sync_session(self) -> Session:
+        return self._session
+
+    @property
+    def info(self) -> dict:
+        return self._session.info
+
+    def add(self, instance) -> None:
+        self._session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self._session.add_all(instances)
+
+    async def execute(self, statement, params=None):
+        return await db_executor.run(self._session.execute, statement, params)
+
+    async def scalar(self, statement, params=None):
+        return await db_executor.run(self._session.scalar, statement, params)
+
+    async def scalars(self, statement, params=None):
+        return await db_executor.run(self._session.scalars, statement, params)
+
+    async def get(self, entity, ident):
+        return await db_executor.run(self._session.get, entity, ident)
+
+    async def delete(self, instance) -> None:
+        await db_executor.run(self._session.delete, instance)
+
+    async def flush(self) -> None:
+        await db_executor.run(self._session.flush)
+
+    async def refresh(self, instance) -> None:
+        await db_executor.run(self._session.refresh, instance)
+
+    async def commit(self) -> None:
+        await db_executor.run(self._session.commit)
+
+    async def rollback(self) -> None:
+        await db_executor.run(self._session.rollback)
+
+    async def close(self) -> None:
+        await db_executor.run(self._session.close)
+
+
+# Tipo de sesión que reciben los repositorios
+DBSession = Union[AsyncSession, SyncSessionAdapter]
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[DBSession]:
+    """Abre una sesión según la configuración (DB_ASYNC) y la cierra al salir"""
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield session
+    else:
+        session = SyncSessionAdapter(SessionLocal())
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_db() -> AsyncIterator[DBSession]:
     """Dependency para obtener sesión de DB"""
-    db = SessionLocal()
-    try:
+    async with session_scope() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+
+async def dispose_engines() -> None:
+    """Cerrar los pools de conexiones (shutdown)"""
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
+    # True: AsyncSession sobre aiomysql | False: Session síncrona (pymysql)
+    DB_ASYNC: bool = False
 
      # === Cloudinary ===
     CLOUDINARY_CLOUD_NAME: str = ""
@@ -31,11 +33,68 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 días
+    BCRYPT_ROUNDS: int = 12                # al cambiarlo se rehashea en el login
+    JWT_CACHE_MAX_ENTRIES: int = 10000     # tokens ya verificados (por proceso)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # id/rol/activo del usuario autenticado
     
     # Redis Cache
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
-    
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str = ""
+    CACHE_BACKEND: str = "memory"          # "memory" | "redis"
+    CACHE_KEY_PREFIX: str = "amura"
+    CACHE_DEFAULT_TTL_SECONDS: int = 300
+    CACHE_MAX_ENTRIES: int = 10000         # solo backend "memory"
+    PIN_CACHE_TTL_SECONDS: int = 60        # detalle de pin
+    USER_SUMMARY_CACHE_TTL_SECONDS: int = 300  # autor en listas
+    USER_STATS_CACHE_TTL_SECONDS: int = 60     # contadores de perfil
+    FOLLOWER_IDS_CACHE_TTL_SECONDS: int = 300  # destinatarios de "nuevo pin"
+
+    # Contador de vistas con buffer
+    VIEW_BUFFER_BACKEND: str = "memory"    # "memory" | "redis"
+    VIEW_FLUSH_INTERVAL_SECONDS: float = 5.0
+    VIEW_FLUSH_BATCH_SIZE: int = 500
+
+    # Feed materializado
+    FEED_FANOUT_MAX_FOLLOWERS: int = 5000  # más seguidores → fan-in al leer
+    FEED_MAX_ITEMS: int = 800              # entradas por timeline
+    FEED_FOLLOW_BACKFILL_ITEMS: int = 20   # pins del autor al empezar a seguirlo
+    FEED_TRIM_INTERVAL_SECONDS: float = 300.0
+
+    # Contadores de usuario desnormalizados
+    USER_COUNTERS_RECONCILE_INTERVAL_SECONDS: float = 3600.0
+    USER_COUNTERS_RECONCILE_BATCH_SIZE: int = 500
+
+    # WebSocket entre réplicas
+    WS_BACKPLANE: str = "memory"           # "memory" | "redis" (pub/sub)
+    WS_PRESENCE_TTL_SECONDS: int = 30      # nodo sin heartbeat → sus usuarios offline
+    WS_PRESENCE_HEARTBEAT_SECONDS: float = 10.0
+    WS_SEND_QUEUE_SIZE: int = 64           # mensajes pendientes por conexión
+    WS_SLOW_CONSUMER_POLICY: str = "drop_oldest"  # drop_oldest | drop_newest | coalesce | disconnect
+    WS_SEND_TIMEOUT_SECONDS: float = 10.0  # un envío más lento cierra la conexión
+    WS_BATCH_WINDOW_MS: int = 50           # modo batch: espera para agrupar eventos
+    WS_BATCH_MAX_EVENTS: int = 50          # modo batch: eventos por frame
+    WS_PER_MESSAGE_DEFLATE: bool = True    # compresión si el cliente la ofrece
+
+    # Outbox de notificaciones
+    NOTIFICATION_DISPATCH_INTERVAL_SECONDS: float = 1.0  # sondeo (además del aviso tras commit)
+    NOTIFICATION_DISPATCH_BATCH_SIZE: int = 200
+    NOTIFICATION_COALESCE_WINDOW_SECONDS: float = 2.0  # 0 = un frame por evento
+    NOTIFICATION_COALESCE_MAX_BATCH: int = 500         # eventos por resumen
+
+    # Trending
+    TRENDING_CACHE_TTL_SECONDS: int = 30   # página top-K compartida
+
+    # Executors (trabajo bloqueante fuera del event loop)
+    EXECUTOR_DB_WORKERS: int = 10      # no más que el pool de conexiones
+    EXECUTOR_DB_QUEUE: int = 200
+    EXECUTOR_HASH_PROCESSES: bool = True   # bcrypt en procesos, no en hilos
+    EXECUTOR_HASH_WORKERS: int = 2
+    EXECUTOR_HASH_QUEUE: int = 32
+    EXECUTOR_UPLOAD_WORKERS: int = 4
+    EXECUTOR_UPLOAD_QUEUE: int = 16
+
     # CORS
     CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -46,6 +105,10 @@ class Settings(BaseSettings):
     @property
     def DATABASE_URL(self) -> str:
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset=utf8mb4"
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset=utf8mb4"
     
     class Config:
         env_file = ".env"
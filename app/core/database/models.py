@@ -1,7 +1,7 @@
 """
 Modelos SQLAlchemy para todas las tablas
 """
-from sqlalchemy import Column, String, Boolean, Integer, Text, TIMESTAMP, Enum, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, Integer, Double, Text, TIMESTAMP, Enum, JSON, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from core.connection import Base
 import enum
@@ -60,6 +60,11 @@ class UserModel(Base):
     locked_until = Column(TIMESTAMP, nullable=True)
     password_reset_token = Column(String(255), nullable=True)
     password_reset_token_expiry = Column(TIMESTAMP, nullable=True)
+    # Contadores desnormalizados (ver users/.../user_counters.py)
+    pins_count = Column(Integer, nullable=False, default=0)
+    followers_count = Column(Integer, nullable=False, default=0)
+    following_count = Column(Integer, nullable=False, default=0)
+    boards_count = Column(Integer, nullable=False, default=0)
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
     last_login = Column(TIMESTAMP, nullable=True)
@@ -89,9 +94,20 @@ class PinModel(Base):
     colors = Column(JSON, default=list)
     tags = Column(JSON, default=list)
     is_private = Column(Boolean, default=False, index=True)
+    # Texto desnormalizado para el índice FULLTEXT (lo mantiene el repositorio)
+    search_text = Column(Text, nullable=True)
+    # Puntuación trending (log2, con decaimiento) por ventana; ver trending_score.py
+    trend_1h = Column(Double, nullable=False, default=0, index=True)
+    trend_24h = Column(Double, nullable=False, default=0, index=True)
+    trend_7d = Column(Double, nullable=False, default=0, index=True)
     created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index('idx_user_created', 'user_id', 'created_at'),
+        Index('ft_pins_search', 'search_text', mysql_prefix='FULLTEXT'),
+    )
+
 # ==================== BOARDS ====================
 
 class BoardModel(Base):
@@ -181,4 +197,43 @@ class CommentModel(Base):
     parent_comment_id = Column(String(36), ForeignKey("comments.id", ondelete="CASCADE"), nullable=True, index=True)
     likes_count = Column(Integer, default=0)
     created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+# ==================== FEED ====================
+
+class FeedItemModel(Base):
+    """Timeline materializado: pins de cuentas seguidas (fan-out on write)"""
+    __tablename__ = "feed_items"
+
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    pin_id = Column(String(36), ForeignKey("pins.id", ondelete="CASCADE"), primary_key=True)
+    author_id = Column(String(36), nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False)  # created_at del pin
+
+    __table_args__ = (
+        Index('idx_feed_user_created', 'user_id', 'created_at'),
+        Index('idx_feed_pin_id', 'pin_id'),
+    )
+
+
+class FeedFaninAuthorModel(Base):
+    """Cuentas con demasiados seguidores para fan-out: se leen en el feed (fan-in)"""
+    __tablename__ = "feed_fanin_authors"
+
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    followers_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+# ==================== NOTIFICACIONES ====================
+
+class NotificationOutboxModel(Base):
+    """Notificaciones pendientes de entregar (se escriben en la transacción del caso de uso)"""
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String(32), nullable=False)  # new_like | new_comment | new_follow
+    actor_id = Column(String(36), nullable=False)
+    recipient_id = Column(String(36), nullable=True)  # NULL → dueño de pin_id
+    pin_id = Column(String(36), nullable=True)
+    payload = Column(JSON, nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
@@ -0,0 +1,205 @@
+"""
+Executors acotados para trabajo bloqueante de Amura API
+
+Cada clase de trabajo (DB síncrona, hash de contraseñas, subidas a
+Cloudinary) tiene su propio pool, así un login o una subida grande no
+bloquean el event loop ni se roban hilos entre sí. bcrypt va en procesos:
+aunque suelta el GIL, una ráfaga de logins en hilos satura la CPU del
+mismo proceso que atiende el resto de requests.
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from core.database.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Pool de hilos (o de procesos) con límite de trabajos pendientes y
+    métricas.
+
+    Como máximo `max_workers + max_queue` trabajos pueden estar enviados al
+    pool a la vez; el resto espera (sin bloquear el loop) a que se libere
+    un hueco, lo que aplica backpressure en vez de acumular memoria.
+
+    Con `processes=True` la función y sus argumentos deben ser picklables
+    (funciones de módulo) y las métricas se toman desde el proceso padre:
+    no se distingue la cola interna del pool, así que `queue_depth` es 0 y
+    `avg_run_ms` incluye esa espera.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, processes: bool = False):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.processes = processes
+        self._pool: Executor
+        if processes:
+            # spawn: no heredar hilos ni el event loop del proceso padre
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"amura-{name}",
+            )
+        self._slots = asyncio.Semaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+
+        # ── Métricas ──────────────────────────────────────────
+        self._waiting = 0        # esperando hueco (backpressure)
+        self._queued = 0         # enviados al pool, sin hilo todavía
+        self._in_flight = 0      # ejecutándose en un hilo
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Ejecutar `fn(*args, **kwargs)` en el pool y esperar el resultado"""
+        submitted_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            if self.processes:
+                return await self._run_in_process(loop, fn, submitted_at, args, kwargs)
+            with self._lock:
+                self._queued += 1
+            ctx = contextvars.copy_context()
+            call = functools.partial(
+                ctx.run, self._instrumented, fn, submitted_at, args, kwargs
+            )
+            return await loop.run_in_executor(self._pool, call)
+        finally:
+            self._slots.release()
+
+    async def _run_in_process(
+        self, loop: asyncio.AbstractEventLoop, fn: Callable[..., T], submitted_at: float, args, kwargs
+    ) -> T:
+        """Como _instrumented, pero medido desde el padre"""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._started(started_at - submitted_at)
+        failed = False
+        try:
+            return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._finished(time.perf_counter() - started_at, failed)
+
+    def _instrumented(self, fn: Callable[..., T], submitted_at: float, args, kwargs) -> T:
+        """Corre en el hilo del pool: mide espera en cola y duración"""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._started(started_at - submitted_at)
+
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._finished(time.perf_counter() - started_at, failed)
+
+    def _started(self, wait: float) -> None:
+        """Con self._lock tomado"""
+        self._in_flight += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+
+    def _finished(self, elapsed: float, failed: bool) -> None:
+        """Con self._lock tomado"""
+        self._in_flight -= 1
+        self._run_total += elapsed
+        self._run_max = max(self._run_max, elapsed)
+        if failed:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot de métricas del pool"""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "kind": "process" if self.processes else "thread",
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "waiting": self._waiting,
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._wait_total / finished * 1000, 2) if finished else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 2),
+                "avg_run_ms": round(self._run_total / finished * 1000, 2) if finished else 0.0,
+                "max_run_ms": round(self._run_max * 1000, 2),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+# ── Pools globales ────────────────────────────────────────────
+
+# Llamadas síncronas a MySQL (SyncSessionAdapter)
+db_executor = BoundedExecutor(
+    "db",
+    max_workers=settings.EXECUTOR_DB_WORKERS,
+    max_queue=settings.EXECUTOR_DB_QUEUE,
+)
+
+# bcrypt (CPU)
+hash_executor = BoundedExecutor(
+    "hash",
+    max_workers=settings.EXECUTOR_HASH_WORKERS,
+    max_queue=settings.EXECUTOR_HASH_QUEUE,
+    processes=settings.EXECUTOR_HASH_PROCESSES,
+)
+
+# Subidas / borrados en Cloudinary (red)
+upload_executor = BoundedExecutor(
+    "upload",
+    max_workers=settings.EXECUTOR_UPLOAD_WORKERS,
+    max_queue=settings.EXECUTOR_UPLOAD_QUEUE,
+)
+
+_executors = (db_executor, hash_executor, upload_executor)
+
+
+def executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Métricas de todos los pools"""
+    return {executor.name: executor.stats() for executor in _executors}
+
+
+def shutdown_executors() -> None:
+    """Detener los pools (shutdown)"""
+    for executor in _executors:
+        executor.shutdown(wait=False)
+    logger.info("🧵 Executors detenidos")
@@ -8,6 +8,7 @@ from typing import Optional
 from fastapi import UploadFile
 
 from core.database.config import settings
+from core.executors import upload_executor
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +55,9 @@ class ImageUploadService:
             )
 
         try:
-            # Subir a Cloudinary
-            result = cloudinary.uploader.upload(
+            # Subir a Cloudinary (pool "upload", fuera del event loop)
+            result = await upload_executor.run(
+                cloudinary.uploader.upload,
                 content,
                 folder=f"amura/{folder}",
                 resource_type="image",
@@ -82,7 +84,7 @@ class ImageUploadService:
     async def delete_image(public_id: str) -> bool:
         """Elimina una imagen de Cloudinary."""
         try:
-            result = cloudinary.uploader.destroy(public_id)
+            result = await upload_executor.run(cloudinary.uploader.destroy, public_id)
             success = result.get("result") == "ok"
             if success:
                 logger.info(f"🗑️ Image deleted: {public_id}")
@@ -0,0 +1,256 @@
+"""
+Outbox de notificaciones para Amura API
+
+Los casos de uso (like, comentario, follow, pin nuevo) solo añaden una fila a
+`notification_outbox` dentro de su unidad de trabajo: si la transacción se
+deshace, la notificación no existe, y el request no espera a ningún
+WebSocket. El NotificationDispatcher, arrancado en el lifespan, toma lotes
+de la tabla, resuelve pins y usuarios con un IN por tabla y entrega con
+`core.notifications`.
+
+El dispatcher se despierta tras cada commit del propio proceso y, además,
+consulta la tabla cada NOTIFICATION_DISPATCH_INTERVAL_SECONDS (eventos de
+otras réplicas o de antes de un reinicio). Las filas se reclaman con
+`FOR UPDATE SKIP LOCKED`, así varias réplicas no entregan la misma.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+
+from core.connection import DBSession, session_scope
+from core.database.config import settings
+from core.database.models import NotificationOutboxModel, PinModel, UserModel
+from core.notifications import (
+    notify_new_comment,
+    notify_new_follow,
+    notify_new_like,
+    notify_new_pin,
+)
+from core.unit_of_work import UnitOfWork, after_commit
+
+logger = logging.getLogger(__name__)
+
+EVENT_NEW_LIKE = "new_like"
+EVENT_NEW_COMMENT = "new_comment"
+EVENT_NEW_FOLLOW = "new_follow"
+EVENT_NEW_PIN = "new_pin"
+
+
+class NotificationOutbox:
+    """Escritura en el outbox con la sesión del caso de uso (sin commit)"""
+
+    def __init__(self, db: DBSession):
+        self._db = db
+
+    async def add(
+        self,
+        event_type: str,
+        actor_id: str,
+        recipient_id: Optional[str] = None,
+        pin_id: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """`recipient_id=None` con `pin_id` → se notifica al dueño del pin"""
+        if recipient_id is not None and recipient_id == actor_id:
+            return  # No notificar acciones sobre lo propio
+        self._db.add(NotificationOutboxModel(
+            event_type=event_type,
+            actor_id=actor_id,
+            recipient_id=recipient_id,
+            pin_id=pin_id,
+            payload=payload,
+        ))
+        await self._db.flush()
+        after_commit(self._db, _wake_dispatcher)
+
+
+async def _wake_dispatcher() -> None:
+    notification_dispatcher.wake()
+
+
+class NotificationDispatcher:
+    """Entrega por lotes de lo que haya en el outbox"""
+
+    def __init__(
+        self,
+        interval_seconds: float = settings.NOTIFICATION_DISPATCH_INTERVAL_SECONDS,
+        batch_size: int = settings.NOTIFICATION_DISPATCH_BATCH_SIZE,
+    ):
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+        # ── Métricas ──────────────────────────────────────────
+        self._batches = 0
+        self._delivered = 0
+        self._skipped = 0
+        self._failures = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._loop(), name="notification-dispatcher")
+        logger.info("📨 Notification dispatcher started")
+
+    async def stop(self) -> None:
+        """Detener tras vaciar lo pendiente"""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info("⏹️ Notification dispatcher stopped")
+
+    def wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                # Lote lleno → probablemente queda más; seguir sin esperar
+                while await self.dispatch_once() == self._batch_size:
+                    pass
+                self._last_error = None
+            except Exception as e:
+                self._failures += 1
+                self._last_error = str(e)
+                logger.exception(f"❌ Notification dispatch failed: {e}")
+            if self._stopping:
+                return
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_once(self) -> int:
+        """Reclamar, entregar y borrar un lote. Devuelve cuántas filas tomó"""
+        async with session_scope() as db, UnitOfWork(db):
+            rows = list(await db.scalars(
+                select(NotificationOutboxModel)
+                .order_by(NotificationOutboxModel.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            ))
+            if not rows:
+                return 0
+
+            pin_ids = {row.pin_id for row in rows if row.pin_id}
+            pins = {}
+            if pin_ids:
+                result = await db.execute(
+                    select(PinModel.id, PinModel.user_id, PinModel.title)
+                    .where(PinModel.id.in_(pin_ids))
+                )
+                pins = {pin.id: pin for pin in result}
+
+            actor_ids = {row.actor_id for row in rows}
+            result = await db.execute(
+                select(UserModel.id, UserModel.username).where(UserModel.id.in_(actor_ids))
+            )
+            usernames = {user.id: user.username for user in result}
+
+            for row in rows:
+                try:
+                    if await self._deliver(db, row, pins, usernames):
+                        self._delivered += 1
+                    else:
+                        self._skipped += 1
+                except Exception as e:
+                    # Entrega best-effort, como antes: no reintentar
+                    self._failures += 1
+                    logger.warning(f"⚠️ No se pudo enviar notificación {row.event_type}: {e}")
+
+            await db.execute(
+                delete(NotificationOutboxModel)
+                .where(NotificationOutboxModel.id.in_([row.id for row in rows]))
+            )
+        self._batches += 1
+        return len(rows)
+
+    @staticmethod
+    async def _deliver(
+        db: DBSession, row: NotificationOutboxModel, pins: dict, usernames: dict
+    ) -> bool:
+        actor_username = usernames.get(row.actor_id, "alguien")
+
+        if row.event_type == EVENT_NEW_FOLLOW:
+            await notify_new_follow(
+                followed_user_id=row.recipient_id,
+                follower_username=actor_username,
+                follower_id=row.actor_id,
+            )
+            return True
+
+        pin = pins.get(row.pin_id)
+        if pin is None:
+            return False  # Pin borrado antes de entregar
+
+        if row.event_type == EVENT_NEW_PIN:
+            from internal.follows.infrastructure.adapters.mysql_follow_repository import (
+                MySQLFollowRepository,
+            )
+
+            # Seguidores desde la cache; se cruzan con la presencia
+            # (Backplane.nodes_of) y solo se envía a los conectados
+            follower_ids = await MySQLFollowRepository(db).get_follower_ids(row.actor_id)
+            sent = await notify_new_pin(
+                user_id=row.actor_id,
+                username=actor_username,
+                pin_id=row.pin_id,
+                pin_title=pin.title or "",
+                follower_ids=follower_ids,
+            )
+            return sent > 0  # Ningún seguidor conectado → omitida, no entregada
+
+        recipient_id = row.recipient_id or pin.user_id
+        if recipient_id == row.actor_id:
+            return False  # No notificar si es tu propio pin
+
+        if row.event_type == EVENT_NEW_LIKE:
+            await notify_new_like(
+                pin_owner_id=recipient_id,
+                liker_username=actor_username,
+                pin_id=row.pin_id,
+                pin_title=pin.title or "tu pin",
+            )
+        elif row.event_type == EVENT_NEW_COMMENT:
+            await notify_new_comment(
+                pin_owner_id=recipient_id,
+                commenter_username=actor_username,
+                pin_id=row.pin_id,
+                pin_title=pin.title or "tu pin",
+                comment_text=(row.payload or {}).get("text", ""),
+            )
+        else:
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval_seconds": self._interval_seconds,
+            "batch_size": self._batch_size,
+            "batches": self._batches,
+            "delivered": self._delivered,
+            "skipped": self._skipped,
+            "failures": self._failures,
+            "last_error": self._last_error,
+        }
+
+
+# Instancia global
+notification_dispatcher = NotificationDispatcher()
@@ -1,55 +1,214 @@
 """
 Servicio de notificaciones en tiempo real
+
+Las notificaciones personales (like, comentario, follow) pasan por un
+coalescedor: la primera de cada (destinatario, tipo, pin) sale al momento y
+abre una ventana; las que lleguen mientras sigue abierta se agrupan en un
+solo mensaje ("Ana y otras 37 personas le dieron like a tu pin") que se
+envía en el siguiente flush. Un pin viral produce así un frame por ventana
+en lugar de uno por like.
+
+La ventana es por proceso: con varias réplicas cada una agrupa lo que
+entrega su dispatcher.
 """
 import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.background import PeriodicTask, register_task
+from core.database.config import settings
 from core.websocket import manager
 
 logger = logging.getLogger(__name__)
 
+# Nombres de actores que viajan en un resumen
+_DIGEST_ACTORS = 3
+
+_DIGEST_TEXT = {
+    "new_like": "❤️ {actors} le dieron like a tu pin '{pin_title}'",
+    "new_comment": "💬 {actors} comentaron en tu pin '{pin_title}'",
+    "new_follow": "👤 {actors} te empezaron a seguir",
+}
+
+_Key = Tuple[str, str, Optional[str]]  # (destinatario, tipo, pin_id)
+
+
+def _actors_text(first: str, count: int) -> str:
+    others = count - 1
+    if others == 0:
+        return first
+    if others == 1:
+        return f"{first} y otra persona"
+    return f"{first} y otras {others} personas"
+
+
+class _Digest:
+    """Eventos del mismo tipo acumulados durante una ventana"""
+
+    def __init__(self):
+        self.count = 0
+        self.actors: List[str] = []
+        self.latest: dict = {}
+
+    def add(self, message: dict, actor: str) -> None:
+        self.count += 1
+        self.latest = message
+        if len(self.actors) < _DIGEST_ACTORS and actor not in self.actors:
+            self.actors.append(actor)
+
+    def build(self) -> dict:
+        if self.count == 1:
+            return self.latest
+        text = _DIGEST_TEXT.get(self.latest.get("type"))
+        message = {**self.latest, "count": self.count, "actors": self.actors}
+        if text:
+            message["message"] = text.format(
+                actors=_actors_text(self.actors[0], self.count),
+                pin_title=self.latest.get("pin_title", ""),
+            )
+        return message
+
+
+class NotificationCoalescer:
+    """Agrupa notificaciones personales por (destinatario, tipo, pin)"""
+
+    def __init__(
+        self,
+        send: Callable[[str, dict], Awaitable[None]],
+        window_seconds: float = settings.NOTIFICATION_COALESCE_WINDOW_SECONDS,
+        max_batch: int = settings.NOTIFICATION_COALESCE_MAX_BATCH,
+    ):
+        self._send = send
+        self.window_seconds = window_seconds
+        self._max_batch = max_batch
+        # Ventanas abiertas: None = ya se envió y no hay nada pendiente
+        self._open: Dict[_Key, Optional[_Digest]] = {}
+
+        # ── Métricas ──────────────────────────────────────────
+        self._events = 0
+        self._frames = 0
+        self._merged = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    async def publish(self, recipient_id: str, message: dict, actor: str) -> None:
+        self._events += 1
+        if not self.enabled:
+            await self._emit(recipient_id, message)
+            return
+
+        key = (recipient_id, message.get("type"), message.get("pin_id"))
+        if key not in self._open:
+            self._open[key] = None
+            await self._emit(recipient_id, message)
+            return
+
+        digest = self._open[key]
+        if digest is None:
+            digest = self._open[key] = _Digest()
+        digest.add(message, actor)
+        self._merged += 1
+        if digest.count >= self._max_batch:
+            self._open[key] = None
+            await self._emit(recipient_id, digest.build())
+
+    async def flush(self) -> None:
+        """
+        Enviar los resúmenes pendientes. Las ventanas que tenían algo siguen
+        abiertas un intervalo más; las que no, se cierran.
+
+        Cada envío cede el event loop y mientras tanto puede llegar un
+        `publish`: el dict se modifica en su sitio y una clave solo se toca
+        si sigue teniendo el mismo resumen que se leyó.
+        """
+        for key, digest in list(self._open.items()):
+            current = self._open.get(key)
+            if current is None:
+                # Sin novedades en la ventana (o max_batch ya envió el resumen)
+                if digest is None:
+                    self._open.pop(key, None)
+                continue
+            if current is not digest:
+                continue  # Resumen abierto durante este flush: va en el próximo
+            self._open[key] = None
+            try:
+                await self._emit(key[0], digest.build())
+            except Exception as e:
+                logger.warning(f"⚠️ No se pudo enviar resumen de notificaciones: {e}")
+
+    async def _emit(self, recipient_id: str, message: dict) -> None:
+        self._frames += 1
+        await self._send(recipient_id, message)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window_seconds": self.window_seconds,
+            "max_batch": self._max_batch,
+            "open_windows": len(self._open),
+            "events": self._events,
+            "frames": self._frames,
+            "merged": self._merged,
+        }
+
+
+notification_coalescer = NotificationCoalescer(
+    lambda user_id, message: manager.send_personal(user_id, message)
+)
+
+if notification_coalescer.enabled:
+    register_task(PeriodicTask(
+        "notification_coalesce_flush",
+        notification_coalescer.window_seconds,
+        notification_coalescer.flush,
+    ))
+
 
 async def notify_new_like(pin_owner_id: str, liker_username: str, pin_id: str, pin_title: str):
     """Notifica al dueño del pin que alguien le dio like"""
-    await manager.send_personal(pin_owner_id, {
+    await notification_coalescer.publish(pin_owner_id, {
         "type": "new_like",
         "pin_id": pin_id,
         "pin_title": pin_title,
         "liker_username": liker_username,
         "message": f"❤️ {liker_username} le dio like a tu pin '{pin_title}'",
-    })
+    }, actor=liker_username)
 
 
 async def notify_new_follow(followed_user_id: str, follower_username: str, follower_id: str):
     """Notifica al usuario que alguien lo empezó a seguir"""
-    await manager.send_personal(followed_user_id, {
+    await notification_coalescer.publish(followed_user_id, {
         "type": "new_follow",
         "follower_id": follower_id,
         "follower_username": follower_username,
         "message": f"👤 {follower_username} te empezó a seguir",
-    })
+    }, actor=follower_username)
 
 
 async def notify_new_comment(pin_owner_id: str, commenter_username: str, pin_id: str, pin_title: str, comment_text: str):
     """Notifica al dueño del pin que alguien comentó"""
-    await manager.send_personal(pin_owner_id, {
+    await notification_coalescer.publish(pin_owner_id, {
         "type": "new_comment",
         "pin_id": pin_id,
         "pin_title": pin_title,
         "commenter_username": commenter_username,
         "comment_preview": comment_text[:100],
         "message": f"💬 {commenter_username} comentó en tu pin '{pin_title}'",
-    })
+    }, actor=commenter_username)
 
 
-async def notify_new_pin(user_id: str, username: str, pin_id: str, pin_title: str):
-    """Notifica a todos que alguien publicó un nuevo pin"""
-    await manager.broadcast(
-        {
-            "type": "new_pin",
-            "user_id": user_id,
-            "username": username,
-            "pin_id": pin_id,
-            "pin_title": pin_title,
-            "message": f"📌 {username} publicó un nuevo pin: '{pin_title}'",
-        },
-        exclude_user=user_id,
-    )
\ No newline at end of file
+async def notify_new_pin(
+    user_id: str, username: str, pin_id: str, pin_title: str, follower_ids: Iterable[str]
+) -> int:
+    """
+    Notifica a los seguidores conectados que alguien publicó un nuevo pin
+    (no a todo el que esté online). Devuelve a cuántos se envió
+    """
+    return await manager.send_to_users(follower_ids, {
+        "type": "new_pin",
+        "user_id": user_id,
+        "username": username,
+        "pin_id": pin_id,
+        "pin_title": pin_title,
+        "message": f"📌 {username} publicó un nuevo pin: '{pin_title}'",
+    })
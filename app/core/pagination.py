@@ -0,0 +1,91 @@
+"""
+Paginación por cursor (keyset) para Amura API
+
+El cursor es un token opaco con el (created_at, id) del último elemento de
+la página. La siguiente página pide las filas estrictamente "anteriores" a
+ese par, así que no se saltan ni repiten elementos aunque entren filas
+nuevas mientras el usuario hace scroll, y el coste no crece con la
+profundidad (a diferencia de OFFSET).
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Annotated, Callable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Query
+from sqlalchemy import and_, or_
+
+T = TypeVar("T")
+
+# Parámetro de query común a todos los listados
+CursorParam = Annotated[
+    Optional[str],
+    Query(description="Cursor opaco (`next_cursor` de la página anterior). Si se envía, se ignora `offset`"),
+]
+
+
+class InvalidCursorError(Exception):
+    """
+    Cursor manipulado o de otra versión. No hereda de ValueError para que
+    las rutas que mapean ValueError a 404 no lo capturen; main.py → 400.
+    """
+    pass
+
+
+class Cursor(NamedTuple):
+    created_at: datetime
+    id: str
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """Codificar (created_at, id) como token opaco URL-safe"""
+    payload = json.dumps({"t": created_at.isoformat(), "i": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decodificar un token; lanza ValueError si no es válido"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return Cursor(datetime.fromisoformat(data["t"]), str(data["i"]))
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise InvalidCursorError("Cursor de paginación inválido")
+
+
+def parse_cursor(token: Optional[str]) -> Optional[Cursor]:
+    return decode_cursor(token) if token else None
+
+
+def keyset_page(query, created_col, id_col, limit: int, offset: int = 0, cursor: Optional[Cursor] = None):
+    """
+    Ordenar por (created_at, id) descendente y aplicar el cursor si viene;
+    si no, OFFSET clásico (compatibilidad).
+    """
+    query = query.order_by(created_col.desc(), id_col.desc())
+    if cursor is not None:
+        query = query.where(
+            or_(
+                created_col < cursor.created_at,
+                and_(created_col == cursor.created_at, id_col < cursor.id),
+            )
+        )
+    elif offset:
+        query = query.offset(offset)
+    return query.limit(limit)
+
+
+def split_page(
+    items: Sequence[T],
+    limit: int,
+    key: Callable[[T], Tuple[datetime, str]] = lambda item: (item.created_at, item.id),
+) -> Tuple[List[T], bool, Optional[str]]:
+    """
+    Recibe hasta `limit + 1` elementos y devuelve
+    (página, has_more, next_cursor).
+    """
+    page = list(items[:limit])
+    has_more = len(items) > limit
+    next_cursor = encode_cursor(*key(page[-1])) if has_more and page else None
+    return page, has_more, next_cursor
@@ -0,0 +1,40 @@
+"""
+Cliente Redis compartido de Amura API
+
+Un solo pool de conexiones por proceso para cache, contadores y pub/sub.
+Se crea la primera vez que se pide (redis es dependencia opcional si
+ningún componente está configurado con backend "redis").
+"""
+import logging
+
+from core.database.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """Obtener (o crear) el cliente redis.asyncio del proceso"""
+    global _client
+    if _client is None:
+        import redis.asyncio as redis
+
+        _client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD or None,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Cerrar el pool (shutdown)"""
+    global _client
+    if _client is not None:
+        try:
+            await _client.aclose()
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing Redis client: {e}")
+        _client = None
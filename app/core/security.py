@@ -1,13 +1,18 @@
 """
 Utilidades de seguridad de Amura API
 """
+from typing import Optional, Tuple
+
 import bcrypt
 
+from core.database.config import settings
+from core.executors import hash_executor
+
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """Hashear una contraseña (trunca a 72 bytes por límite de bcrypt)"""
     password_bytes = password[:72].encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds or settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -16,4 +21,48 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verificar una contraseña contra su hash"""
     password_bytes = plain_password[:72].encode("utf-8")
     hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
\ No newline at end of file
+    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def password_needs_rehash(hashed_password: str, rounds: Optional[int] = None) -> bool:
+    """True si el hash ($2b$<coste>$...) no usa el coste configurado"""
+    try:
+        cost = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != (rounds or settings.BCRYPT_ROUNDS)
+
+
+def verify_and_rehash(
+    plain_password: str, hashed_password: str, rounds: Optional[int] = None
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verificar y, si el coste cambió, generar el hash nuevo en la misma
+    llamada. Devuelve (válida, hash nuevo o None)
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if password_needs_rehash(hashed_password, rounds):
+        return True, hash_password(plain_password, rounds)
+    return True, None
+
+# ── Versiones async (pool "hash" de core.executors) ───────────
+# El coste se pasa explícito: los workers son procesos aparte
+
+async def hash_password_async(password: str) -> str:
+    """hash_password sin bloquear el event loop"""
+    return await hash_executor.run(hash_password, password, settings.BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password sin bloquear el event loop"""
+    return await hash_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_rehash_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """verify_and_rehash sin bloquear el event loop (un solo viaje al pool)"""
+    return await hash_executor.run(
+        verify_and_rehash, plain_password, hashed_password, settings.BCRYPT_ROUNDS
+    )
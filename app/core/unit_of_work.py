@@ -0,0 +1,74 @@
+"""
+Unidad de trabajo (transacción por caso de uso) para Amura API
+
+Los repositorios solo hacen flush: es el caso de uso quien abre la unidad de
+trabajo y decide cuándo se confirma, así "agregar pin a tablero" o "crear
+comentario" son un único commit aunque toquen varias tablas y contadores, y
+si algo falla a mitad se deshace todo.
+
+    async with self._uow:
+        await self._repo.add_pin(board_pin)
+        await self._repo.increment_pins_count(board_id)
+
+Los efectos que solo deben verse si el commit sale bien (invalidar o parchear
+caches) se registran con `after_commit` y corren justo después; si hay
+rollback se descartan.
+"""
+import logging
+from typing import Any, Awaitable, Callable
+
+from core.connection import DBSession
+
+logger = logging.getLogger(__name__)
+
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(db: DBSession, callback: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    """Ejecutar `callback(*args)` cuando se confirme la transacción de `db`"""
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append((callback, args))
+
+
+class UnitOfWork:
+    """
+    Context manager async sobre la sesión compartida del request. Se puede
+    anidar (un caso de uso que llama a otro): solo el nivel exterior hace
+    commit o rollback.
+    """
+
+    def __init__(self, db: DBSession):
+        self._db = db
+        self._depth = 0
+
+    @property
+    def session(self) -> DBSession:
+        return self._db
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    async def commit(self) -> None:
+        await self._db.commit()
+        callbacks = self._db.info.pop(_AFTER_COMMIT_KEY, [])
+        for callback, args in callbacks:
+            try:
+                await callback(*args)
+            except Exception as e:
+                # Los datos ya están confirmados; una cache que no se pudo
+                # invalidar caduca sola por TTL
+                logger.warning(f"⚠️ after_commit callback failed: {e}")
+
+    async def rollback(self) -> None:
+        self._db.info.pop(_AFTER_COMMIT_KEY, None)
+        await self._db.rollback()
+
@@ -1,103 +1,359 @@
 """
 WebSocket Manager - Maneja conexiones en tiempo real
+
+Cada nodo guarda solo sus conexiones; los envíos pasan por el backplane
+(core.backplane) para llegar al usuario esté en el nodo que esté, y el
+backplane llama a `_deliver` en cada nodo implicado.
+
+Cada conexión tiene una cola de salida acotada que vacía su propia tarea
+escritora: enviar es encolar (sin await), así un cliente lento no retrasa
+a los demás. Con la cola llena se aplica WS_SLOW_CONSUMER_POLICY:
+- "drop_oldest": descartar el mensaje más antiguo
+- "drop_newest": descartar el mensaje nuevo
+- "coalesce":    sustituir un mensaje pendiente del mismo tipo y pin
+                 (si no hay, como drop_oldest)
+- "disconnect":  cerrar la conexión (el cliente reconecta)
+
+Cómo se empaqueta cada frame (uno por evento, o por lotes en JSON/msgpack)
+lo decide el WireProtocol negociado al conectar (core.websocket_protocol).
 """
-from typing import Dict, List, Set
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
 from fastapi import WebSocket
+import asyncio
 import json
 import logging
 
+from core.backplane import Backplane, Envelope, backplane as default_backplane
+from core.database.config import settings
+from core.websocket_protocol import LEGACY_PROTOCOL, WireProtocol
+
 logger = logging.getLogger(__name__)
 
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "drop_newest", "coalesce", "disconnect")
+
+# Cierre por cliente lento: "Try Again Later"
+_CLOSE_SLOW_CONSUMER = 1013
+
+
+def _coalesce_key(message: dict) -> Optional[tuple]:
+    """Mensajes con la misma clave se pueden sustituir por el más reciente"""
+    if message.get("pin_id") is None:
+        return None
+    return message.get("type"), message["pin_id"]
+
+
+class _Connection:
+    """Socket + cola de salida acotada, vaciada por su propia tarea escritora"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        metrics: Dict[str, int],
+        max_queue: int = settings.WS_SEND_QUEUE_SIZE,
+        policy: str = settings.WS_SLOW_CONSUMER_POLICY,
+        send_timeout: float = settings.WS_SEND_TIMEOUT_SECONDS,
+        protocol: Optional[WireProtocol] = None,
+    ):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.websocket = websocket
+        self.user_id = user_id
+        self._metrics = metrics
+        self._max_queue = max_queue
+        self._policy = policy
+        self._send_timeout = send_timeout
+        self._protocol = protocol or LEGACY_PROTOCOL
+        self._queue: Deque[dict] = deque()
+        self._ready = asyncio.Event()
+        self._close_code: Optional[int] = None
+        self.closed = False
+        self._writer = asyncio.create_task(self._write_loop(), name=f"ws-writer:{user_id}")
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def send(self, message: dict) -> bool:
+        """Encolar sin esperar. False si el mensaje se descartó"""
+        if self.closed:
+            return False
+        if len(self._queue) >= self._max_queue:
+            if self._policy == "disconnect":
+                self._metrics["slow_disconnects"] += 1
+                self._shutdown(_CLOSE_SLOW_CONSUMER)
+                return False
+            if self._policy == "drop_newest":
+                self._metrics["dropped"] += 1
+                return False
+            if self._policy == "coalesce" and self._coalesce(message):
+                return True
+            self._queue.popleft()
+            self._metrics["dropped"] += 1
+        self._queue.append(message)
+        self._metrics["enqueued"] += 1
+        self._ready.set()
+        return True
+
+    def _coalesce(self, message: dict) -> bool:
+        key = _coalesce_key(message)
+        if key is None:
+            return False
+        for i, queued in enumerate(self._queue):
+            if _coalesce_key(queued) == key:
+                self._queue[i] = message
+                self._metrics["coalesced"] += 1
+                return True
+        return False
+
+    def _shutdown(self, close_code: Optional[int] = None) -> None:
+        self.closed = True
+        self._close_code = close_code
+        self._queue.clear()
+        self._ready.set()
+
+    async def _write_loop(self) -> None:
+        while not self.closed:
+            if not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            batch = await self._next_batch()
+            if self.closed:
+                break
+            try:
+                await asyncio.wait_for(
+                    self._protocol.send(self.websocket, batch), timeout=self._send_timeout
+                )
+                self._metrics["sent"] += len(batch)
+                self._metrics["frames"] += 1
+            except asyncio.TimeoutError:
+                self._metrics["slow_disconnects"] += 1
+                self._shutdown(_CLOSE_SLOW_CONSUMER)
+            except Exception:
+                # Socket muerto: el loop de recepción hará el disconnect
+                self._metrics["send_errors"] += 1
+                self._shutdown()
+        if self._close_code is not None:
+            logger.warning(f"🐢 Closing slow WebSocket consumer: user={self.user_id}")
+            try:
+                await self.websocket.close(code=self._close_code, reason="Slow consumer")
+            except Exception:
+                pass
+
+    async def _next_batch(self) -> List[dict]:
+        """Siguiente frame: un mensaje, o en modo batch lo que llegue en la ventana"""
+        batch = [self._queue.popleft()]
+        protocol = self._protocol
+        if not protocol.batch:
+            return batch
+        if len(self._queue) < protocol.max_events - 1 and protocol.window_seconds > 0:
+            await asyncio.sleep(protocol.window_seconds)
+        while self._queue and len(batch) < protocol.max_events:
+            batch.append(self._queue.popleft())
+        return batch
+
+    async def aclose(self) -> None:
+        """Parar la tarea escritora (la conexión ya se cerró)"""
+        if not self.closed:
+            self._shutdown()
+        if not self._writer.done():
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
 
 class ConnectionManager:
     """Administra conexiones WebSocket activas"""
 
-    def __init__(self):
-        # user_id -> lista de conexiones (un usuario puede tener varias pestañas)
-        self._active_connections: Dict[str, List[WebSocket]] = {}
+    def __init__(self, backplane: Optional[Backplane] = None):
+        # user_id -> {websocket: conexión} (un usuario puede tener varias pestañas)
+        self._active_connections: Dict[str, Dict[WebSocket, _Connection]] = {}
         # Canales de suscripción: channel_name -> set de user_ids
         self._channels: Dict[str, Set[str]] = {}
+        # Índice inverso: user_id -> canales (desconectar no recorre todos)
+        self._user_channels: Dict[str, Set[str]] = {}
+        self._connection_count = 0
+        self._backplane = backplane if backplane is not None else default_backplane
+        self._backplane.set_handler(self._deliver)
+        self._backplane.set_local_users(self._active_connections.keys)
+        self._metrics: Dict[str, int] = {
+            "enqueued": 0,
+            "sent": 0,
+            "frames": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "slow_disconnects": 0,
+            "send_errors": 0,
+        }
 
-    async def connect(self, websocket: WebSocket, user_id: str) -> None:
-        """Acepta una conexión WebSocket"""
+    async def start(self) -> None:
+        await self._backplane.start()
+
+    async def stop(self) -> None:
+        await self._backplane.stop()
+
+    async def connect(
+        self, websocket: WebSocket, user_id: str, protocol: Optional[WireProtocol] = None
+    ) -> _Connection:
+        """
+        Acepta una conexión WebSocket. Lo que se envíe por ella debe pasar
+        por la conexión devuelta (`send`), nunca directo al socket
+        """
         await websocket.accept()
+        connection = _Connection(websocket, user_id, self._metrics, protocol=protocol)
         if user_id not in self._active_connections:
-            self._active_connections[user_id] = []
-        self._active_connections[user_id].append(websocket)
+            self._active_connections[user_id] = {}
+            await self._backplane.presence_add(user_id)
+        self._active_connections[user_id][websocket] = connection
+        self._connection_count += 1
         logger.info(f"🔌 WebSocket connected: user={user_id} | Total connections: {self._total_connections()}")
+        return connection
 
-    def disconnect(self, websocket: WebSocket, user_id: str) -> None:
+    async def disconnect(self, websocket: WebSocket, user_id: str) -> None:
         """Desconecta un WebSocket"""
-        if user_id in self._active_connections:
-            self._active_connections[user_id] = [
-                ws for ws in self._active_connections[user_id] if ws != websocket
-            ]
-            if not self._active_connections[user_id]:
-                del self._active_connections[user_id]
-                # Remover de todos los canales
-                for channel in list(self._channels.keys()):
-                    self._channels[channel].discard(user_id)
-                    if not self._channels[channel]:
-                        del self._channels[channel]
+        connections = self._active_connections.get(user_id)
+        connection = connections.pop(websocket, None) if connections is not None else None
+        if connection is not None:
+            self._connection_count -= 1
+            await connection.aclose()
+        if connections is not None and not connections:
+            del self._active_connections[user_id]
+            await self._backplane.presence_remove(user_id)
+            # Remover solo de sus canales
+            for channel in self._user_channels.pop(user_id, ()):
+                self._remove_from_channel(user_id, channel)
         logger.info(f"🔌 WebSocket disconnected: user={user_id} | Total connections: {self._total_connections()}")
 
-    def is_online(self, user_id: str) -> bool:
-        """Verifica si un usuario está conectado"""
-        return user_id in self._active_connections and len(self._active_connections[user_id]) > 0
+    async def is_online(self, user_id: str) -> bool:
+        """Verifica si un usuario está conectado (en cualquier nodo)"""
+        if self._active_connections.get(user_id):
+            return True
+        return await self._backplane.is_online(user_id)
+
+    async def get_online_users(self) -> List[str]:
+        """Retorna lista de user_ids conectados (en cualquier nodo)"""
+        return await self._backplane.online_users()
 
-    def get_online_users(self) -> List[str]:
-        """Retorna lista de user_ids conectados"""
-        return list(self._active_connections.keys())
+    def online_count(self) -> int:
+        """Número aproximado de usuarios conectados, sin consultar la presencia"""
+        return max(self._backplane.online_count(), len(self._active_connections))
 
     # ── Enviar mensajes ───────────────────────────────────────
 
     async def send_personal(self, user_id: str, message: dict) -> None:
         """Envía un mensaje a todas las conexiones de un usuario"""
-        if user_id in self._active_connections:
-            dead_connections = []
-            for ws in self._active_connections[user_id]:
-                try:
-                    await ws.send_json(message)
-                except Exception:
-                    dead_connections.append(ws)
-            # Limpiar conexiones muertas
-            for ws in dead_connections:
-                self._active_connections[user_id].remove(ws)
+        await self._backplane.publish_user(
+            user_id, {"op": "user", "user_id": user_id, "message": message}
+        )
+
+    async def send_to_users(self, user_ids: Iterable[str], message: dict) -> int:
+        """
+        Envía a los de `user_ids` que estén conectados: la lista se cruza con
+        la presencia y cada nodo recibe un solo mensaje con sus usuarios.
+        Devuelve a cuántos usuarios se envió
+        """
+        routes = await self._backplane.nodes_of(user_ids)
+        for node_id, node_users in routes.items():
+            await self._backplane.send_node(
+                node_id, {"op": "users", "user_ids": node_users, "message": message}
+            )
+        return sum(len(node_users) for node_users in routes.values())
 
     async def broadcast(self, message: dict, exclude_user: str = None) -> None:
         """Envía un mensaje a TODOS los usuarios conectados"""
-        for user_id in list(self._active_connections.keys()):
-            if user_id != exclude_user:
-                await self.send_personal(user_id, message)
+        await self._backplane.publish_all(
+            {"op": "broadcast", "message": message, "exclude_user": exclude_user}
+        )
 
     async def send_to_channel(self, channel: str, message: dict, exclude_user: str = None) -> None:
         """Envía un mensaje a todos los suscriptores de un canal"""
-        if channel in self._channels:
-            for user_id in self._channels[channel]:
+        await self._backplane.publish_all(
+            {"op": "channel", "channel": channel, "message": message, "exclude_user": exclude_user}
+        )
+
+    # ── Entrega local (llamada por el backplane) ──────────────
+
+    async def _deliver(self, envelope: Envelope) -> None:
+        """Solo encola: no espera a ningún socket"""
+        op = envelope.get("op")
+        message = envelope.get("message")
+        exclude_user = envelope.get("exclude_user")
+        if op == "user":
+            self._send_local(envelope["user_id"], message)
+        elif op == "users":
+            for user_id in envelope.get("user_ids", ()):
+                self._send_local(user_id, message)
+        elif op == "broadcast":
+            for user_id in list(self._active_connections.keys()):
+                if user_id != exclude_user:
+                    self._send_local(user_id, message)
+        elif op == "channel":
+            for user_id in list(self._channels.get(envelope.get("channel"), ())):
                 if user_id != exclude_user:
-                    await self.send_personal(user_id, message)
+                    self._send_local(user_id, message)
+
+    def _send_local(self, user_id: str, message: dict) -> None:
+        """Encola en las conexiones de `user_id` en este nodo"""
+        connections = self._active_connections.get(user_id)
+        if connections:
+            for connection in connections.values():
+                connection.send(message)
 
     # ── Canales / Suscripciones ───────────────────────────────
 
     def subscribe(self, user_id: str, channel: str) -> None:
         """Suscribe un usuario a un canal"""
-        if channel not in self._channels:
-            self._channels[channel] = set()
-        self._channels[channel].add(user_id)
-        logger.info(f"📡 User {user_id} subscribed to channel: {channel}")
+        self._channels.setdefault(channel, set()).add(user_id)
+        self._user_channels.setdefault(user_id, set()).add(channel)
+        logger.debug(f"📡 User {user_id} subscribed to channel: {channel}")
 
     def unsubscribe(self, user_id: str, channel: str) -> None:
         """Desuscribe un usuario de un canal"""
-        if channel in self._channels:
-            self._channels[channel].discard(user_id)
-            if not self._channels[channel]:
+        channels = self._user_channels.get(user_id)
+        if channels is not None:
+            channels.discard(channel)
+            if not channels:
+                del self._user_channels[user_id]
+        self._remove_from_channel(user_id, channel)
+
+    def _remove_from_channel(self, user_id: str, channel: str) -> None:
+        members = self._channels.get(channel)
+        if members is not None:
+            members.discard(user_id)
+            if not members:
                 del self._channels[channel]
 
     # ── Helpers ───────────────────────────────────────────────
 
     def _total_connections(self) -> int:
-        return sum(len(conns) for conns in self._active_connections.values())
+        return self._connection_count
+
+    def stats(self) -> Dict[str, Any]:
+        """Conexiones de este nodo, colas de salida y estado del backplane"""
+        depths = [
+            connection.depth
+            for connections in self._active_connections.values()
+            for connection in connections.values()
+        ]
+        return {
+            "local_users": len(self._active_connections),
+            "local_connections": len(depths),
+            "channels": len(self._channels),
+            "subscriptions": sum(len(c) for c in self._user_channels.values()),
+            "send_queues": {
+                "policy": settings.WS_SLOW_CONSUMER_POLICY,
+                "max_size": settings.WS_SEND_QUEUE_SIZE,
+                "queued": sum(depths),
+                "max_depth": max(depths, default=0),
+                **self._metrics,
+            },
+            "backplane": self._backplane.stats(),
+        }
 
 
 # Instancia global
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
@@ -0,0 +1,99 @@
+"""
+Protocolo de cable del WebSocket de Amura API
+
+El cliente lo elige al conectar, en la query string:
+
+    /ws?token=...                           un frame JSON por evento (por defecto)
+    /ws?token=...&batch=true                eventos agrupados por ventana:
+                                            {"type": "batch", "events": [...]}
+    /ws?token=...&batch=true&encoding=msgpack
+                                            lo mismo en frames binarios (msgpack)
+
+En los modos negociados el JSON se serializa con orjson si está instalado.
+Si el servidor no tiene msgpack se responde en JSON; el mensaje "connected"
+indica siempre el protocolo efectivo. Lo que envía el cliente sigue siendo
+JSON de texto en todos los modos.
+
+La compresión permessage-deflate la negocia uvicorn en el handshake
+(WS_PER_MESSAGE_DEFLATE) y se combina con cualquiera de los modos.
+"""
+import json
+from typing import Any, Dict, List
+
+from fastapi import WebSocket
+
+from core.database.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - opcional
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - opcional
+    msgpack = None
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+
+def available_encodings() -> List[str]:
+    return [ENCODING_JSON] + ([ENCODING_MSGPACK] if msgpack is not None else [])
+
+
+def _dumps_json(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class WireProtocol:
+    """Cómo se empaquetan los eventos de una conexión"""
+
+    def __init__(
+        self,
+        batch: bool = False,
+        encoding: str = ENCODING_JSON,
+        window_ms: int = settings.WS_BATCH_WINDOW_MS,
+        max_events: int = settings.WS_BATCH_MAX_EVENTS,
+    ):
+        self.batch = batch
+        self.encoding = encoding
+        self.window_seconds = window_ms / 1000
+        self.max_events = max(max_events, 1) if batch else 1
+
+    @property
+    def legacy(self) -> bool:
+        return not self.batch and self.encoding == ENCODING_JSON
+
+    @classmethod
+    def negotiate(cls, batch: bool = False, encoding: str = ENCODING_JSON) -> "WireProtocol":
+        """Lo pedido por el cliente, limitado a lo que soporta el servidor"""
+        encoding = (encoding or ENCODING_JSON).lower()
+        if encoding not in available_encodings():
+            encoding = ENCODING_JSON
+        return cls(batch=batch, encoding=encoding)
+
+    async def send(self, websocket: WebSocket, messages: List[dict]) -> None:
+        """Un solo frame con `messages` (uno si no hay batch)"""
+        if self.legacy:
+            await websocket.send_json(messages[0])
+            return
+        payload = {"type": "batch", "events": messages} if self.batch else messages[0]
+        if self.encoding == ENCODING_MSGPACK:
+            await websocket.send_bytes(msgpack.packb(payload, default=str))
+        else:
+            await websocket.send_text(_dumps_json(payload))
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "batch": self.batch,
+            "encoding": self.encoding,
+            "batch_window_ms": round(self.window_seconds * 1000) if self.batch else 0,
+            "available_encodings": available_encodings(),
+        }
+
+
+# Protocolo de las conexiones que no negocian nada
+LEGACY_PROTOCOL = WireProtocol()
@@ -7,6 +7,7 @@ import json
 import logging
 
 from core.websocket import manager
+from core.websocket_protocol import WireProtocol
 from internal.users.infrastructure.middlewares.auth_middleware import decode_access_token
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,8 @@ router = APIRouter(tags=["WebSocket"])
 async def websocket_endpoint(
     websocket: WebSocket,
     token: Optional[str] = Query(None),
+    batch: bool = Query(False),
+    encoding: str = Query("json"),
 ):
     """
     Conexión WebSocket principal.
@@ -25,6 +28,9 @@ async def websocket_endpoint(
     Conectar desde el cliente:
         ws://localhost:8000/ws?token=<JWT_TOKEN>
 
+    Protocolo opcional (ver core/websocket_protocol.py):
+        ws://localhost:8000/ws?token=<JWT_TOKEN>&batch=true&encoding=msgpack
+
     Mensajes que el cliente puede enviar:
         {"type": "subscribe", "channel": "pin:123"}
         {"type": "unsubscribe", "channel": "pin:123"}
@@ -35,7 +41,8 @@ async def websocket_endpoint(
         {"type": "notification", "event": "new_follow", "data": {...}}
         {"type": "notification", "event": "new_comment", "data": {...}}
         {"type": "pong"}
-        {"type": "connected", "user_id": "..."}
+        {"type": "connected", "user_id": "...", "protocol": {...}}
+        {"type": "batch", "events": [...]}   (solo con batch=true)
     """
     # ── Autenticación ─────────────────────────────────────────
     if not token:
@@ -53,14 +60,16 @@ async def websocket_endpoint(
         return
 
     # ── Conectar ──────────────────────────────────────────────
-    await manager.connect(websocket, user_id)
+    protocol = WireProtocol.negotiate(batch=batch, encoding=encoding)
+    connection = await manager.connect(websocket, user_id, protocol)
 
     try:
         # Confirmar conexión
-        await websocket.send_json({
+        connection.send({
             "type": "connected",
             "user_id": user_id,
-            "online_users": len(manager.get_online_users()),
+            "online_users": manager.online_count(),
+            "protocol": protocol.describe(),
         })
 
         # ── Loop de mensajes ──────────────────────────────────
@@ -72,13 +81,13 @@ async def websocket_endpoint(
                 msg_type = message.get("type", "")
 
                 if msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    connection.send({"type": "pong"})
 
                 elif msg_type == "subscribe":
                     channel = message.get("channel", "")
                     if channel:
                         manager.subscribe(user_id, channel)
-                        await websocket.send_json({
+                        connection.send({
                             "type": "subscribed",
                             "channel": channel,
                         })
@@ -87,26 +96,26 @@ async def websocket_endpoint(
                     channel = message.get("channel", "")
                     if channel:
                         manager.unsubscribe(user_id, channel)
-                        await websocket.send_json({
+                        connection.send({
                             "type": "unsubscribed",
                             "channel": channel,
                         })
 
                 else:
-                    await websocket.send_json({
+                    connection.send({
                         "type": "error",
                         "message": f"Unknown message type: {msg_type}",
                     })
 
             except json.JSONDecodeError:
-                await websocket.send_json({
+                connection.send({
                     "type": "error",
                     "message": "Invalid JSON format",
                 })
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, user_id)
+        await manager.disconnect(websocket, user_id)
         logger.info(f"👋 WebSocket disconnected: user={user_id}")
     except Exception as e:
-        manager.disconnect(websocket, user_id)
+        await manager.disconnect(websocket, user_id)
         logger.error(f"❌ WebSocket error for user={user_id}: {e}")
\ No newline at end of file
@@ -116,6 +116,7 @@ class BoardPinListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class CollaboratorListResponse(BaseModel):
@@ -4,11 +4,13 @@ Caso de uso: Agregar colaborador a un tablero
 from datetime import datetime, timezone
 from internal.boards.domain.entities.board import BoardCollaborator
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class AddCollaboratorUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -49,4 +51,5 @@ class AddCollaboratorUseCase:
             created_at=now,
         )
 
-        return await self._repo.add_collaborator(collaborator)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.add_collaborator(collaborator)
\ No newline at end of file
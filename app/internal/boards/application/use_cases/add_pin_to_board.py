@@ -4,11 +4,13 @@ Caso de uso: Agregar un pin a un tablero
 from datetime import datetime, timezone
 from internal.boards.domain.entities.board import BoardPin
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class AddPinToBoardUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -42,12 +44,12 @@ class AddPinToBoardUseCase:
             created_at=now,
         )
 
-        result = await self._repo.add_pin(board_pin)
-
-        # Incrementar contador y actualizar portada si es el primero
-        await self._repo.increment_pins_count(board_id)
-        if board.pins_count == 0:
-            # TODO: obtener image_url del pin para la portada
-            pass
+        # Agregar el pin e incrementar el contador en un solo commit
+        async with self._uow:
+            result = await self._repo.add_pin(board_pin)
+            await self._repo.increment_pins_count(board_id)
+            if board.pins_count == 0:
+                # TODO: obtener image_url del pin para la portada
+                pass
 
         return result
\ No newline at end of file
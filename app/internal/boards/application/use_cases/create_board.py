@@ -4,11 +4,13 @@ Caso de uso: Crear un tablero
 from datetime import datetime, timezone
 from internal.boards.domain.entities.board import Board
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class CreateBoardUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -33,4 +35,5 @@ class CreateBoardUseCase:
             updated_at=now,
         )
 
-        return await self._repo.create(board)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.create(board)
\ No newline at end of file
@@ -2,11 +2,13 @@
 Caso de uso: Eliminar un tablero
 """
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class DeleteBoardUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(self, board_id: str, user_id: str) -> bool:
         board = await self._repo.get_by_id(board_id)
@@ -16,4 +18,5 @@ class DeleteBoardUseCase:
         if board.user_id != user_id:
             raise PermissionError("No tienes permiso para eliminar este tablero")
 
-        return await self._repo.delete(board_id)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.delete(board_id)
\ No newline at end of file
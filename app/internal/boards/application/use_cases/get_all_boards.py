@@ -4,20 +4,14 @@ Caso de uso: Obtener todos los boards públicos
 from typing import List, Optional
 from internal.boards.domain.entities.board import BoardSummary
 from internal.boards.domain.repositories.board_repository import BoardRepository
-from internal.users.domain.repositories.user_repository import UserRepository
 
 class GetAllBoardsUseCase:
     """
     Obtiene todos los boards públicos del sistema
     """
     
-    def __init__(
-        self,
-        board_repository: BoardRepository,
-        user_repository: UserRepository
-    ):
+    def __init__(self, board_repository: BoardRepository):
         self.board_repository = board_repository
-        self.user_repository = user_repository
     
     async def execute(
         self,
@@ -36,29 +30,9 @@ class GetAllBoardsUseCase:
         Returns:
             Lista de BoardSummary con información básica
         """
-        # Obtener boards públicos
-        boards = await self.board_repository.get_all(
-            user_id=user_id,
+        # Boards públicos con el username del dueño (una sola consulta)
+        return await self.board_repository.get_all_with_owners(
             limit=limit,
-            offset=offset
+            offset=offset,
+            user_id=user_id
         )
-        
-        # Convertir a BoardSummary con información del usuario
-        result = []
-        for board in boards:
-            # Obtener información del usuario dueño del board
-            user = await self.user_repository.get_by_id(board.user_id)
-            
-            if user:
-                result.append(BoardSummary(
-                    id=board.id,
-                    user_id=board.user_id,
-                    user_username=user.username,
-                    name=board.name,
-                    cover_image_url=board.cover_image_url,
-                    pins_count=board.pins_count,
-                    is_private=board.is_private,
-                    created_at=board.created_at
-                ))
-        
-        return result
\ No newline at end of file
@@ -1,7 +1,9 @@
 """
 Caso de uso: Obtener pins de un tablero
 """
-from typing import List
+from typing import List, Optional
+
+from core.pagination import parse_cursor, split_page
 from internal.boards.domain.entities.board import BoardPin
 from internal.boards.domain.repositories.board_repository import BoardRepository
 
@@ -16,6 +18,7 @@ class GetBoardPinsUseCase:
         requesting_user_id: str = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
         board = await self._repo.get_by_id(board_id)
         if not board:
@@ -29,13 +32,15 @@ class GetBoardPinsUseCase:
                     raise PermissionError("No tienes acceso a este tablero")
 
         pins: List[BoardPin] = await self._repo.get_board_pins(
-            board_id=board_id, limit=limit, offset=offset
+            board_id=board_id, limit=limit + 1, offset=offset, cursor=parse_cursor(cursor)
         )
+        pins, has_more, next_cursor = split_page(pins, limit)
 
         return {
             "pins": pins,
             "total": board.pins_count,
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < board.pins_count,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
@@ -2,11 +2,13 @@
 Caso de uso: Quitar colaborador de un tablero
 """
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class RemoveCollaboratorUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -26,4 +28,5 @@ class RemoveCollaboratorUseCase:
         if not is_collab:
             raise ValueError("El usuario no es colaborador de este tablero")
 
-        return await self._repo.remove_collaborator(board_id, collaborator_user_id)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.remove_collaborator(board_id, collaborator_user_id)
\ No newline at end of file
@@ -2,11 +2,13 @@
 Caso de uso: Quitar un pin de un tablero
 """
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class RemovePinFromBoardUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -29,9 +31,10 @@ class RemovePinFromBoardUseCase:
         if not exists:
             raise ValueError("El pin no está en este tablero")
 
-        result = await self._repo.remove_pin(board_id, pin_id)
-
-        if result:
-            await self._repo.decrement_pins_count(board_id)
+        # Quitar el pin y bajar el contador en un solo commit
+        async with self._uow:
+            result = await self._repo.remove_pin(board_id, pin_id)
+            if result:
+                await self._repo.decrement_pins_count(board_id)
 
         return result
\ No newline at end of file
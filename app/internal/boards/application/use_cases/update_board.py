@@ -4,11 +4,13 @@ Caso de uso: Actualizar un tablero
 from datetime import datetime, timezone
 from internal.boards.domain.entities.board import Board
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class UpdateBoardUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -28,4 +30,5 @@ class UpdateBoardUseCase:
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         updated_board = board.model_copy(update=update_data)
-        return await self._repo.update(updated_board)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.update(updated_board)
\ No newline at end of file
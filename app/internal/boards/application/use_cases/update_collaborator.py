@@ -3,11 +3,13 @@ Caso de uso: Actualizar permisos de un colaborador
 """
 from internal.boards.domain.entities.board import BoardCollaborator
 from internal.boards.domain.repositories.board_repository import BoardRepository
+from core.unit_of_work import UnitOfWork
 
 
 class UpdateCollaboratorUseCase:
-    def __init__(self, board_repository: BoardRepository):
+    def __init__(self, board_repository: BoardRepository, uow: UnitOfWork):
         self._repo = board_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -29,10 +31,11 @@ class UpdateCollaboratorUseCase:
         if not is_collab:
             raise ValueError("El usuario no es colaborador de este tablero")
 
-        return await self._repo.update_collaborator_permissions(
-            board_id=board_id,
-            user_id=collaborator_user_id,
-            can_edit=can_edit,
-            can_add_pins=can_add_pins,
-            can_remove_pins=can_remove_pins,
-        )
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.update_collaborator_permissions(
+                board_id=board_id,
+                user_id=collaborator_user_id,
+                can_edit=can_edit,
+                can_add_pins=can_add_pins,
+                can_remove_pins=can_remove_pins,
+            )
\ No newline at end of file
@@ -3,7 +3,9 @@ Interface del repositorio de Boards (Port)
 """
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from internal.boards.domain.entities.board import Board, BoardPin, BoardCollaborator
+
+from core.pagination import Cursor
+from internal.boards.domain.entities.board import Board, BoardPin, BoardCollaborator, BoardSummary
 
 class BoardRepository(ABC):
     """Repositorio de Boards - Interface"""
@@ -70,7 +72,8 @@ class BoardRepository(ABC):
         self, 
         board_id: str, 
         limit: int = 20, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[BoardPin]:
         """Obtener pins de un tablero"""
         pass
@@ -147,4 +150,17 @@ class BoardRepository(ABC):
         Returns:
             Lista de boards públicos ordenados por más recientes
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_all_with_owners(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        user_id: Optional[str] = None
+    ) -> List[BoardSummary]:
+        """
+        Igual que get_all pero con el username del dueño resuelto en la
+        misma consulta (JOIN), para listados
+        """
+        pass
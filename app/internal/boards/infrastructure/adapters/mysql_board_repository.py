@@ -5,17 +5,20 @@ from typing import Optional, List
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, update, delete, func
 
-from internal.boards.domain.entities.board import Board, BoardPin, BoardCollaborator
+from core.connection import DBSession
+from core.pagination import Cursor, keyset_page
+
+from internal.boards.domain.entities.board import Board, BoardPin, BoardCollaborator, BoardSummary
 from internal.boards.domain.repositories.board_repository import BoardRepository
-from core.database.models import BoardModel, BoardPinModel, BoardCollaboratorModel
+from core.database.models import BoardModel, BoardPinModel, BoardCollaboratorModel, UserModel
+from internal.users.infrastructure.adapters.user_counters import add_to_user_counter
 
 
 class MySQLBoardRepository(BoardRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self._db = db
 
     # ── Mapeo ─────────────────────────────────────────────────
@@ -75,33 +78,33 @@ class MySQLBoardRepository(BoardRepository):
             updated_at=now,
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await add_to_user_counter(self._db, board.user_id, "boards_count", 1)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_board_entity(model)
 
     async def get_by_id(self, board_id: str) -> Optional[Board]:
-        model = self._db.query(BoardModel).filter(
-            BoardModel.id == board_id
-        ).first()
+        model = await self._db.scalar(
+            select(BoardModel).where(BoardModel.id == board_id)
+        )
         return self._to_board_entity(model) if model else None
 
     async def get_by_user(
         self, user_id: str, limit: int = 20, offset: int = 0
     ) -> List[Board]:
-        models = (
-            self._db.query(BoardModel)
-            .filter(BoardModel.user_id == user_id)
+        models = await self._db.scalars(
+            select(BoardModel)
+            .where(BoardModel.user_id == user_id)
             .order_by(BoardModel.updated_at.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_board_entity(m) for m in models]
+        return [self._to_board_entity(m) for m in models.all()]
 
     async def update(self, board: Board) -> Board:
-        model = self._db.query(BoardModel).filter(
-            BoardModel.id == board.id
-        ).first()
+        model = await self._db.scalar(
+            select(BoardModel).where(BoardModel.id == board.id)
+        )
         if model:
             model.name = board.name
             model.description = board.description
@@ -109,45 +112,56 @@ class MySQLBoardRepository(BoardRepository):
             model.is_private = board.is_private
             model.is_collaborative = board.is_collaborative
             model.updated_at = datetime.now(timezone.utc)
-            self._db.commit()
-            self._db.refresh(model)
+            await self._db.flush()
+            await self._db.refresh(model)
             return self._to_board_entity(model)
         return board
 
     async def delete(self, board_id: str) -> bool:
+        owner_id = await self._db.scalar(
+            select(BoardModel.user_id).where(BoardModel.id == board_id)
+        )
         # Eliminar colaboradores
-        self._db.query(BoardCollaboratorModel).filter(
-            BoardCollaboratorModel.board_id == board_id
-        ).delete()
+        await self._db.execute(
+            delete(BoardCollaboratorModel).where(
+                BoardCollaboratorModel.board_id == board_id
+            )
+        )
         # Eliminar board_pins
-        self._db.query(BoardPinModel).filter(
-            BoardPinModel.board_id == board_id
-        ).delete()
+        await self._db.execute(
+            delete(BoardPinModel).where(BoardPinModel.board_id == board_id)
+        )
         # Eliminar board
-        deleted = self._db.query(BoardModel).filter(
-            BoardModel.id == board_id
-        ).delete()
-        self._db.commit()
-        return deleted > 0
+        result = await self._db.execute(
+            delete(BoardModel).where(BoardModel.id == board_id)
+        )
+        if result.rowcount > 0:
+            await add_to_user_counter(self._db, owner_id, "boards_count", -1)
+        return result.rowcount > 0
 
     async def increment_pins_count(self, board_id: str) -> None:
-        self._db.query(BoardModel).filter(
-            BoardModel.id == board_id
-        ).update({BoardModel.pins_count: BoardModel.pins_count + 1})
-        self._db.commit()
+        await self._db.execute(
+            update(BoardModel)
+            .where(BoardModel.id == board_id)
+            .values(pins_count=BoardModel.pins_count + 1)
+        )
 
     async def decrement_pins_count(self, board_id: str) -> None:
-        self._db.query(BoardModel).filter(
-            BoardModel.id == board_id,
-            BoardModel.pins_count > 0
-        ).update({BoardModel.pins_count: BoardModel.pins_count - 1})
-        self._db.commit()
+        await self._db.execute(
+            update(BoardModel)
+            .where(
+                BoardModel.id == board_id,
+                BoardModel.pins_count > 0
+            )
+            .values(pins_count=BoardModel.pins_count - 1)
+        )
 
     async def update_cover_image(self, board_id: str, image_url: str) -> None:
-        self._db.query(BoardModel).filter(
-            BoardModel.id == board_id
-        ).update({BoardModel.cover_image_url: image_url})
-        self._db.commit()
+        await self._db.execute(
+            update(BoardModel)
+            .where(BoardModel.id == board_id)
+            .values(cover_image_url=image_url)
+        )
 
     # ── BOARD PINS ────────────────────────────────────────────
 
@@ -161,61 +175,59 @@ class MySQLBoardRepository(BoardRepository):
             created_at=datetime.now(timezone.utc),
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_board_pin_entity(model)
 
     async def remove_pin(self, board_id: str, pin_id: str) -> bool:
-        deleted = self._db.query(BoardPinModel).filter(
-            BoardPinModel.board_id == board_id,
-            BoardPinModel.pin_id == pin_id,
-        ).delete()
-        self._db.commit()
-        return deleted > 0
+        result = await self._db.execute(
+            delete(BoardPinModel).where(
+                BoardPinModel.board_id == board_id,
+                BoardPinModel.pin_id == pin_id,
+            )
+        )
+        return result.rowcount > 0
 
     async def get_board_pins(
-        self, board_id: str, limit: int = 20, offset: int = 0
+        self,
+        board_id: str,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[BoardPin]:
-        models = (
-            self._db.query(BoardPinModel)
-            .filter(BoardPinModel.board_id == board_id)
-            .order_by(BoardPinModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        query = select(BoardPinModel).where(BoardPinModel.board_id == board_id)
+        models = await self._db.scalars(
+            keyset_page(query, BoardPinModel.created_at, BoardPinModel.id, limit, offset, cursor)
         )
-        return [self._to_board_pin_entity(m) for m in models]
+        return [self._to_board_pin_entity(m) for m in models.all()]
 
     async def is_pin_in_board(self, board_id: str, pin_id: str) -> bool:
-        count = (
-            self._db.query(func.count(BoardPinModel.id))
-            .filter(
+        count = await self._db.scalar(
+            select(func.count(BoardPinModel.id))
+            .where(
                 BoardPinModel.board_id == board_id,
                 BoardPinModel.pin_id == pin_id,
             )
-            .scalar()
         )
         return (count or 0) > 0
 
     async def get_boards_with_pin(self, pin_id: str, user_id: str) -> List[Board]:
-        board_ids = (
-            self._db.query(BoardPinModel.board_id)
-            .filter(BoardPinModel.pin_id == pin_id)
-            .all()
+        board_ids = await self._db.scalars(
+            select(BoardPinModel.board_id)
+            .where(BoardPinModel.pin_id == pin_id)
         )
-        ids = [row[0] for row in board_ids]
+        ids = list(board_ids.all())
         if not ids:
             return []
 
-        models = (
-            self._db.query(BoardModel)
-            .filter(
+        models = await self._db.scalars(
+            select(BoardModel)
+            .where(
                 BoardModel.id.in_(ids),
                 BoardModel.user_id == user_id,
             )
-            .all()
         )
-        return [self._to_board_entity(m) for m in models]
+        return [self._to_board_entity(m) for m in models.all()]
 
     # ── COLLABORATORS ─────────────────────────────────────────
 
@@ -230,34 +242,33 @@ class MySQLBoardRepository(BoardRepository):
             created_at=datetime.now(timezone.utc),
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_collaborator_entity(model)
 
     async def remove_collaborator(self, board_id: str, user_id: str) -> bool:
-        deleted = self._db.query(BoardCollaboratorModel).filter(
-            BoardCollaboratorModel.board_id == board_id,
-            BoardCollaboratorModel.user_id == user_id,
-        ).delete()
-        self._db.commit()
-        return deleted > 0
+        result = await self._db.execute(
+            delete(BoardCollaboratorModel).where(
+                BoardCollaboratorModel.board_id == board_id,
+                BoardCollaboratorModel.user_id == user_id,
+            )
+        )
+        return result.rowcount > 0
 
     async def get_collaborators(self, board_id: str) -> List[BoardCollaborator]:
-        models = (
-            self._db.query(BoardCollaboratorModel)
-            .filter(BoardCollaboratorModel.board_id == board_id)
-            .all()
+        models = await self._db.scalars(
+            select(BoardCollaboratorModel)
+            .where(BoardCollaboratorModel.board_id == board_id)
         )
-        return [self._to_collaborator_entity(m) for m in models]
+        return [self._to_collaborator_entity(m) for m in models.all()]
 
     async def is_collaborator(self, board_id: str, user_id: str) -> bool:
-        count = (
-            self._db.query(func.count(BoardCollaboratorModel.id))
-            .filter(
+        count = await self._db.scalar(
+            select(func.count(BoardCollaboratorModel.id))
+            .where(
                 BoardCollaboratorModel.board_id == board_id,
                 BoardCollaboratorModel.user_id == user_id,
             )
-            .scalar()
         )
         return (count or 0) > 0
 
@@ -269,10 +280,12 @@ class MySQLBoardRepository(BoardRepository):
         can_add_pins: bool,
         can_remove_pins: bool,
     ) -> BoardCollaborator:
-        model = self._db.query(BoardCollaboratorModel).filter(
-            BoardCollaboratorModel.board_id == board_id,
-            BoardCollaboratorModel.user_id == user_id,
-        ).first()
+        model = await self._db.scalar(
+            select(BoardCollaboratorModel).where(
+                BoardCollaboratorModel.board_id == board_id,
+                BoardCollaboratorModel.user_id == user_id,
+            )
+        )
 
         if not model:
             raise ValueError("Colaborador no encontrado")
@@ -280,31 +293,29 @@ class MySQLBoardRepository(BoardRepository):
         model.can_edit = can_edit
         model.can_add_pins = can_add_pins
         model.can_remove_pins = can_remove_pins
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_collaborator_entity(model)
 
     async def get_collaborative_boards(
         self, user_id: str, limit: int = 20, offset: int = 0
     ) -> List[Board]:
-        board_ids = (
-            self._db.query(BoardCollaboratorModel.board_id)
-            .filter(BoardCollaboratorModel.user_id == user_id)
+        board_ids = await self._db.scalars(
+            select(BoardCollaboratorModel.board_id)
+            .where(BoardCollaboratorModel.user_id == user_id)
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        ids = [row[0] for row in board_ids]
+        ids = list(board_ids.all())
         if not ids:
             return []
 
-        models = (
-            self._db.query(BoardModel)
-            .filter(BoardModel.id.in_(ids))
+        models = await self._db.scalars(
+            select(BoardModel)
+            .where(BoardModel.id.in_(ids))
             .order_by(BoardModel.updated_at.desc())
-            .all()
         )
-        return [self._to_board_entity(m) for m in models]
+        return [self._to_board_entity(m) for m in models.all()]
     
     
     async def get_all(
@@ -319,20 +330,56 @@ class MySQLBoardRepository(BoardRepository):
         Si se proporciona user_id, filtra por ese usuario.
         Si no, devuelve todos los boards públicos del sistema.
         """
-        query = self._db.query(BoardModel).filter(
+        query = select(BoardModel).where(
             BoardModel.is_private == False  # Solo boards públicos
         )
         
         # Filtro opcional por usuario
         if user_id:
-            query = query.filter(BoardModel.user_id == user_id)
+            query = query.where(BoardModel.user_id == user_id)
         
-        models = (
+        models = await self._db.scalars(
             query
             .order_by(BoardModel.updated_at.desc())  # Más recientes primero
             .offset(offset)
             .limit(limit)
-            .all()
         )
         
-        return [self._to_board_entity(m) for m in models]
\ No newline at end of file
+        return [self._to_board_entity(m) for m in models.all()]
+
+    async def get_all_with_owners(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        user_id: Optional[str] = None
+    ) -> List[BoardSummary]:
+        """Boards públicos + username del dueño en una sola consulta"""
+        query = (
+            select(BoardModel, UserModel.username)
+            .join(UserModel, BoardModel.user_id == UserModel.id)
+            .where(BoardModel.is_private == False)
+        )
+
+        if user_id:
+            query = query.where(BoardModel.user_id == user_id)
+
+        result = await self._db.execute(
+            query
+            .order_by(BoardModel.updated_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+        return [
+            BoardSummary(
+                id=board.id,
+                user_id=board.user_id,
+                user_username=username,
+                name=board.name,
+                cover_image_url=board.cover_image_url,
+                pins_count=board.pins_count or 0,
+                is_private=board.is_private or False,
+                created_at=board.created_at,
+            )
+            for board, username in result.all()
+        ]
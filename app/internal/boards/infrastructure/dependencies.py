@@ -2,12 +2,11 @@
 Inyección de dependencias para Boards
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
 from app.internal.boards.application.use_cases.get_all_boards import GetAllBoardsUseCase
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.unit_of_work import UnitOfWork
 from internal.boards.infrastructure.adapters.mysql_board_repository import MySQLBoardRepository
-from internal.users.infrastructure.adapters.mysql_user_repository import MySQLUserRepository  # ✅ AGREGAR
 from internal.boards.infrastructure.http.board_controller import BoardController
 from internal.boards.application.use_cases.create_board import CreateBoardUseCase
 from internal.boards.application.use_cases.get_board import GetBoardUseCase
@@ -22,21 +21,21 @@ from internal.boards.application.use_cases.remove_collaborator import RemoveColl
 from internal.boards.application.use_cases.update_collaborator import UpdateCollaboratorUseCase
 
 
-def get_board_controller(db: Session = Depends(get_db)) -> BoardController:
+def get_board_controller(db: DBSession = Depends(get_db)) -> BoardController:
     board_repo = MySQLBoardRepository(db)
-    user_repo = MySQLUserRepository(db)  # ✅ CREAR INSTANCIA DE USER REPO
+    uow = UnitOfWork(db)
 
     return BoardController(
-        create_uc=CreateBoardUseCase(board_repo),
-        get_all_boards_uc=GetAllBoardsUseCase(board_repo, user_repo),  # ✅ PASAR 2 PARÁMETROS
+        create_uc=CreateBoardUseCase(board_repo, uow),
+        get_all_boards_uc=GetAllBoardsUseCase(board_repo),
         get_uc=GetBoardUseCase(board_repo),
         get_user_boards_uc=GetUserBoardsUseCase(board_repo),
-        update_uc=UpdateBoardUseCase(board_repo),
-        delete_uc=DeleteBoardUseCase(board_repo),
-        add_pin_uc=AddPinToBoardUseCase(board_repo),
-        remove_pin_uc=RemovePinFromBoardUseCase(board_repo),
+        update_uc=UpdateBoardUseCase(board_repo, uow),
+        delete_uc=DeleteBoardUseCase(board_repo, uow),
+        add_pin_uc=AddPinToBoardUseCase(board_repo, uow),
+        remove_pin_uc=RemovePinFromBoardUseCase(board_repo, uow),
         get_pins_uc=GetBoardPinsUseCase(board_repo),
-        add_collab_uc=AddCollaboratorUseCase(board_repo),
-        remove_collab_uc=RemoveCollaboratorUseCase(board_repo),
-        update_collab_uc=UpdateCollaboratorUseCase(board_repo),
+        add_collab_uc=AddCollaboratorUseCase(board_repo, uow),
+        remove_collab_uc=RemoveCollaboratorUseCase(board_repo, uow),
+        update_collab_uc=UpdateCollaboratorUseCase(board_repo, uow),
     )
@@ -183,13 +183,19 @@ class BoardController:
         return MessageResponse(message="Pin removido del tablero")
 
     async def get_board_pins(
-        self, board_id: str, user_id: str = None, limit: int = 20, offset: int = 0
+        self,
+        board_id: str,
+        user_id: str = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str = None,
     ) -> BoardPinListResponse:
         result = await self._get_pins_uc.execute(
             board_id=board_id,
             requesting_user_id=user_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
         return BoardPinListResponse(
             pins=result["pins"],
@@ -197,6 +203,7 @@ class BoardController:
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     # ── Collaborators ─────────────────────────────────────────
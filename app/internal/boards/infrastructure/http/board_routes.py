@@ -4,6 +4,7 @@ Rutas HTTP de Boards
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated, Optional, List
 
+from core.pagination import CursorParam
 from internal.boards.domain.entities.board import (
     BoardResponse,
     BoardPin,
@@ -204,11 +205,14 @@ async def get_board_pins(
     board_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: BoardController = Depends(get_board_controller),
     user_id: str = Depends(get_current_user_id),
 ):
     try:
-        return await controller.get_board_pins(board_id, user_id=user_id, limit=limit, offset=offset)
+        return await controller.get_board_pins(
+            board_id, user_id=user_id, limit=limit, offset=offset, cursor=cursor
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except PermissionError as e:
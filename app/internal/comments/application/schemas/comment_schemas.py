@@ -71,6 +71,7 @@ class CommentListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class RepliesListResponse(BaseModel):
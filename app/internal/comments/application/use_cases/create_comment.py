@@ -3,11 +3,20 @@ Caso de uso: Crear un comentario
 """
 from internal.comments.domain.entities.comment import Comment
 from internal.comments.domain.repositories.comment_repository import CommentRepository
+from core.notification_outbox import EVENT_NEW_COMMENT, NotificationOutbox
+from core.unit_of_work import UnitOfWork
 
 
 class CreateCommentUseCase:
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(
+        self,
+        comment_repository: CommentRepository,
+        uow: UnitOfWork,
+        outbox: NotificationOutbox,
+    ):
         self._repo = comment_repository
+        self._uow = uow
+        self._outbox = outbox
 
     async def execute(
         self,
@@ -39,5 +48,12 @@ class CreateCommentUseCase:
             updated_at=now,
         )
 
-        created = await self._repo.create(comment)
+        async with self._uow:
+            created = await self._repo.create(comment)
+            await self._outbox.add(
+                EVENT_NEW_COMMENT,
+                actor_id=user_id,
+                pin_id=pin_id,
+                payload={"text": text[:100]},
+            )
         return created
\ No newline at end of file
@@ -2,11 +2,13 @@
 Caso de uso: Eliminar un comentario
 """
 from internal.comments.domain.repositories.comment_repository import CommentRepository
+from core.unit_of_work import UnitOfWork
 
 
 class DeleteCommentUseCase:
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(self, comment_repository: CommentRepository, uow: UnitOfWork):
         self._repo = comment_repository
+        self._uow = uow
 
     async def execute(self, comment_id: str, user_id: str) -> bool:
         comment = await self._repo.get_by_id(comment_id)
@@ -16,4 +18,5 @@ class DeleteCommentUseCase:
         if comment.user_id != user_id:
             raise PermissionError("No tienes permiso para eliminar este comentario")
 
-        return await self._repo.delete(comment_id)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.delete(comment_id)
\ No newline at end of file
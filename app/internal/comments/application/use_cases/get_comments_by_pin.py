@@ -1,7 +1,9 @@
 """
 Caso de uso: Obtener comentarios de un pin
 """
-from typing import List
+from typing import List, Optional
+
+from core.pagination import parse_cursor, split_page
 from internal.comments.domain.entities.comment import Comment
 from internal.comments.domain.repositories.comment_repository import CommentRepository
 
@@ -15,14 +17,17 @@ class GetCommentsByPinUseCase:
         pin_id: str,
         limit: int = 50,
         offset: int = 0,
-        parent_only: bool = True
+        parent_only: bool = True,
+        cursor: Optional[str] = None,
     ) -> dict:
         comments: List[Comment] = await self._repo.get_by_pin(
             pin_id=pin_id,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
-            parent_only=parent_only
+            parent_only=parent_only,
+            cursor=parse_cursor(cursor),
         )
+        comments, has_more, next_cursor = split_page(comments, limit)
         total = await self._repo.count_by_pin(pin_id)
 
         return {
@@ -30,5 +35,6 @@ class GetCommentsByPinUseCase:
             "total": total,
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < total
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
@@ -4,11 +4,13 @@ Caso de uso: Actualizar un comentario
 from datetime import datetime, timezone
 from internal.comments.domain.entities.comment import Comment
 from internal.comments.domain.repositories.comment_repository import CommentRepository
+from core.unit_of_work import UnitOfWork
 
 
 class UpdateCommentUseCase:
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(self, comment_repository: CommentRepository, uow: UnitOfWork):
         self._repo = comment_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -29,5 +31,6 @@ class UpdateCommentUseCase:
             "updated_at": datetime.now(timezone.utc),
         })
 
-        result = await self._repo.update(updated_comment)
+        async with self._uow:
+            result = await self._repo.update(updated_comment)
         return result
\ No newline at end of file
@@ -3,6 +3,8 @@ Interface del repositorio de Comments (Port)
 """
 from abc import ABC, abstractmethod
 from typing import Optional, List
+
+from core.pagination import Cursor
 from internal.comments.domain.entities.comment import Comment
 
 class CommentRepository(ABC):
@@ -24,7 +26,8 @@ class CommentRepository(ABC):
         pin_id: str, 
         limit: int = 50, 
         offset: int = 0,
-        parent_only: bool = True
+        parent_only: bool = True,
+        cursor: Optional[Cursor] = None
     ) -> List[Comment]:
         """
         Obtener comentarios de un pin
@@ -34,6 +37,7 @@ class CommentRepository(ABC):
             limit: Límite de resultados
             offset: Offset para paginación
             parent_only: Si True, solo devuelve comentarios padre (no respuestas)
+            cursor: Cursor keyset; si viene, se ignora offset
         """
         pass
     
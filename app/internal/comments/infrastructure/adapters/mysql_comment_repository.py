@@ -5,8 +5,10 @@ from typing import Optional, List
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, update, delete, func
+
+from core.connection import DBSession
+from core.pagination import Cursor, keyset_page
 
 from internal.comments.domain.entities.comment import Comment
 from internal.comments.domain.repositories.comment_repository import CommentRepository
@@ -15,7 +17,7 @@ from core.database.models import CommentModel
 
 class MySQLCommentRepository(CommentRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self._db = db
 
     # ── Mapeo ─────────────────────────────────────────────────
@@ -48,14 +50,14 @@ class MySQLCommentRepository(CommentRepository):
             updated_at=now,
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_entity(model)
 
     async def get_by_id(self, comment_id: str) -> Optional[Comment]:
-        model = self._db.query(CommentModel).filter(
-            CommentModel.id == comment_id
-        ).first()
+        model = await self._db.scalar(
+            select(CommentModel).where(CommentModel.id == comment_id)
+        )
         return self._to_entity(model) if model else None
 
     async def get_by_pin(
@@ -64,101 +66,102 @@ class MySQLCommentRepository(CommentRepository):
         limit: int = 50,
         offset: int = 0,
         parent_only: bool = True,
+        cursor: Optional[Cursor] = None,
     ) -> List[Comment]:
-        query = self._db.query(CommentModel).filter(
+        query = select(CommentModel).where(
             CommentModel.pin_id == pin_id
         )
         if parent_only:
-            query = query.filter(CommentModel.parent_comment_id.is_(None))
+            query = query.where(CommentModel.parent_comment_id.is_(None))
 
-        models = (
-            query
-            .order_by(CommentModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        models = await self._db.scalars(
+            keyset_page(query, CommentModel.created_at, CommentModel.id, limit, offset, cursor)
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def get_replies(
         self, comment_id: str, limit: int = 20, offset: int = 0
     ) -> List[Comment]:
-        models = (
-            self._db.query(CommentModel)
-            .filter(CommentModel.parent_comment_id == comment_id)
+        models = await self._db.scalars(
+            select(CommentModel)
+            .where(CommentModel.parent_comment_id == comment_id)
             .order_by(CommentModel.created_at.asc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def update(self, comment: Comment) -> Comment:
-        model = self._db.query(CommentModel).filter(
-            CommentModel.id == comment.id
-        ).first()
+        model = await self._db.scalar(
+            select(CommentModel).where(CommentModel.id == comment.id)
+        )
         if model:
             model.text = comment.text
             model.likes_count = comment.likes_count
             model.updated_at = datetime.now(timezone.utc)
-            self._db.commit()
-            self._db.refresh(model)
+            await self._db.flush()
+            await self._db.refresh(model)
             return self._to_entity(model)
         return comment
 
     async def delete(self, comment_id: str) -> bool:
         # Eliminar respuestas hijas primero
-        self._db.query(CommentModel).filter(
-            CommentModel.parent_comment_id == comment_id
-        ).delete()
+        await self._db.execute(
+            delete(CommentModel).where(
+                CommentModel.parent_comment_id == comment_id
+            )
+        )
 
         # Eliminar el comentario
-        deleted = self._db.query(CommentModel).filter(
-            CommentModel.id == comment_id
-        ).delete()
-
-        self._db.commit()
-        return deleted > 0
+        result = await self._db.execute(
+            delete(CommentModel).where(CommentModel.id == comment_id)
+        )
+        return result.rowcount > 0
 
     async def count_by_pin(self, pin_id: str) -> int:
         return (
-            self._db.query(func.count(CommentModel.id))
-            .filter(
-                CommentModel.pin_id == pin_id,
-                CommentModel.parent_comment_id.is_(None)
+            await self._db.scalar(
+                select(func.count(CommentModel.id))
+                .where(
+                    CommentModel.pin_id == pin_id,
+                    CommentModel.parent_comment_id.is_(None)
+                )
             )
-            .scalar()
         ) or 0
 
     async def count_replies(self, comment_id: str) -> int:
         return (
-            self._db.query(func.count(CommentModel.id))
-            .filter(CommentModel.parent_comment_id == comment_id)
-            .scalar()
+            await self._db.scalar(
+                select(func.count(CommentModel.id))
+                .where(CommentModel.parent_comment_id == comment_id)
+            )
         ) or 0
 
     async def increment_likes(self, comment_id: str) -> None:
-        self._db.query(CommentModel).filter(
-            CommentModel.id == comment_id
-        ).update({CommentModel.likes_count: CommentModel.likes_count + 1})
-        self._db.commit()
+        await self._db.execute(
+            update(CommentModel)
+            .where(CommentModel.id == comment_id)
+            .values(likes_count=CommentModel.likes_count + 1)
+        )
 
     async def decrement_likes(self, comment_id: str) -> None:
-        self._db.query(CommentModel).filter(
-            CommentModel.id == comment_id,
-            CommentModel.likes_count > 0
-        ).update({CommentModel.likes_count: CommentModel.likes_count - 1})
-        self._db.commit()
+        await self._db.execute(
+            update(CommentModel)
+            .where(
+                CommentModel.id == comment_id,
+                CommentModel.likes_count > 0
+            )
+            .values(likes_count=CommentModel.likes_count - 1)
+        )
 
     async def get_by_user(
         self, user_id: str, limit: int = 50, offset: int = 0
     ) -> List[Comment]:
-        models = (
-            self._db.query(CommentModel)
-            .filter(CommentModel.user_id == user_id)
+        models = await self._db.scalars(
+            select(CommentModel)
+            .where(CommentModel.user_id == user_id)
             .order_by(CommentModel.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
\ No newline at end of file
+        return [self._to_entity(m) for m in models.all()]
\ No newline at end of file
@@ -2,9 +2,10 @@
 Inyección de dependencias para Comments
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.notification_outbox import NotificationOutbox
+from core.unit_of_work import UnitOfWork
 from internal.comments.infrastructure.adapters.mysql_comment_repository import MySQLCommentRepository
 from internal.comments.infrastructure.http.comment_controller import CommentController
 from internal.comments.application.use_cases.create_comment import CreateCommentUseCase
@@ -13,17 +14,23 @@ from internal.comments.application.use_cases.get_replies import GetRepliesUseCas
 from internal.comments.application.use_cases.update_comment import UpdateCommentUseCase
 from internal.comments.application.use_cases.delete_comment import DeleteCommentUseCase
 from internal.comments.application.use_cases.like_comment import LikeCommentUseCase
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.infrastructure.dependencies import get_user_summary_loader
 
 
-def get_comment_controller(db: Session = Depends(get_db)) -> CommentController:
+def get_comment_controller(
+    db: DBSession = Depends(get_db),
+    user_loader: UserSummaryLoader = Depends(get_user_summary_loader),
+) -> CommentController:
     repo = MySQLCommentRepository(db)
+    uow = UnitOfWork(db)
 
     return CommentController(
-        create_uc=CreateCommentUseCase(repo),
+        create_uc=CreateCommentUseCase(repo, uow, NotificationOutbox(db)),
         get_by_pin_uc=GetCommentsByPinUseCase(repo),
         get_replies_uc=GetRepliesUseCase(repo),
-        update_uc=UpdateCommentUseCase(repo),
-        delete_uc=DeleteCommentUseCase(repo),
-        like_uc=LikeCommentUseCase(repo),
-        db_session=db,
+        update_uc=UpdateCommentUseCase(repo, uow),
+        delete_uc=DeleteCommentUseCase(repo, uow),
+        like_uc=LikeCommentUseCase(repo, uow),
+        user_loader=user_loader,
     )
\ No newline at end of file
@@ -2,6 +2,7 @@
 Controlador HTTP de Comments
 """
 import logging
+from typing import Optional
 
 from internal.comments.application.use_cases.create_comment import CreateCommentUseCase
 from internal.comments.application.use_cases.get_comments_by_pin import GetCommentsByPinUseCase
@@ -18,7 +19,8 @@ from internal.comments.application.schemas.comment_schemas import (
     RepliesListResponse,
     MessageResponse,
 )
-from core.notifications import notify_new_comment
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.domain.entities.user import UserSummary
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,7 @@ class CommentController:
         update_uc: UpdateCommentUseCase,
         delete_uc: DeleteCommentUseCase,
         like_uc: LikeCommentUseCase,
-        db_session=None,
+        user_loader: UserSummaryLoader,
     ):
         self._create_uc = create_uc
         self._get_by_pin_uc = get_by_pin_uc
@@ -40,23 +42,24 @@ class CommentController:
         self._update_uc = update_uc
         self._delete_uc = delete_uc
         self._like_uc = like_uc
-        self._db = db_session
+        self._users = user_loader
 
     @staticmethod
     def _to_response(
         comment: Comment,
         current_user_id: str = None,
         replies_count: int = 0,
+        author: Optional[UserSummary] = None,
     ) -> CommentResponse:
         is_owner = (current_user_id == comment.user_id) if current_user_id else False
         return CommentResponse(
             id=comment.id,
             pin_id=comment.pin_id,
             user_id=comment.user_id,
-            user_username="",
-            user_full_name="",
-            user_avatar_url=None,
-            user_is_verified=False,
+            user_username=author.username if author else "",
+            user_full_name=author.full_name if author else "",
+            user_avatar_url=author.avatar_url if author else None,
+            user_is_verified=author.is_verified if author else False,
             text=comment.text,
             parent_comment_id=comment.parent_comment_id,
             likes_count=comment.likes_count,
@@ -78,50 +81,31 @@ class CommentController:
             parent_comment_id=body.parent_comment_id,
         )
 
-        try:
-            await self._send_comment_notification(user_id, body.pin_id, body.text)
-        except Exception as e:
-            logger.warning(f"No se pudo enviar notificacion de comment: {e}")
-
-        return self._to_response(comment, current_user_id=user_id)
-
-    async def _send_comment_notification(self, commenter_id: str, pin_id: str, text: str):
-        if not self._db:
-            return
-
-        from core.database.models import PinModel, UserModel
-
-        pin = self._db.query(PinModel).filter(PinModel.id == pin_id).first()
-        if not pin or pin.user_id == commenter_id:
-            return
-
-        commenter = self._db.query(UserModel).filter(UserModel.id == commenter_id).first()
-        commenter_username = commenter.username if commenter else "alguien"
-
-        await notify_new_comment(
-            pin_owner_id=pin.user_id,
-            commenter_username=commenter_username,
-            pin_id=pin_id,
-            pin_title=pin.title or "tu pin",
-            comment_text=text,
-        )
-        logger.info(f"Comment: {commenter_username} -> pin '{pin.title}' de {pin.user_id}")
+        author = await self._users.load(user_id)
+        return self._to_response(comment, current_user_id=user_id, author=author)
 
     async def get_comments_by_pin(
-        self, pin_id: str, current_user_id: str = None, limit: int = 50, offset: int = 0
+        self,
+        pin_id: str,
+        current_user_id: str = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str = None,
     ) -> CommentListResponse:
         result = await self._get_by_pin_uc.execute(
-            pin_id=pin_id, limit=limit, offset=offset
+            pin_id=pin_id, limit=limit, offset=offset, cursor=cursor
         )
+        authors = await self._users.load_many(c.user_id for c in result["comments"])
         return CommentListResponse(
             comments=[
-                self._to_response(c, current_user_id=current_user_id)
+                self._to_response(c, current_user_id=current_user_id, author=authors.get(c.user_id))
                 for c in result["comments"]
             ],
             total=result["total"],
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     async def get_replies(
@@ -130,9 +114,10 @@ class CommentController:
         result = await self._get_replies_uc.execute(
             comment_id=comment_id, limit=limit, offset=offset
         )
+        authors = await self._users.load_many(c.user_id for c in result["replies"])
         return RepliesListResponse(
             replies=[
-                self._to_response(c, current_user_id=current_user_id)
+                self._to_response(c, current_user_id=current_user_id, author=authors.get(c.user_id))
                 for c in result["replies"]
             ],
             total=result["total"],
@@ -147,7 +132,8 @@ class CommentController:
         comment = await self._update_uc.execute(
             comment_id=comment_id, user_id=user_id, new_text=body.text
         )
-        return self._to_response(comment, current_user_id=user_id)
+        author = await self._users.load(user_id)
+        return self._to_response(comment, current_user_id=user_id, author=author)
 
     async def delete_comment(self, comment_id: str, user_id: str) -> MessageResponse:
         await self._delete_uc.execute(comment_id=comment_id, user_id=user_id)
@@ -4,6 +4,7 @@ Rutas HTTP de Comments
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated
 
+from core.pagination import CursorParam
 from internal.comments.domain.entities.comment import CommentResponse
 from internal.comments.application.schemas.comment_schemas import (
     CreateCommentRequest,
@@ -45,10 +46,13 @@ async def get_comments_by_pin(
     pin_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: CommentController = Depends(get_comment_controller),
     user_id: str = Depends(get_current_user_id),
 ):
-    return await controller.get_comments_by_pin(pin_id, current_user_id=user_id, limit=limit, offset=offset)
+    return await controller.get_comments_by_pin(
+        pin_id, current_user_id=user_id, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 @router.get(
@@ -2,7 +2,7 @@
 DTOs (Data Transfer Objects) para Follows
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 from internal.follows.domain.entities.follow import (
     FollowerProfile,
@@ -31,6 +31,7 @@ class FollowersListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class FollowingListResponse(BaseModel):
@@ -40,6 +41,7 @@ class FollowingListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class FollowStatusResponse(BaseModel):
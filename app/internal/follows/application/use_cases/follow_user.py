@@ -2,13 +2,27 @@
 Caso de uso: Seguir a un usuario
 """
 from datetime import datetime, timezone
+from typing import Optional
 from internal.follows.domain.entities.follow import Follow
 from internal.follows.domain.repositories.follow_repository import FollowRepository
+from internal.pines.domain.repositories.feed_repository import FeedRepository
+from core.database.config import settings
+from core.notification_outbox import EVENT_NEW_FOLLOW, NotificationOutbox
+from core.unit_of_work import UnitOfWork
 
 
 class FollowUserUseCase:
-    def __init__(self, follow_repository: FollowRepository):
+    def __init__(
+        self,
+        follow_repository: FollowRepository,
+        uow: UnitOfWork,
+        outbox: NotificationOutbox,
+        feed_repository: Optional[FeedRepository] = None,
+    ):
         self._repo = follow_repository
+        self._uow = uow
+        self._outbox = outbox
+        self._feed = feed_repository
 
     async def execute(self, follower_id: str, following_id: str) -> Follow:
         # No puedes seguirte a ti mismo
@@ -28,4 +42,14 @@ class FollowUserUseCase:
             created_at=now,
         )
 
-        return await self._repo.create(follow)
\ No newline at end of file
+        async with self._uow:
+            created = await self._repo.create(follow)
+            # Sus últimos pins entran al feed ya, sin esperar al próximo
+            if self._feed:
+                await self._feed.backfill(
+                    follower_id, following_id, settings.FEED_FOLLOW_BACKFILL_ITEMS
+                )
+            await self._outbox.add(
+                EVENT_NEW_FOLLOW, actor_id=follower_id, recipient_id=following_id
+            )
+        return created
\ No newline at end of file
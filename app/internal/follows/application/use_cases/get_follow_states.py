@@ -0,0 +1,26 @@
+"""
+Caso de uso: Estado de follow del usuario actual con varios usuarios a la vez
+"""
+from typing import Dict, List
+
+from internal.follows.domain.repositories.follow_repository import FollowRepository
+
+
+class GetFollowStatesUseCase:
+    def __init__(self, follow_repository: FollowRepository):
+        self._repo = follow_repository
+
+    async def execute(self, current_user_id: str, target_user_ids: List[str]) -> Dict[str, dict]:
+        if not current_user_id or not target_user_ids:
+            return {}
+
+        following, followed_by = await self._repo.follow_states(current_user_id, target_user_ids)
+
+        return {
+            target_id: {
+                "is_following": target_id in following,
+                "is_followed_by": target_id in followed_by,
+                "are_mutual": target_id in following and target_id in followed_by,
+            }
+            for target_id in target_user_ids
+        }
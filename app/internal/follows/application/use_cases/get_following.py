@@ -1,6 +1,9 @@
 """
 Caso de uso: Obtener usuarios que sigue un usuario
 """
+from typing import Optional
+
+from core.pagination import parse_cursor, split_page
 from internal.follows.domain.repositories.follow_repository import FollowRepository
 
 
@@ -13,10 +16,15 @@ class GetFollowingUseCase:
         user_id: str,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
         following = await self._repo.get_following(
-            user_id=user_id, limit=limit, offset=offset
+            user_id=user_id,
+            limit=limit + 1,
+            offset=offset,
+            cursor=parse_cursor(cursor),
         )
+        following, has_more, next_cursor = split_page(following, limit)
         total = await self._repo.count_following(user_id)
 
         return {
@@ -24,5 +32,6 @@ class GetFollowingUseCase:
             "total": total,
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
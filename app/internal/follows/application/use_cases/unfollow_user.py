@@ -1,12 +1,22 @@
 """
 Caso de uso: Dejar de seguir a un usuario
 """
+from typing import Optional
 from internal.follows.domain.repositories.follow_repository import FollowRepository
+from internal.pines.domain.repositories.feed_repository import FeedRepository
+from core.unit_of_work import UnitOfWork
 
 
 class UnfollowUserUseCase:
-    def __init__(self, follow_repository: FollowRepository):
+    def __init__(
+        self,
+        follow_repository: FollowRepository,
+        uow: UnitOfWork,
+        feed_repository: Optional[FeedRepository] = None,
+    ):
         self._repo = follow_repository
+        self._uow = uow
+        self._feed = feed_repository
 
     async def execute(self, follower_id: str, following_id: str) -> bool:
         if follower_id == following_id:
@@ -16,4 +26,9 @@ class UnfollowUserUseCase:
         if not exists:
             raise ValueError("No sigues a este usuario")
 
-        return await self._repo.delete(follower_id, following_id)
\ No newline at end of file
+        async with self._uow:
+            deleted = await self._repo.delete(follower_id, following_id)
+            # Sus pins dejan de aparecer en el feed en la misma transacción
+            if self._feed:
+                await self._feed.remove_author(follower_id, following_id)
+            return deleted
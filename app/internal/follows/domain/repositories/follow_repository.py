@@ -2,7 +2,9 @@
 Interface del repositorio de Follows (Port)
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Set, Tuple
+
+from core.pagination import Cursor
 from internal.follows.domain.entities.follow import Follow
 
 class FollowRepository(ABC):
@@ -23,7 +25,8 @@ class FollowRepository(ABC):
         self, 
         user_id: str, 
         limit: int = 50, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[Follow]:
         """Obtener seguidores de un usuario"""
         pass
@@ -33,7 +36,8 @@ class FollowRepository(ABC):
         self, 
         user_id: str, 
         limit: int = 50, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[Follow]:
         """Obtener usuarios que sigue un usuario"""
         pass
@@ -42,6 +46,16 @@ class FollowRepository(ABC):
     async def exists(self, follower_id: str, following_id: str) -> bool:
         """Verificar si existe un follow"""
         pass
+
+    @abstractmethod
+    async def follow_states(
+        self, viewer_id: str, target_ids: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        (targets que `viewer_id` sigue, targets que siguen a `viewer_id`)
+        para toda una página, en una sola consulta
+        """
+        pass
     
     @abstractmethod
     async def count_followers(self, user_id: str) -> int:
@@ -1,22 +1,32 @@
 """
 Implementación MySQL (SQLAlchemy) del repositorio de Follows (Adapter)
 """
-from typing import List
+from typing import List, Optional, Set, Tuple
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, delete, func, and_, union_all
+
+from core.cache import cache
+from core.connection import DBSession
+from core.database.config import settings
+from core.pagination import Cursor, keyset_page
+from core.unit_of_work import after_commit
 
 from internal.follows.domain.entities.follow import Follow
 from internal.follows.domain.repositories.follow_repository import FollowRepository
 from core.database.models import FollowModel
+from internal.users.infrastructure.adapters.user_counters import add_to_user_counter
+
+# Seguidores de cada usuario (destinatarios de "nuevo pin"): user_id -> [follower_id]
+follower_ids_cache = cache.namespace("follower_ids")
 
 
 class MySQLFollowRepository(FollowRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self._db = db
+        self._follower_ids = follower_ids_cache
 
     # ── Mapeo ─────────────────────────────────────────────────
 
@@ -39,88 +49,126 @@ class MySQLFollowRepository(FollowRepository):
             created_at=datetime.now(timezone.utc),
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await add_to_user_counter(self._db, follow.follower_id, "following_count", 1)
+        await add_to_user_counter(self._db, follow.following_id, "followers_count", 1)
+        after_commit(self._db, self._follower_ids.delete, follow.following_id)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_entity(model)
 
     async def delete(self, follower_id: str, following_id: str) -> bool:
-        deleted = self._db.query(FollowModel).filter(
-            and_(
-                FollowModel.follower_id == follower_id,
-                FollowModel.following_id == following_id,
+        result = await self._db.execute(
+            delete(FollowModel).where(
+                and_(
+                    FollowModel.follower_id == follower_id,
+                    FollowModel.following_id == following_id,
+                )
             )
-        ).delete()
-        self._db.commit()
-        return deleted > 0
+        )
+        if result.rowcount > 0:
+            await add_to_user_counter(self._db, follower_id, "following_count", -1)
+            await add_to_user_counter(self._db, following_id, "followers_count", -1)
+            after_commit(self._db, self._follower_ids.delete, following_id)
+        return result.rowcount > 0
 
     async def get_followers(
-        self, user_id: str, limit: int = 50, offset: int = 0
+        self,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[Follow]:
-        models = (
-            self._db.query(FollowModel)
-            .filter(FollowModel.following_id == user_id)
-            .order_by(FollowModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        query = select(FollowModel).where(FollowModel.following_id == user_id)
+        models = await self._db.scalars(
+            keyset_page(query, FollowModel.created_at, FollowModel.id, limit, offset, cursor)
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def get_following(
-        self, user_id: str, limit: int = 50, offset: int = 0
+        self,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[Follow]:
-        models = (
-            self._db.query(FollowModel)
-            .filter(FollowModel.follower_id == user_id)
-            .order_by(FollowModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        query = select(FollowModel).where(FollowModel.follower_id == user_id)
+        models = await self._db.scalars(
+            keyset_page(query, FollowModel.created_at, FollowModel.id, limit, offset, cursor)
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def exists(self, follower_id: str, following_id: str) -> bool:
-        count = (
-            self._db.query(func.count(FollowModel.id))
-            .filter(
+        count = await self._db.scalar(
+            select(func.count(FollowModel.id))
+            .where(
                 and_(
                     FollowModel.follower_id == follower_id,
                     FollowModel.following_id == following_id,
                 )
             )
-            .scalar()
         )
         return (count or 0) > 0
 
+    async def follow_states(
+        self, viewer_id: str, target_ids: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        following: Set[str] = set()
+        followed_by: Set[str] = set()
+        if not target_ids:
+            return following, followed_by
+        # Una rama por dirección para que cada una use su índice
+        result = await self._db.execute(
+            union_all(
+                select(FollowModel.follower_id, FollowModel.following_id)
+                .where(FollowModel.follower_id == viewer_id, FollowModel.following_id.in_(target_ids)),
+                select(FollowModel.follower_id, FollowModel.following_id)
+                .where(FollowModel.following_id == viewer_id, FollowModel.follower_id.in_(target_ids)),
+            )
+        )
+        for follower_id, following_id in result.all():
+            if follower_id == viewer_id:
+                following.add(following_id)
+            if following_id == viewer_id:
+                followed_by.add(follower_id)
+        return following, followed_by
+
     async def count_followers(self, user_id: str) -> int:
         return (
-            self._db.query(func.count(FollowModel.id))
-            .filter(FollowModel.following_id == user_id)
-            .scalar()
+            await self._db.scalar(
+                select(func.count(FollowModel.id))
+                .where(FollowModel.following_id == user_id)
+            )
         ) or 0
 
     async def count_following(self, user_id: str) -> int:
         return (
-            self._db.query(func.count(FollowModel.id))
-            .filter(FollowModel.follower_id == user_id)
-            .scalar()
+            await self._db.scalar(
+                select(func.count(FollowModel.id))
+                .where(FollowModel.follower_id == user_id)
+            )
         ) or 0
 
     async def get_follower_ids(self, user_id: str) -> List[str]:
-        rows = (
-            self._db.query(FollowModel.follower_id)
-            .filter(FollowModel.following_id == user_id)
-            .all()
+        """Cacheado; se invalida al seguir/dejar de seguir a `user_id`"""
+        return await self._follower_ids.get_or_set(
+            user_id,
+            lambda: self._load_follower_ids(user_id),
+            settings.FOLLOWER_IDS_CACHE_TTL_SECONDS,
+        )
+
+    async def _load_follower_ids(self, user_id: str) -> List[str]:
+        rows = await self._db.scalars(
+            select(FollowModel.follower_id)
+            .where(FollowModel.following_id == user_id)
         )
-        return [row[0] for row in rows]
+        return list(rows.all())
 
     async def get_following_ids(self, user_id: str) -> List[str]:
-        rows = (
-            self._db.query(FollowModel.following_id)
-            .filter(FollowModel.follower_id == user_id)
-            .all()
+        rows = await self._db.scalars(
+            select(FollowModel.following_id)
+            .where(FollowModel.follower_id == user_id)
         )
-        return [row[0] for row in rows]
+        return list(rows.all())
 
     async def are_mutual_followers(self, user_id_1: str, user_id_2: str) -> bool:
         follows_1_to_2 = await self.exists(user_id_1, user_id_2)
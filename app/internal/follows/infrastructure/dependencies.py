@@ -2,28 +2,39 @@
 Inyección de dependencias para Follows
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.notification_outbox import NotificationOutbox
+from core.unit_of_work import UnitOfWork
 from internal.follows.infrastructure.adapters.mysql_follow_repository import MySQLFollowRepository
+from internal.pines.infrastructure.adapters.mysql_feed_repository import MySQLFeedRepository
 from internal.follows.infrastructure.http.follow_controller import FollowController
 from internal.follows.application.use_cases.follow_user import FollowUserUseCase
 from internal.follows.application.use_cases.unfollow_user import UnfollowUserUseCase
 from internal.follows.application.use_cases.get_followers import GetFollowersUseCase
 from internal.follows.application.use_cases.get_following import GetFollowingUseCase
 from internal.follows.application.use_cases.check_follow_status import CheckFollowStatusUseCase
+from internal.follows.application.use_cases.get_follow_states import GetFollowStatesUseCase
 from internal.follows.application.use_cases.get_follow_counts import GetFollowCountsUseCase
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.infrastructure.dependencies import get_user_summary_loader
 
 
-def get_follow_controller(db: Session = Depends(get_db)) -> FollowController:
+def get_follow_controller(
+    db: DBSession = Depends(get_db),
+    user_loader: UserSummaryLoader = Depends(get_user_summary_loader),
+) -> FollowController:
     repo = MySQLFollowRepository(db)
+    feed_repo = MySQLFeedRepository(db)
+    uow = UnitOfWork(db)
 
     return FollowController(
-        follow_uc=FollowUserUseCase(repo),
-        unfollow_uc=UnfollowUserUseCase(repo),
+        follow_uc=FollowUserUseCase(repo, uow, NotificationOutbox(db), feed_repo),
+        unfollow_uc=UnfollowUserUseCase(repo, uow, feed_repo),
         get_followers_uc=GetFollowersUseCase(repo),
         get_following_uc=GetFollowingUseCase(repo),
         check_status_uc=CheckFollowStatusUseCase(repo),
+        get_states_uc=GetFollowStatesUseCase(repo),
         get_counts_uc=GetFollowCountsUseCase(repo),
-        db_session=db,
+        user_loader=user_loader,
     )
\ No newline at end of file
@@ -8,6 +8,7 @@ from internal.follows.application.use_cases.unfollow_user import UnfollowUserUse
 from internal.follows.application.use_cases.get_followers import GetFollowersUseCase
 from internal.follows.application.use_cases.get_following import GetFollowingUseCase
 from internal.follows.application.use_cases.check_follow_status import CheckFollowStatusUseCase
+from internal.follows.application.use_cases.get_follow_states import GetFollowStatesUseCase
 from internal.follows.application.use_cases.get_follow_counts import GetFollowCountsUseCase
 
 from internal.follows.domain.entities.follow import Follow, FollowerProfile, FollowingProfile
@@ -19,7 +20,7 @@ from internal.follows.application.schemas.follow_schemas import (
     FollowCountsResponse,
     MessageResponse,
 )
-from core.notifications import notify_new_follow
+from internal.users.application.user_summary_loader import UserSummaryLoader
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +33,18 @@ class FollowController:
         get_followers_uc: GetFollowersUseCase,
         get_following_uc: GetFollowingUseCase,
         check_status_uc: CheckFollowStatusUseCase,
+        get_states_uc: GetFollowStatesUseCase,
         get_counts_uc: GetFollowCountsUseCase,
-        db_session=None,
+        user_loader: UserSummaryLoader,
     ):
         self._follow_uc = follow_uc
         self._unfollow_uc = unfollow_uc
         self._get_followers_uc = get_followers_uc
         self._get_following_uc = get_following_uc
         self._check_status_uc = check_status_uc
+        self._get_states_uc = get_states_uc
         self._get_counts_uc = get_counts_uc
-        self._db = db_session
+        self._users = user_loader
 
     # ── Follow / Unfollow ─────────────────────────────────────
 
@@ -51,12 +54,6 @@ class FollowController:
             following_id=body.user_id,
         )
 
-        # 🔔 Notificar al usuario seguido
-        try:
-            await self._send_follow_notification(current_user_id, body.user_id)
-        except Exception as e:
-            logger.warning(f"⚠️ No se pudo enviar notificación de follow: {e}")
-
         return MessageResponse(message="Ahora sigues a este usuario")
 
     async def unfollow_user(self, target_user_id: str, current_user_id: str) -> MessageResponse:
@@ -66,25 +63,6 @@ class FollowController:
         )
         return MessageResponse(message="Dejaste de seguir a este usuario")
 
-    # ── Notificación ──────────────────────────────────────────
-
-    async def _send_follow_notification(self, follower_id: str, following_id: str):
-        """Obtiene username del follower y envía notificación"""
-        if not self._db:
-            return
-
-        from core.database.models import UserModel
-
-        follower = self._db.query(UserModel).filter(UserModel.id == follower_id).first()
-        follower_username = follower.username if follower else "alguien"
-
-        await notify_new_follow(
-            followed_user_id=following_id,
-            follower_username=follower_username,
-            follower_id=follower_id,
-        )
-        logger.info(f"🔔 Follow: {follower_username} → {following_id}")
-
     # ── Listas ────────────────────────────────────────────────
 
     async def get_followers(
@@ -93,26 +71,27 @@ class FollowController:
         current_user_id: str = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str = None,
     ) -> FollowersListResponse:
         result = await self._get_followers_uc.execute(
-            user_id=user_id, limit=limit, offset=offset
+            user_id=user_id, limit=limit, offset=offset, cursor=cursor
         )
 
+        user_ids = [f.follower_id for f in result["followers"]]
+        users = await self._users.load_many(user_ids)
+        states = await self._get_states_uc.execute(current_user_id, user_ids)
         profiles = []
         for follow in result["followers"]:
-            is_following_back = False
-            if current_user_id:
-                status = await self._check_status_uc.execute(
-                    current_user_id, follow.follower_id
-                )
-                is_following_back = status["is_following"]
+            state = states.get(follow.follower_id)
+            is_following_back = state["is_following"] if state else False
 
+            user = users.get(follow.follower_id)
             profiles.append(FollowerProfile(
                 user_id=follow.follower_id,
-                username="",
-                full_name="",
-                avatar_url=None,
-                is_verified=False,
+                username=user.username if user else "",
+                full_name=user.full_name if user else "",
+                avatar_url=user.avatar_url if user else None,
+                is_verified=user.is_verified if user else False,
                 is_following_back=is_following_back,
             ))
 
@@ -122,6 +101,7 @@ class FollowController:
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     async def get_following(
@@ -130,26 +110,27 @@ class FollowController:
         current_user_id: str = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str = None,
     ) -> FollowingListResponse:
         result = await self._get_following_uc.execute(
-            user_id=user_id, limit=limit, offset=offset
+            user_id=user_id, limit=limit, offset=offset, cursor=cursor
         )
 
+        user_ids = [f.following_id for f in result["following"]]
+        users = await self._users.load_many(user_ids)
+        states = await self._get_states_uc.execute(current_user_id, user_ids)
         profiles = []
         for follow in result["following"]:
-            is_followed_by_me = False
-            if current_user_id:
-                status = await self._check_status_uc.execute(
-                    current_user_id, follow.following_id
-                )
-                is_followed_by_me = status["is_following"]
+            state = states.get(follow.following_id)
+            is_followed_by_me = state["is_following"] if state else False
 
+            user = users.get(follow.following_id)
             profiles.append(FollowingProfile(
                 user_id=follow.following_id,
-                username="",
-                full_name="",
-                avatar_url=None,
-                is_verified=False,
+                username=user.username if user else "",
+                full_name=user.full_name if user else "",
+                avatar_url=user.avatar_url if user else None,
+                is_verified=user.is_verified if user else False,
                 is_followed_by_me=is_followed_by_me,
             ))
 
@@ -159,6 +140,7 @@ class FollowController:
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     # ── Status / Counts ───────────────────────────────────────
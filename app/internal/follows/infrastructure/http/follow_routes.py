@@ -15,6 +15,7 @@ from internal.follows.application.schemas.follow_schemas import (
 from internal.follows.infrastructure.http.follow_controller import FollowController
 from internal.follows.infrastructure.dependencies import get_follow_controller
 from internal.users.infrastructure.middlewares.auth_middleware import get_current_user_id
+from core.pagination import CursorParam
 
 router = APIRouter(prefix="/follows", tags=["Follows"])
 
@@ -61,11 +62,16 @@ async def get_followers(
     user_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: FollowController = Depends(get_follow_controller),
     current_user_id: str = Depends(get_current_user_id),
 ):
     return await controller.get_followers(
-        user_id, current_user_id=current_user_id, limit=limit, offset=offset
+        user_id,
+        current_user_id=current_user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
 
 
@@ -78,11 +84,16 @@ async def get_following(
     user_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: FollowController = Depends(get_follow_controller),
     current_user_id: str = Depends(get_current_user_id),
 ):
     return await controller.get_following(
-        user_id, current_user_id=current_user_id, limit=limit, offset=offset
+        user_id,
+        current_user_id=current_user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
 
 
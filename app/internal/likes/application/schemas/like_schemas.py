@@ -2,7 +2,7 @@
 DTOs (Data Transfer Objects) para Likes
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 from internal.likes.domain.entities.like import LikeResponse
 
@@ -35,6 +35,7 @@ class LikesListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class UserLikesListResponse(BaseModel):
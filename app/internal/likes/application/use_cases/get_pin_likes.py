@@ -1,6 +1,9 @@
 """
 Caso de uso: Obtener likes de un pin
 """
+from typing import Optional
+
+from core.pagination import parse_cursor, split_page
 from internal.likes.domain.repositories.like_repository import LikeRepository
 
 
@@ -13,8 +16,12 @@ class GetPinLikesUseCase:
         pin_id: str,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
-        likes = await self._repo.get_by_pin(pin_id, limit=limit)
+        likes = await self._repo.get_by_pin(
+            pin_id, limit=limit + 1, offset=offset, cursor=parse_cursor(cursor)
+        )
+        likes, has_more, next_cursor = split_page(likes, limit)
         total = await self._repo.count_by_pin(pin_id)
 
         return {
@@ -22,5 +29,6 @@ class GetPinLikesUseCase:
             "total": total,
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
@@ -2,15 +2,25 @@
 Caso de uso: Dar like a un pin
 """
 from datetime import datetime, timezone
-from app.internal.pines.domain.repositories.pin_repository import PinRepository
+from internal.pines.domain.repositories.pin_repository import PinRepository
 from internal.likes.domain.entities.like import Like
 from internal.likes.domain.repositories.like_repository import LikeRepository
+from core.notification_outbox import EVENT_NEW_LIKE, NotificationOutbox
+from core.unit_of_work import UnitOfWork
 
 
 class LikePinUseCase:
-    def __init__(self, like_repository: LikeRepository, pin_repository: PinRepository):
+    def __init__(
+        self,
+        like_repository: LikeRepository,
+        pin_repository: PinRepository,
+        uow: UnitOfWork,
+        outbox: NotificationOutbox,
+    ):
         self._repo = like_repository
         self._pin_repo = pin_repository
+        self._uow = uow
+        self._outbox = outbox
 
 
     async def execute(self, user_id: str, pin_id: str) -> Like:
@@ -27,8 +37,10 @@ class LikePinUseCase:
             created_at=now,
         )
 
-        created_like = await self._repo.create(like)
-        await self._pin_repo.increment_likes(pin_id)  # <-- AGREGA ESTA LÍNEA
+        async with self._uow:
+            created_like = await self._repo.create(like)
+            await self._pin_repo.increment_likes(pin_id)
+            await self._outbox.add(EVENT_NEW_LIKE, actor_id=user_id, pin_id=pin_id)
         return created_like
 
 # ...existing code...
\ No newline at end of file
@@ -1,71 +1,54 @@
 """
 Caso de uso: Toggle Like (dar/quitar like)
 """
-import uuid
-from datetime import datetime
-from internal.likes.domain.entities.like import Like
 from internal.likes.domain.repositories.like_repository import LikeRepository
 from internal.pines.domain.repositories.pin_repository import PinRepository
+from core.notification_outbox import EVENT_NEW_LIKE, NotificationOutbox
+from core.unit_of_work import UnitOfWork
 
 class ToggleLikeUseCase:
     
     def __init__(
         self,
         like_repository: LikeRepository,
-        pin_repository: PinRepository  # ✅ NECESITAS ESTE
+        pin_repository: PinRepository,
+        uow: UnitOfWork,
+        outbox: NotificationOutbox,
     ):
         self.like_repository = like_repository
         self.pin_repository = pin_repository
+        self.uow = uow
+        self.outbox = outbox
     
     async def execute(self, user_id: str, pin_id: str) -> dict:
         """
-        Toggle like en un pin
+        Toggle like en un pin: like + contador en una sola transacción
         
         Returns:
             {"pin_id": str, "is_liked": bool, "likes_count": int}
         """
-        # 1. Verificar que el pin existe
+        # 1. Verificar que el pin existe (normalmente sale de la cache)
         pin = await self.pin_repository.get_by_id(pin_id)
         if not pin:
             raise ValueError("Pin not found")
         
-        # 2. Verificar si ya existe el like
-        exists = await self.like_repository.exists(user_id, pin_id)
+        # 2. DELETE o INSERT IGNORE del like + contador, un solo commit;
+        #    si otro request ganó la carrera el contador no se toca; la
+        #    notificación va al outbox en la misma transacción
+        async with self.uow:
+            is_liked, changed = await self.like_repository.toggle(user_id, pin_id)
+            if changed:
+                likes_count = await self.pin_repository.add_likes(pin_id, 1 if is_liked else -1)
+                if is_liked:
+                    await self.outbox.add(
+                        EVENT_NEW_LIKE, actor_id=user_id, recipient_id=pin.user_id, pin_id=pin_id
+                    )
+            else:
+                # Otro request ganó: el pin de la cache puede estar desfasado
+                likes_count = await self.pin_repository.get_likes_count(pin_id)
         
-        if exists:
-            # ===== QUITAR LIKE =====
-            await self.like_repository.delete(user_id, pin_id)
-            
-            # ✅ DECREMENTAR CONTADOR EN PIN
-            await self.pin_repository.decrement_likes(pin_id)
-            
-            # Obtener el pin actualizado
-            updated_pin = await self.pin_repository.get_by_id(pin_id)
-            
-            return {
-                "pin_id": pin_id,
-                "is_liked": False,
-                "likes_count": updated_pin.likes_count
-            }
-        else:
-            # ===== DAR LIKE =====
-            like = Like(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                pin_id=pin_id,
-                created_at=datetime.utcnow()
-            )
-            
-            await self.like_repository.create(like)
-            
-            # ✅ INCREMENTAR CONTADOR EN PIN
-            await self.pin_repository.increment_likes(pin_id)
-            
-            # Obtener el pin actualizado
-            updated_pin = await self.pin_repository.get_by_id(pin_id)
-            
-            return {
-                "pin_id": pin_id,
-                "is_liked": True,
-                "likes_count": updated_pin.likes_count
-            }
\ No newline at end of file
+        return {
+            "pin_id": pin_id,
+            "is_liked": is_liked,
+            "likes_count": likes_count
+        }
@@ -2,7 +2,9 @@
 Interface del repositorio de Likes (Port)
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
+
+from core.pagination import Cursor
 from internal.likes.domain.entities.like import Like
 
 class LikeRepository(ABC):
@@ -19,7 +21,13 @@ class LikeRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_pin(self, pin_id: str, limit: int = 50) -> List[Like]:
+    async def get_by_pin(
+        self,
+        pin_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Like]:
         """Obtener likes de un pin"""
         pass
     
@@ -32,6 +40,15 @@ class LikeRepository(ABC):
     async def exists(self, user_id: str, pin_id: str) -> bool:
         """Verificar si existe un like"""
         pass
+
+    @abstractmethod
+    async def toggle(self, user_id: str, pin_id: str) -> Tuple[bool, bool]:
+        """
+        Quitar el like si existe o darlo si no, sin hacer commit (el
+        contador del pin se actualiza en la misma transacción).
+        Returns: (is_liked, changed)
+        """
+        pass
     
     @abstractmethod
     async def count_by_pin(self, pin_id: str) -> int:
@@ -1,12 +1,14 @@
 """
 Implementación MySQL (SQLAlchemy) del repositorio de Likes (Adapter)
 """
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, delete, insert, func, and_
+
+from core.connection import DBSession
+from core.pagination import Cursor, keyset_page
 
 from internal.likes.domain.entities.like import Like
 from internal.likes.domain.repositories.like_repository import LikeRepository
@@ -15,7 +17,7 @@ from core.database.models import LikeModel
 
 class MySQLLikeRepository(LikeRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession):
         self._db = db
 
     # ── Mapeo ─────────────────────────────────────────────────
@@ -39,66 +41,97 @@ class MySQLLikeRepository(LikeRepository):
             created_at=datetime.now(timezone.utc),
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_entity(model)
 
     async def delete(self, user_id: str, pin_id: str) -> bool:
-        deleted = self._db.query(LikeModel).filter(
-            and_(
+        result = await self._db.execute(
+            delete(LikeModel).where(
+                and_(
+                    LikeModel.user_id == user_id,
+                    LikeModel.pin_id == pin_id,
+                )
+            )
+        )
+        return result.rowcount > 0
+
+    async def toggle(self, user_id: str, pin_id: str) -> Tuple[bool, bool]:
+        """
+        DELETE primero; si no borró nada, INSERT IGNORE sobre
+        unique_user_pin_like. Dos toques simultáneos no pueden insertar dos
+        likes: el segundo INSERT se ignora y devuelve changed=False.
+        """
+        deleted = await self._db.execute(
+            delete(LikeModel).where(
                 LikeModel.user_id == user_id,
                 LikeModel.pin_id == pin_id,
             )
-        ).delete()
-        self._db.commit()
-        return deleted > 0
-
-    async def get_by_pin(self, pin_id: str, limit: int = 50) -> List[Like]:
-        models = (
-            self._db.query(LikeModel)
-            .filter(LikeModel.pin_id == pin_id)
-            .order_by(LikeModel.created_at.desc())
-            .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
+        if deleted.rowcount > 0:
+            return False, True
+
+        inserted = await self._db.execute(
+            insert(LikeModel)
+            .prefix_with("IGNORE", dialect="mysql")
+            .values(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                pin_id=pin_id,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        return True, inserted.rowcount > 0
+
+    async def get_by_pin(
+        self,
+        pin_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Like]:
+        query = select(LikeModel).where(LikeModel.pin_id == pin_id)
+        models = await self._db.scalars(
+            keyset_page(query, LikeModel.created_at, LikeModel.id, limit, offset, cursor)
+        )
+        return [self._to_entity(m) for m in models.all()]
 
     async def get_by_user(
         self, user_id: str, limit: int = 50, offset: int = 0
     ) -> List[Like]:
-        models = (
-            self._db.query(LikeModel)
-            .filter(LikeModel.user_id == user_id)
+        models = await self._db.scalars(
+            select(LikeModel)
+            .where(LikeModel.user_id == user_id)
             .order_by(LikeModel.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def exists(self, user_id: str, pin_id: str) -> bool:
-        count = (
-            self._db.query(func.count(LikeModel.id))
-            .filter(
+        count = await self._db.scalar(
+            select(func.count(LikeModel.id))
+            .where(
                 and_(
                     LikeModel.user_id == user_id,
                     LikeModel.pin_id == pin_id,
                 )
             )
-            .scalar()
         )
         return (count or 0) > 0
 
     async def count_by_pin(self, pin_id: str) -> int:
         return (
-            self._db.query(func.count(LikeModel.id))
-            .filter(LikeModel.pin_id == pin_id)
-            .scalar()
+            await self._db.scalar(
+                select(func.count(LikeModel.id))
+                .where(LikeModel.pin_id == pin_id)
+            )
         ) or 0
 
     async def count_by_user(self, user_id: str) -> int:
         return (
-            self._db.query(func.count(LikeModel.id))
-            .filter(LikeModel.user_id == user_id)
-            .scalar()
+            await self._db.scalar(
+                select(func.count(LikeModel.id))
+                .where(LikeModel.user_id == user_id)
+            )
         ) or 0
\ No newline at end of file
@@ -2,10 +2,11 @@
 Inyección de dependencias para Likes
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
 from app.internal.pines.infrastructure.adapters.mysql_pin_repository import MySQLPinRepository
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.notification_outbox import NotificationOutbox
+from core.unit_of_work import UnitOfWork
 from internal.likes.infrastructure.adapters.mysql_like_repository import MySQLLikeRepository
 from internal.likes.infrastructure.http.like_controller import LikeController
 from internal.likes.application.use_cases.like_pin import LikePinUseCase
@@ -14,18 +15,25 @@ from internal.likes.application.use_cases.get_pin_likes import GetPinLikesUseCas
 from internal.likes.application.use_cases.get_user_likes import GetUserLikesUseCase
 from internal.likes.application.use_cases.check_like_status import CheckLikeStatusUseCase
 from internal.likes.application.use_cases.toggle_like import ToggleLikeUseCase
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.infrastructure.dependencies import get_user_summary_loader
 
 
-def get_like_controller(db: Session = Depends(get_db)) -> LikeController:
+def get_like_controller(
+    db: DBSession = Depends(get_db),
+    user_loader: UserSummaryLoader = Depends(get_user_summary_loader),
+) -> LikeController:
     repo = MySQLLikeRepository(db)
     pin_repo = MySQLPinRepository(db)  # ✅ NECESITAS ESTE REPOSITORIO PARA ACTUALIZAR CONTADOR DE LIKES
+    uow = UnitOfWork(db)
+    outbox = NotificationOutbox(db)
 
     return LikeController(
-        like_uc=LikePinUseCase(repo, pin_repo),  # ✅ PASAR PIN REPO
-        unlike_uc=UnlikePinUseCase(repo, pin_repo),  # ✅ PASAR PIN REPO
+        like_uc=LikePinUseCase(repo, pin_repo, uow, outbox),
+        unlike_uc=UnlikePinUseCase(repo, pin_repo, uow),
         get_pin_likes_uc=GetPinLikesUseCase(repo),
-        toggle_like_uc=ToggleLikeUseCase(repo, pin_repo),
+        toggle_like_uc=ToggleLikeUseCase(repo, pin_repo, uow, outbox),
         get_user_likes_uc=GetUserLikesUseCase(repo),
         check_status_uc=CheckLikeStatusUseCase(repo),
-        db_session=db,
+        user_loader=user_loader,
     )
\ No newline at end of file
@@ -4,6 +4,7 @@ Rutas HTTP de Likes
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated
 
+from core.pagination import CursorParam
 from internal.likes.application.schemas.like_schemas import (
     LikePinRequest,
     LikeStatusResponse,
@@ -39,6 +40,22 @@ async def like_pin(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/toggle",
+    response_model=LikeStatusResponse,
+    summary="Dar o quitar like (toggle)",
+)
+async def toggle_like(
+    body: LikePinRequest,
+    controller: LikeController = Depends(get_like_controller),
+    user_id: str = Depends(get_current_user_id),
+):
+    try:
+        return await controller.toggle_like(body, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
 @router.delete(
     "/{pin_id}",
     response_model=LikeStatusResponse,
@@ -66,9 +83,10 @@ async def get_pin_likes(
     pin_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: LikeController = Depends(get_like_controller),
 ):
-    return await controller.get_pin_likes(pin_id, limit=limit, offset=offset)
+    return await controller.get_pin_likes(pin_id, limit=limit, offset=offset, cursor=cursor)
 
 
 @router.get(
@@ -104,10 +104,12 @@ class PinFilters(BaseModel):
 class PinListResponse(BaseModel):
     """Respuesta paginada de pins completos"""
     pins: List[PinResponse]
-    total: int
+    total: int  # obsoleto: igual a `count`, se mantiene por compatibilidad
+    count: int  # pins en esta página (con keyset no hay total barato)
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class PinSummaryListResponse(BaseModel):
@@ -117,6 +119,7 @@ class PinSummaryListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class PinFeedResponse(BaseModel):
@@ -125,6 +128,7 @@ class PinFeedResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # keyset; alternativa a offset
 
 
 class PinTrendingResponse(BaseModel):
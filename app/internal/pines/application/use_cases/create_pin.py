@@ -1,15 +1,30 @@
 """
 Caso de uso: Crear un pin
 """
+import logging
 from datetime import datetime, timezone
 from typing import Optional, List
 from internal.pines.domain.entities.pin import Pin
 from internal.pines.domain.repositories.pin_repository import PinRepository
+from internal.pines.domain.repositories.feed_repository import FeedRepository
+from core.notification_outbox import EVENT_NEW_PIN, NotificationOutbox
+from core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
 
 
 class CreatePinUseCase:
-    def __init__(self, pin_repository: PinRepository):
+    def __init__(
+        self,
+        pin_repository: PinRepository,
+        uow: UnitOfWork,
+        feed_repository: Optional[FeedRepository] = None,
+        outbox: Optional[NotificationOutbox] = None,
+    ):
         self._repo = pin_repository
+        self._uow = uow
+        self._feed = feed_repository
+        self._outbox = outbox
 
     async def execute(
         self,
@@ -56,4 +71,20 @@ class CreatePinUseCase:
             updated_at=now,
         )
 
-        return await self._repo.create(pin)
\ No newline at end of file
+        async with self._uow:
+            created = await self._repo.create(pin)
+            # Aviso en tiempo real a los seguidores conectados
+            if self._outbox and not created.is_private:
+                await self._outbox.add(EVENT_NEW_PIN, actor_id=user_id, pin_id=created.id)
+
+        # Publicar en los timelines de los seguidores (transacción aparte:
+        # puede ser grande y un fallo no debe deshacer el pin)
+        if self._feed and not created.is_private:
+            try:
+                async with self._uow:
+                    await self._feed.fan_out(created)
+            except Exception as e:
+                # El pin ya está guardado; el feed no debe tumbar la creación
+                logger.error(f"❌ Feed fan-out failed for pin {created.id}: {e}")
+
+        return created
\ No newline at end of file
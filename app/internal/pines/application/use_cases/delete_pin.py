@@ -2,11 +2,13 @@
 Caso de uso: Eliminar un pin
 """
 from internal.pines.domain.repositories.pin_repository import PinRepository
+from core.unit_of_work import UnitOfWork
 
 
 class DeletePinUseCase:
-    def __init__(self, pin_repository: PinRepository):
+    def __init__(self, pin_repository: PinRepository, uow: UnitOfWork):
         self._repo = pin_repository
+        self._uow = uow
 
     async def execute(self, pin_id: str, user_id: str) -> bool:
         pin = await self._repo.get_by_id(pin_id)
@@ -16,4 +18,5 @@ class DeletePinUseCase:
         if pin.user_id != user_id:
             raise PermissionError("No tienes permiso para eliminar este pin")
 
-        return await self._repo.delete(pin_id)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.delete(pin_id)
\ No newline at end of file
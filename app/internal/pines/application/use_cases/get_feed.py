@@ -1,26 +1,76 @@
 """
 Caso de uso: Obtener feed personalizado del usuario
 """
+from typing import Dict, Optional
+
+from core.pagination import parse_cursor, split_page
+from internal.pines.domain.entities.feed import FeedEntry
 from internal.pines.domain.repositories.pin_repository import PinRepository
+from internal.pines.domain.repositories.feed_repository import FeedRepository
 
 
 class GetFeedUseCase:
-    def __init__(self, pin_repository: PinRepository):
+    def __init__(self, pin_repository: PinRepository, feed_repository: FeedRepository):
         self._repo = pin_repository
+        self._feed = feed_repository
+
+    async def _has_timeline(self, user_id: str) -> bool:
+        """¿Se acabó el timeline (fin del scroll) o nunca lo hubo (arranque en frío)?"""
+        return bool(
+            await self._feed.get_timeline(user_id, 1)
+            or await self._feed.get_fanin_entries(user_id, 1)
+        )
 
     async def execute(
         self,
         user_id: str,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
-        pins = await self._repo.get_feed(
-            user_id=user_id, limit=limit, offset=offset
+        after = parse_cursor(cursor)
+        if after is not None:
+            offset = 0
+
+        # +1 para saber si hay más páginas
+        window = offset + limit + 1
+
+        timeline = await self._feed.get_timeline(user_id, window, cursor=after)
+        fanin = await self._feed.get_fanin_entries(user_id, window, cursor=after)
+
+        if not timeline and not fanin and not (after and await self._has_timeline(user_id)):
+            # Arranque en frío: aún no hay timeline → pins públicos recientes
+            pins = await self._repo.get_feed(
+                user_id=user_id, limit=limit + 1, offset=offset, cursor=after
+            )
+            pins, has_more, next_cursor = split_page(pins, limit)
+            return {
+                "pins": pins,
+                "limit": limit,
+                "offset": offset,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+            }
+
+        # Mezclar timeline materializado + fan-in (sin duplicados)
+        entries: Dict[str, FeedEntry] = {e.pin_id: e for e in timeline}
+        for entry in fanin:
+            entries.setdefault(entry.pin_id, entry)
+        ordered = sorted(
+            entries.values(),
+            key=lambda e: (e.created_at, e.pin_id),
+            reverse=True,
+        )
+
+        page, has_more, next_cursor = split_page(
+            ordered[offset:], limit, key=lambda e: (e.created_at, e.pin_id)
         )
+        pins = await self._repo.get_many_with_users([e.pin_id for e in page])
 
         return {
             "pins": pins,
             "limit": limit,
             "offset": offset,
-            "has_more": len(pins) >= limit,
-        }
\ No newline at end of file
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
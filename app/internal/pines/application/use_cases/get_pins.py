@@ -2,6 +2,7 @@
 Caso de uso: Obtener lista de pins con filtros
 """
 from typing import Optional
+from core.pagination import parse_cursor, split_page
 from internal.pines.domain.repositories.pin_repository import PinRepository
 
 
@@ -16,19 +17,24 @@ class GetPinsUseCase:
         category: Optional[str] = None,
         season: Optional[str] = None,
         price_range: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> dict:
         pins = await self._repo.get_all(
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             category=category,
             season=season,
             price_range=price_range,
+            cursor=parse_cursor(cursor),
         )
+        pins, has_more, next_cursor = split_page(pins, limit)
 
         return {
             "pins": pins,
-            "total": len(pins),
+            "total": len(pins),  # obsoleto, ver PinListResponse
+            "count": len(pins),
             "limit": limit,
             "offset": offset,
-            "has_more": len(pins) >= limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
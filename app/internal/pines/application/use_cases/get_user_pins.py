@@ -1,6 +1,9 @@
 """
 Caso de uso: Obtener pins de un usuario
 """
+from typing import Optional
+
+from core.pagination import parse_cursor, split_page
 from internal.pines.domain.repositories.pin_repository import PinRepository
 
 
@@ -14,21 +17,26 @@ class GetUserPinsUseCase:
         requesting_user_id: str = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
         # Si es el propio usuario, incluir privados
         include_private = (requesting_user_id == user_id)
 
         pins = await self._repo.get_by_user(
             user_id=user_id,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             include_private=include_private,
+            cursor=parse_cursor(cursor),
         )
+        pins, has_more, next_cursor = split_page(pins, limit)
 
         return {
             "pins": pins,
-            "total": len(pins),
+            "total": len(pins),  # obsoleto, ver PinListResponse
+            "count": len(pins),
             "limit": limit,
             "offset": offset,
-            "has_more": len(pins) >= limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Caso de uso: Estado del usuario (like / guardado) para una página de pins
+"""
+from typing import List, Optional
+
+from internal.pines.domain.repositories.pin_repository import PinRepository
+
+
+class GetViewerFlagsUseCase:
+    def __init__(self, pin_repository: PinRepository):
+        self._repo = pin_repository
+
+    async def execute(self, viewer_id: Optional[str], pin_ids: List[str]) -> dict:
+        if not viewer_id or not pin_ids:
+            return {"liked": set(), "saved": set()}
+
+        liked, saved = await self._repo.get_viewer_flags(viewer_id, pin_ids)
+
+        return {
+            "liked": liked,
+            "saved": saved,
+        }
@@ -17,14 +17,14 @@ class SearchPinsUseCase:
         if not query or len(query.strip()) == 0:
             raise ValueError("El término de búsqueda no puede estar vacío")
 
-        pins = await self._repo.search(
-            query=query.strip(), limit=limit, offset=offset
-        )
+        query = query.strip()
+        pins = await self._repo.search(query=query, limit=limit, offset=offset)
+        total = await self._repo.count_search(query)
 
         return {
             "pins": pins,
-            "total": len(pins),
+            "total": total,
             "limit": limit,
             "offset": offset,
-            "has_more": len(pins) >= limit,
-        }
\ No newline at end of file
+            "has_more": (offset + limit) < total,
+        }
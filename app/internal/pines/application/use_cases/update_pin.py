@@ -1,14 +1,27 @@
 """
 Caso de uso: Actualizar un pin
 """
+import logging
 from datetime import datetime, timezone
+from typing import Optional
 from internal.pines.domain.entities.pin import Pin
 from internal.pines.domain.repositories.pin_repository import PinRepository
+from internal.pines.domain.repositories.feed_repository import FeedRepository
+from core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
 
 
 class UpdatePinUseCase:
-    def __init__(self, pin_repository: PinRepository):
+    def __init__(
+        self,
+        pin_repository: PinRepository,
+        uow: UnitOfWork,
+        feed_repository: Optional[FeedRepository] = None,
+    ):
         self._repo = pin_repository
+        self._uow = uow
+        self._feed = feed_repository
 
     async def execute(
         self,
@@ -28,4 +41,18 @@ class UpdatePinUseCase:
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         updated_pin = pin.model_copy(update=update_data)
-        return await self._repo.update(updated_pin)
\ No newline at end of file
+        async with self._uow:
+            saved = await self._repo.update(updated_pin)
+            # Un pin que pasa a privado sale de los timelines ya materializados
+            if self._feed and saved.is_private and not pin.is_private:
+                await self._feed.remove_pin(saved.id)
+
+        # Y uno que vuelve a ser público se publica de nuevo, como al crearlo
+        if self._feed and pin.is_private and not saved.is_private:
+            try:
+                async with self._uow:
+                    await self._feed.fan_out(saved)
+            except Exception as e:
+                logger.error(f"❌ Feed fan-out failed for pin {saved.id}: {e}")
+
+        return saved
@@ -0,0 +1,12 @@
+"""
+Entidades de dominio para el feed materializado
+"""
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class FeedEntry(BaseModel):
+    """Referencia a un pin dentro de un timeline (sin hidratar)"""
+    pin_id: str
+    author_id: str
+    created_at: datetime
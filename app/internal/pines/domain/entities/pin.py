@@ -97,6 +97,8 @@ class PinSummary(BaseModel):
     likes_count: int
     saves_count: int
     created_at: datetime
+    is_liked_by_me: bool = False
+    is_saved_by_me: bool = False
     
     class Config:
         from_attributes = True
\ No newline at end of file
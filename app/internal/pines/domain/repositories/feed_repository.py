@@ -0,0 +1,59 @@
+"""
+Interface del repositorio de Feed (Port)
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from core.pagination import Cursor
+from internal.pines.domain.entities.pin import Pin
+from internal.pines.domain.entities.feed import FeedEntry
+
+
+class FeedRepository(ABC):
+    """Timelines materializados por usuario - Interface"""
+
+    @abstractmethod
+    async def fan_out(self, pin: Pin) -> int:
+        """
+        Escribir el pin en el timeline de cada seguidor del autor.
+        Si el autor tiene demasiados seguidores se marca para fan-in y no
+        se escribe nada. Devuelve el número de timelines escritos.
+        """
+        pass
+
+    @abstractmethod
+    async def backfill(self, user_id: str, author_id: str, limit: int) -> int:
+        """
+        Copiar al timeline de `user_id` los últimos `limit` pins públicos de
+        `author_id` (al empezar a seguirlo). Devuelve cuántos se escribieron.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_author(self, user_id: str, author_id: str) -> int:
+        """Quitar del timeline de `user_id` los pins de `author_id`"""
+        pass
+
+    @abstractmethod
+    async def remove_pin(self, pin_id: str) -> int:
+        """Quitar el pin de todos los timelines (p. ej. al hacerse privado)"""
+        pass
+
+    @abstractmethod
+    async def get_timeline(
+        self, user_id: str, limit: int, cursor: Optional[Cursor] = None
+    ) -> List[FeedEntry]:
+        """Entradas materializadas del usuario, más recientes primero"""
+        pass
+
+    @abstractmethod
+    async def get_fanin_entries(
+        self, user_id: str, limit: int, cursor: Optional[Cursor] = None
+    ) -> List[FeedEntry]:
+        """Pins recientes de las cuentas fan-in que sigue el usuario"""
+        pass
+
+    @abstractmethod
+    async def trim(self, user_ids: List[str], max_items: int) -> int:
+        """Dejar como máximo `max_items` entradas por timeline"""
+        pass
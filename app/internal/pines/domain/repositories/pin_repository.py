@@ -2,8 +2,9 @@
 Interface del repositorio de Pins (Port)
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 from core.database.models import PinModel, UserModel
+from core.pagination import Cursor
 from internal.pines.domain.entities.pin import Pin, PinResponse
 
 class PinRepository(ABC):
@@ -27,18 +28,32 @@ class PinRepository(ABC):
         user_id: Optional[str] = None,
         category: Optional[str] = None,
         season: Optional[str] = None,
-        price_range: Optional[str] = None
+        price_range: Optional[str] = None,
+        cursor: Optional[Cursor] = None
     ) -> List[Pin]:
         """Obtener lista de pins públicos con filtros opcionales"""
         pass
     
+    @abstractmethod
+    async def get_many_with_users(self, pin_ids: List[str]) -> List[PinResponse]:
+        """Pins públicos con datos del autor, en el orden de `pin_ids`"""
+        pass
+
+    @abstractmethod
+    async def get_viewer_flags(
+        self, viewer_id: str, pin_ids: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """(pins con like del usuario, pins guardados por el usuario) de una página"""
+        pass
+
     @abstractmethod
     async def get_by_user(
         self, 
         user_id: str, 
         limit: int = 20, 
         offset: int = 0,
-        include_private: bool = False
+        include_private: bool = False,
+        cursor: Optional[Cursor] = None
     ) -> List[Pin]:
         """Obtener pins de un usuario específico"""
         pass
@@ -57,6 +72,11 @@ class PinRepository(ABC):
     async def increment_views(self, pin_id: str) -> None:
         """Incrementar contador de vistas"""
         pass
+
+    @abstractmethod
+    async def add_views_bulk(self, counts: Dict[str, int]) -> None:
+        """Sumar vistas acumuladas a varios pins (pin_id -> vistas)"""
+        pass
     
     @abstractmethod
     async def increment_likes(self, pin_id: str) -> None:
@@ -67,6 +87,16 @@ class PinRepository(ABC):
     async def decrement_likes(self, pin_id: str) -> None:
         """Decrementar contador de likes"""
         pass
+
+    @abstractmethod
+    async def add_likes(self, pin_id: str, delta: int) -> int:
+        """Sumar `delta` al contador de likes y devolver el valor nuevo"""
+        pass
+
+    @abstractmethod
+    async def get_likes_count(self, pin_id: str) -> int:
+        """Contador de likes leído de la base de datos (sin cache)"""
+        pass
     
     
     @abstractmethod
@@ -96,30 +126,24 @@ class PinRepository(ABC):
         limit: int = 20,
         offset: int = 0
     ) -> List[Pin]:
-        """Buscar pins por título, descripción o tags"""
+        """Buscar pins por relevancia (título, descripción, tags, marcas...)"""
+        pass
+
+    @abstractmethod
+    async def count_search(self, query: str) -> int:
+        """Total de pins que coinciden con una búsqueda"""
         pass
     
     @abstractmethod
     async def get_feed(
-    self,
-    user_id: str,
-    limit: int = 20,
-    offset: int = 0,
-        ) -> List[PinResponse]:
-        query = (
-        self._db.query(PinModel, UserModel)
-        .join(UserModel, PinModel.user_id == UserModel.id)
-        .filter(
-            PinModel.is_private == False,
-            PinModel.user_id != user_id,
-        )
-        .order_by(PinModel.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-        models = query.all()
-
-        return [self._to_entity_with_user(pin, user) for pin, user in models]
+        self,
+        user_id: str,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
+    ) -> List[PinResponse]:
+        """Feed personalizado: pins públicos recientes de otros usuarios"""
+        pass
     
     @abstractmethod
     async def get_trending(
@@ -128,6 +152,7 @@ class PinRepository(ABC):
         hours: int = 24
     ) -> List[Pin]:
         """
-        Obtener pins trending (más likes/views en últimas X horas)
+        Obtener pins trending: puntuación con decaimiento de la ventana
+        (1h / 24h / 7d) que cubre las últimas X horas
         """
         pass
\ No newline at end of file
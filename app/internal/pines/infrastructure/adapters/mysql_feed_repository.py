@@ -0,0 +1,215 @@
+"""
+Implementación MySQL (SQLAlchemy) del repositorio de Feed (Adapter)
+
+Fan-out on write: al crear un pin se inserta una fila en `feed_items` por
+cada seguidor del autor. Las cuentas con más de FEED_FANOUT_MAX_FOLLOWERS
+seguidores se registran en `feed_fanin_authors` y sus pins se leen al
+construir el feed (fan-in), para no escribir millones de filas por pin.
+"""
+import logging
+from typing import List, Optional, Set
+
+from sqlalchemy import select, delete, insert, func, literal
+
+from core.background import PeriodicTask, register_task
+from core.connection import DBSession, session_scope
+from core.database.config import settings
+from core.pagination import Cursor, keyset_page
+from core.unit_of_work import UnitOfWork
+from core.database.models import (
+    PinModel,
+    FollowModel,
+    FeedItemModel,
+    FeedFaninAuthorModel,
+)
+from internal.pines.domain.entities.pin import Pin
+from internal.pines.domain.entities.feed import FeedEntry
+from internal.pines.domain.repositories.feed_repository import FeedRepository
+
+logger = logging.getLogger(__name__)
+
+# Timelines que recibieron entradas desde el último recorte
+_touched_timelines: Set[str] = set()
+
+_INSERT_BATCH_SIZE = 1000
+
+
+class MySQLFeedRepository(FeedRepository):
+
+    def __init__(self, db: DBSession):
+        self._db = db
+
+    # ── Escritura ─────────────────────────────────────────────
+
+    async def _is_fanin_author(self, user_id: str) -> bool:
+        return await self._db.scalar(
+            select(FeedFaninAuthorModel.user_id)
+            .where(FeedFaninAuthorModel.user_id == user_id)
+        ) is not None
+
+    async def fan_out(self, pin: Pin) -> int:
+        if await self._is_fanin_author(pin.user_id):
+            return 0
+
+        followers_count = await self._db.scalar(
+            select(func.count(FollowModel.id))
+            .where(FollowModel.following_id == pin.user_id)
+        ) or 0
+
+        if followers_count > settings.FEED_FANOUT_MAX_FOLLOWERS:
+            # Una vez fan-in, siempre fan-in: sus pins anteriores no están
+            # materializados y se seguirán leyendo en tiempo de lectura
+            self._db.add(FeedFaninAuthorModel(
+                user_id=pin.user_id,
+                followers_count=followers_count,
+            ))
+            logger.info(f"📣 User {pin.user_id} switched to fan-in ({followers_count} followers)")
+            return 0
+
+        follower_ids = (await self._db.scalars(
+            select(FollowModel.follower_id)
+            .where(FollowModel.following_id == pin.user_id)
+        )).all()
+        if not follower_ids:
+            return 0
+
+        rows = [
+            {
+                "user_id": follower_id,
+                "pin_id": pin.id,
+                "author_id": pin.user_id,
+                "created_at": pin.created_at,
+            }
+            for follower_id in follower_ids
+        ]
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            await self._db.execute(
+                insert(FeedItemModel).prefix_with("IGNORE", dialect="mysql"),
+                rows[start:start + _INSERT_BATCH_SIZE],
+            )
+
+        _touched_timelines.update(follower_ids)
+        return len(follower_ids)
+
+    async def backfill(self, user_id: str, author_id: str, limit: int) -> int:
+        if limit <= 0 or await self._is_fanin_author(author_id):
+            return 0  # Los pins fan-in se leen al construir el feed
+
+        recent = (
+            select(
+                literal(user_id),
+                PinModel.id,
+                PinModel.user_id,
+                PinModel.created_at,
+            )
+            .where(PinModel.user_id == author_id, PinModel.is_private == False)
+            .order_by(PinModel.created_at.desc())
+            .limit(limit)
+        )
+        result = await self._db.execute(
+            insert(FeedItemModel)
+            .prefix_with("IGNORE", dialect="mysql")
+            .from_select(["user_id", "pin_id", "author_id", "created_at"], recent)
+        )
+        written = max(result.rowcount, 0)
+        if written:
+            _touched_timelines.add(user_id)
+        return written
+
+    async def remove_author(self, user_id: str, author_id: str) -> int:
+        result = await self._db.execute(
+            delete(FeedItemModel).where(
+                FeedItemModel.user_id == user_id,
+                FeedItemModel.author_id == author_id,
+            )
+        )
+        return result.rowcount
+
+    async def remove_pin(self, pin_id: str) -> int:
+        result = await self._db.execute(
+            delete(FeedItemModel).where(FeedItemModel.pin_id == pin_id)
+        )
+        return result.rowcount
+
+    # ── Lectura ───────────────────────────────────────────────
+
+    async def get_timeline(
+        self, user_id: str, limit: int, cursor: Optional[Cursor] = None
+    ) -> List[FeedEntry]:
+        query = (
+            select(FeedItemModel.pin_id, FeedItemModel.author_id, FeedItemModel.created_at)
+            .where(FeedItemModel.user_id == user_id)
+        )
+        result = await self._db.execute(
+            keyset_page(query, FeedItemModel.created_at, FeedItemModel.pin_id, limit, cursor=cursor)
+        )
+        return [
+            FeedEntry(pin_id=pin_id, author_id=author_id, created_at=created_at)
+            for pin_id, author_id, created_at in result.all()
+        ]
+
+    async def get_fanin_entries(
+        self, user_id: str, limit: int, cursor: Optional[Cursor] = None
+    ) -> List[FeedEntry]:
+        query = (
+            select(PinModel.id, PinModel.user_id, PinModel.created_at)
+            .join(FeedFaninAuthorModel, FeedFaninAuthorModel.user_id == PinModel.user_id)
+            .join(FollowModel, FollowModel.following_id == PinModel.user_id)
+            .where(
+                FollowModel.follower_id == user_id,
+                PinModel.is_private == False,
+            )
+        )
+        result = await self._db.execute(
+            keyset_page(query, PinModel.created_at, PinModel.id, limit, cursor=cursor)
+        )
+        return [
+            FeedEntry(pin_id=pin_id, author_id=author_id, created_at=created_at)
+            for pin_id, author_id, created_at in result.all()
+        ]
+
+    # ── Mantenimiento ─────────────────────────────────────────
+
+    async def trim(self, user_ids: List[str], max_items: int) -> int:
+        removed = 0
+        for user_id in user_ids:
+            cutoff = await self._db.scalar(
+                select(FeedItemModel.created_at)
+                .where(FeedItemModel.user_id == user_id)
+                .order_by(FeedItemModel.created_at.desc())
+                .offset(max_items)
+                .limit(1)
+            )
+            if cutoff is None:
+                continue
+            result = await self._db.execute(
+                delete(FeedItemModel).where(
+                    FeedItemModel.user_id == user_id,
+                    FeedItemModel.created_at <= cutoff,
+                )
+            )
+            removed += result.rowcount
+        return removed
+
+
+async def trim_touched_timelines() -> None:
+    """Recortar los timelines que crecieron desde la última pasada"""
+    if not _touched_timelines:
+        return
+    user_ids = list(_touched_timelines)
+    _touched_timelines.clear()
+    try:
+        async with session_scope() as db, UnitOfWork(db):
+            removed = await MySQLFeedRepository(db).trim(user_ids, settings.FEED_MAX_ITEMS)
+    except BaseException:
+        _touched_timelines.update(user_ids)
+        raise
+    if removed:
+        logger.info(f"✂️ Trimmed {removed} feed items from {len(user_ids)} timelines")
+
+
+register_task(PeriodicTask(
+    "feed_trim",
+    settings.FEED_TRIM_INTERVAL_SECONDS,
+    trim_touched_timelines,
+))
@@ -1,23 +1,44 @@
 """
 Implementación MySQL (SQLAlchemy) del repositorio de Pins (Adapter)
 """
-from typing import Optional, List
-from datetime import datetime, timezone, timedelta
+from typing import Dict, Optional, List, Set, Tuple
+from datetime import datetime, timezone
+import math
+import re
+import time
 import uuid
 import json
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_
+from sqlalchemy import select, update, delete, func, case, literal, union_all
+from sqlalchemy.dialects.mysql import match
+
+from core.cache import CacheBackend, cache as default_cache
+from core.connection import DBSession
+from core.database.config import settings
+from core.pagination import Cursor, keyset_page
+from core.unit_of_work import after_commit
 
 from internal.pines.domain.entities.pin import Pin, PinResponse
 from internal.pines.domain.repositories.pin_repository import PinRepository
-from core.database.models import PinModel, UserModel
+from core.database.models import PinModel, UserModel, LikeModel, BoardPinModel
+from internal.pines.infrastructure.adapters.view_counter import view_counter
+from internal.pines.infrastructure.adapters import trending_score
+from internal.users.infrastructure.adapters.user_counters import add_to_user_counter
+
+# Máximo de términos por búsqueda (cada uno es un +término* en BOOLEAN MODE)
+_MAX_SEARCH_TERMS = 8
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 
 
 class MySQLPinRepository(PinRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession, cache: Optional[CacheBackend] = None):
         self._db = db
+        # Cache de detalle: pin_id -> (Pin, cached_at epoch)
+        self._cache = cache if cache is not None else default_cache.namespace("pin")
+        self._cache_ttl = settings.PIN_CACHE_TTL_SECONDS
+        # Páginas de trending: "ventana:limit" -> List[Pin]
+        self._trending_cache = default_cache.namespace("trending")
 
     # ── Mapeo ─────────────────────────────────────────────────
 
@@ -43,6 +64,14 @@ class MySQLPinRepository(PinRepository):
             return json.dumps(value)
         return None
 
+    @staticmethod
+    def _build_search_text(pin: Pin) -> str:
+        """Texto que indexa ft_pins_search: campos de texto + listas JSON"""
+        parts = [pin.title, pin.description or "", str(pin.category or "")]
+        for values in (pin.styles, pin.occasions, pin.brands, pin.colors, pin.tags):
+            parts.extend(values or [])
+        return " ".join(p for p in parts if p)
+
     def _to_entity(self, model: PinModel) -> Pin:
         return Pin(
             id=model.id,
@@ -94,21 +123,30 @@ class MySQLPinRepository(PinRepository):
             colors=self._to_json(pin.colors),
             tags=self._to_json(pin.tags),
             is_private=pin.is_private,
+            search_text=self._build_search_text(pin),
+            **trending_score.initial_scores(now),
             created_at=now,
             updated_at=now,
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await add_to_user_counter(self._db, pin.user_id, "pins_count", 1)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_entity(model)
 
     async def get_by_id(self, pin_id: str) -> Optional[Pin]:
-        model = self._db.query(PinModel).filter(
-            PinModel.id == pin_id
-        ).first()
-        return self._to_entity(model) if model else None
-
+        cached = await self._cache.get(pin_id)
+        if cached is not None:
+            return cached[0]
 
+        model = await self._db.scalar(
+            select(PinModel).where(PinModel.id == pin_id)
+        )
+        if not model:
+            return None
+        pin = self._to_entity(model)
+        await self._cache.set(pin_id, (pin, time.time()), self._cache_ttl)
+        return pin
 
     async def get_all(
         self,
@@ -118,30 +156,61 @@ class MySQLPinRepository(PinRepository):
         category: Optional[str] = None,
         season: Optional[str] = None,
         price_range: Optional[str] = None,
+        cursor: Optional[Cursor] = None,
     ) -> List[Pin]:
         query = (
-            self._db.query(PinModel, UserModel)
+            select(PinModel, UserModel)
             .join(UserModel, PinModel.user_id == UserModel.id)
-            .filter(PinModel.is_private == False)
+            .where(PinModel.is_private == False)
         )
 
         if user_id:
-            query = query.filter(PinModel.user_id == user_id)
+            query = query.where(PinModel.user_id == user_id)
         if category:
-            query = query.filter(PinModel.category == category)
+            query = query.where(PinModel.category == category)
         if season:
-            query = query.filter(PinModel.season == season)
+            query = query.where(PinModel.season == season)
         if price_range:
-            query = query.filter(PinModel.price_range == price_range)
+            query = query.where(PinModel.price_range == price_range)
 
-        models = (
-            query
-            .order_by(PinModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        result = await self._db.execute(
+            keyset_page(query, PinModel.created_at, PinModel.id, limit, offset, cursor)
         )
-        return [self._to_entity_with_user(pin, user) for pin, user in models]
+        return [self._to_entity_with_user(pin, user) for pin, user in result.all()]
+
+    async def get_many_with_users(self, pin_ids: List[str]) -> List[PinResponse]:
+        if not pin_ids:
+            return []
+        result = await self._db.execute(
+            select(PinModel, UserModel)
+            .join(UserModel, PinModel.user_id == UserModel.id)
+            .where(
+                PinModel.id.in_(pin_ids),
+                PinModel.is_private == False,
+            )
+        )
+        by_id = {pin.id: self._to_entity_with_user(pin, user) for pin, user in result.all()}
+        return [by_id[pin_id] for pin_id in pin_ids if pin_id in by_id]
+
+    async def get_viewer_flags(
+        self, viewer_id: str, pin_ids: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """Likes y guardados del usuario para toda la página en una sola consulta"""
+        liked: Set[str] = set()
+        saved: Set[str] = set()
+        if not pin_ids:
+            return liked, saved
+        result = await self._db.execute(
+            union_all(
+                select(LikeModel.pin_id, literal("like"))
+                .where(LikeModel.user_id == viewer_id, LikeModel.pin_id.in_(pin_ids)),
+                select(BoardPinModel.pin_id, literal("save"))
+                .where(BoardPinModel.user_id == viewer_id, BoardPinModel.pin_id.in_(pin_ids)),
+            )
+        )
+        for pin_id, kind in result.all():
+            (liked if kind == "like" else saved).add(pin_id)
+        return liked, saved
 
     def _to_entity_with_user(self, pin: PinModel, user: UserModel) -> Pin:
            return PinResponse(
@@ -181,25 +250,22 @@ class MySQLPinRepository(PinRepository):
         limit: int = 20,
         offset: int = 0,
         include_private: bool = False,
+        cursor: Optional[Cursor] = None,
     ) -> List[Pin]:
-        query = self._db.query(PinModel).filter(PinModel.user_id == user_id)
+        query = select(PinModel).where(PinModel.user_id == user_id)
 
         if not include_private:
-            query = query.filter(PinModel.is_private == False)
+            query = query.where(PinModel.is_private == False)
 
-        models = (
-            query
-            .order_by(PinModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        models = await self._db.scalars(
+            keyset_page(query, PinModel.created_at, PinModel.id, limit, offset, cursor)
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     async def update(self, pin: Pin) -> Pin:
-        model = self._db.query(PinModel).filter(
-            PinModel.id == pin.id
-        ).first()
+        model = await self._db.scalar(
+            select(PinModel).where(PinModel.id == pin.id)
+        )
         if model:
             model.title = pin.title
             model.description = pin.description
@@ -214,126 +280,201 @@ class MySQLPinRepository(PinRepository):
             model.colors = self._to_json(pin.colors)
             model.tags = self._to_json(pin.tags)
             model.is_private = pin.is_private
+            model.search_text = self._build_search_text(pin)
             model.updated_at = datetime.now(timezone.utc)
-            self._db.commit()
-            self._db.refresh(model)
+            await self._db.flush()
+            await self._db.refresh(model)
+            after_commit(self._db, self._cache.delete, pin.id)
             return self._to_entity(model)
         return pin
 
     async def delete(self, pin_id: str) -> bool:
-        deleted = self._db.query(PinModel).filter(
-            PinModel.id == pin_id
-        ).delete()
-        self._db.commit()
-        return deleted > 0
+        owner_id = await self._db.scalar(
+            select(PinModel.user_id).where(PinModel.id == pin_id)
+        )
+        result = await self._db.execute(
+            delete(PinModel).where(PinModel.id == pin_id)
+        )
+        if result.rowcount > 0:
+            await add_to_user_counter(self._db, owner_id, "pins_count", -1)
+        after_commit(self._db, self._cache.delete, pin_id)
+        return result.rowcount > 0
 
     # ── Contadores ────────────────────────────────────────────
 
+    async def _add_to_counter(
+        self, pin_id: str, column, delta: int, trend_weight: float = 0
+    ) -> None:
+        """
+        Suma `delta` a un contador sin dejarlo negativo. Los incrementos
+        suman además `trend_weight` a la puntuación trending (los
+        decrementos no la restan: el decaimiento ya la va reduciendo).
+        """
+        stmt = update(PinModel).where(PinModel.id == pin_id)
+        values = {column: column + delta}
+        if delta < 0:
+            stmt = stmt.where(column > 0)  # ✅ Evitar números negativos
+        elif trend_weight:
+            values.update(trending_score.bump_values(trend_weight))
+        result = await self._db.execute(stmt.values(values))
+        if result.rowcount > 0:
+            after_commit(self._db, self._patch_cached_counter, pin_id, column.key, delta)
+
+    async def _patch_cached_counter(self, pin_id: str, field: str, delta: int) -> None:
+        """
+        Aplica el cambio de contador a la copia cacheada en vez de invalidarla,
+        conservando el TTL restante para que la entrada acabe expirando.
+        """
+        cached = await self._cache.get(pin_id)
+        if cached is None:
+            return
+        pin, cached_at = cached
+        remaining = self._cache_ttl - (time.time() - cached_at)
+        if remaining <= 0:
+            await self._cache.delete(pin_id)
+            return
+        patched = pin.model_copy(update={field: max(getattr(pin, field) + delta, 0)})
+        await self._cache.set(pin_id, (patched, cached_at), math.ceil(remaining))
+
     async def increment_views(self, pin_id: str) -> None:
-        self._db.query(PinModel).filter(
-            PinModel.id == pin_id
-        ).update({PinModel.views_count: PinModel.views_count + 1})
-        self._db.commit()
+        """
+        La vista se acumula en el buffer de view_counter y se escribe en
+        MySQL por lotes (add_views_bulk); aquí solo se parchea la cache.
+        """
+        await view_counter.record(pin_id)
+        await self._patch_cached_counter(pin_id, "views_count", 1)
+
+    async def add_views_bulk(self, counts: Dict[str, int]) -> None:
+        """Un UPDATE ... CASE por lote en vez de un UPDATE por vista"""
+        pin_ids = list(counts)
+        batch_size = settings.VIEW_FLUSH_BATCH_SIZE
+        for start in range(0, len(pin_ids), batch_size):
+            batch = {pin_id: counts[pin_id] for pin_id in pin_ids[start:start + batch_size]}
+            weights = {pin_id: views * trending_score.WEIGHT_VIEW for pin_id, views in batch.items()}
+            await self._db.execute(
+                update(PinModel)
+                .where(PinModel.id.in_(batch))
+                .values(
+                    {
+                        PinModel.views_count: PinModel.views_count
+                        + case(batch, value=PinModel.id, else_=0),
+                        **trending_score.bump_values_bulk(list(batch), weights),
+                    }
+                )
+                .execution_options(synchronize_session=False)
+            )
 
     async def increment_likes(self, pin_id: str) -> None:
         """Incrementar contador de likes en la tabla pins"""
-        self._db.query(PinModel).filter(
-        PinModel.id == pin_id
-    ).update({
-        PinModel.likes_count: PinModel.likes_count + 1
-    })
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.likes_count, 1, trending_score.WEIGHT_LIKE)
 
     async def decrement_likes(self, pin_id: str) -> None:
         """Decrementar contador de likes en la tabla pins"""
-        self._db.query(PinModel).filter(
-        PinModel.id == pin_id,
-        PinModel.likes_count > 0  # ✅ Evitar números negativos
-    ).update({
-        PinModel.likes_count: PinModel.likes_count - 1
-    })
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.likes_count, -1)
+
+    async def add_likes(self, pin_id: str, delta: int) -> int:
+        """
+        Suma `delta` a likes_count y devuelve el valor nuevo sin releer el pin:
+        LAST_INSERT_ID(expr) lo deja en el paquete OK (result.lastrowid).
+        Va en la misma transacción que el toggle de like (DELETE/INSERT en
+        likes), así ambos se confirman juntos.
+        """
+        stmt = update(PinModel).where(PinModel.id == pin_id)
+        values = {PinModel.likes_count: func.last_insert_id(PinModel.likes_count + delta)}
+        if delta < 0:
+            stmt = stmt.where(PinModel.likes_count > 0)
+        else:
+            values.update(trending_score.bump_values(trending_score.WEIGHT_LIKE))
+        result = await self._db.execute(stmt.values(values))
+        if result.rowcount == 0:
+            return 0
+        after_commit(self._db, self._patch_cached_counter, pin_id, "likes_count", delta)
+        return result.lastrowid
+
+    async def get_likes_count(self, pin_id: str) -> int:
+        return await self._db.scalar(
+            select(PinModel.likes_count).where(PinModel.id == pin_id)
+        ) or 0
 
     async def increment_saves(self, pin_id: str) -> None:
-        self._db.query(PinModel).filter(
-            PinModel.id == pin_id
-        ).update({PinModel.saves_count: PinModel.saves_count + 1})
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.saves_count, 1, trending_score.WEIGHT_SAVE)
 
     async def decrement_saves(self, pin_id: str) -> None:
-        self._db.query(PinModel).filter(
-            PinModel.id == pin_id,
-            PinModel.saves_count > 0,
-        ).update({PinModel.saves_count: PinModel.saves_count - 1})
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.saves_count, -1)
 
     async def increment_comments(self, pin_id: str) -> None:
-        self._db.query(PinModel).filter(
-            PinModel.id == pin_id
-        ).update({PinModel.comments_count: PinModel.comments_count + 1})
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.comments_count, 1, trending_score.WEIGHT_COMMENT)
 
     async def decrement_comments(self, pin_id: str) -> None:
-        self._db.query(PinModel).filter(
-            PinModel.id == pin_id,
-            PinModel.comments_count > 0,
-        ).update({PinModel.comments_count: PinModel.comments_count - 1})
-        self._db.commit()
+        await self._add_to_counter(pin_id, PinModel.comments_count, -1)
 
     # ── Búsqueda ──────────────────────────────────────────────
 
+    @staticmethod
+    def _to_boolean_query(query: str) -> str:
+        """
+        "vestido rojo" -> "+vestido* +rojo*": todos los términos obligatorios
+        y con coincidencia por prefijo. Se descartan los operadores que
+        escriba el usuario.
+        """
+        terms = _SEARCH_TOKEN_RE.findall(query.lower())[:_MAX_SEARCH_TERMS]
+        return " ".join(f"+{term}*" for term in terms)
+
     async def search(
         self,
         query: str,
         limit: int = 20,
         offset: int = 0,
     ) -> List[Pin]:
-        search_term = f"%{query}%"
-        models = (
-            self._db.query(PinModel)
-            .filter(
-                PinModel.is_private == False,
-                or_(
-                    PinModel.title.ilike(search_term),
-                    PinModel.description.ilike(search_term),
-                    PinModel.tags.ilike(search_term),
-                    PinModel.category.ilike(search_term),
-                    PinModel.brands.ilike(search_term),
-                    PinModel.colors.ilike(search_term),
-                )
-            )
-            .order_by(PinModel.created_at.desc())
+        """Pins públicos ordenados por relevancia (FULLTEXT) y recencia"""
+        against = self._to_boolean_query(query)
+        if not against:
+            return []
+        relevance = match(PinModel.search_text, against=against).in_boolean_mode()
+        models = await self._db.scalars(
+            select(PinModel)
+            .where(PinModel.is_private == False, relevance)
+            .order_by(relevance.desc(), PinModel.created_at.desc(), PinModel.id.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
+
+    async def count_search(self, query: str) -> int:
+        against = self._to_boolean_query(query)
+        if not against:
+            return 0
+        relevance = match(PinModel.search_text, against=against).in_boolean_mode()
+        return await self._db.scalar(
+            select(func.count(PinModel.id))
+            .where(PinModel.is_private == False, relevance)
+        ) or 0
 
     # ── Feed ──────────────────────────────────────────────────
 
     async def get_feed(
-    self,
-    user_id: str,
-    limit: int = 20,
-    offset: int = 0,
+        self,
+        user_id: str,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[PinResponse]:
         """
         Feed personalizado: pins públicos recientes.
         Excluye los del propio usuario.
         """
         query = (
-            self._db.query(PinModel, UserModel)
+            select(PinModel, UserModel)
             .join(UserModel, PinModel.user_id == UserModel.id)
-            .filter(
+            .where(
                 PinModel.is_private == False,
                 PinModel.user_id != user_id,
             )
-            .order_by(PinModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
         )
-        models = query.all()
-        return [self._to_entity_with_user(pin, user) for pin, user in models]
+        result = await self._db.execute(
+            keyset_page(query, PinModel.created_at, PinModel.id, limit, offset, cursor)
+        )
+        return [self._to_entity_with_user(pin, user) for pin, user in result.all()]
 
     # ── Trending ──────────────────────────────────────────────
 
@@ -342,18 +483,23 @@ class MySQLPinRepository(PinRepository):
         limit: int = 20,
         hours: int = 24,
     ) -> List[Pin]:
-        """Pins trending: más likes + views en las últimas X horas"""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        models = (
-            self._db.query(PinModel)
-            .filter(
-                PinModel.is_private == False,
-                PinModel.created_at >= cutoff,
-            )
-            .order_by(
-                (PinModel.likes_count + PinModel.views_count).desc()
-            )
+        """
+        Top-K por la columna trending de la ventana que cubre `hours`
+        (1h / 24h / 7d). La página se comparte en cache unos segundos.
+        """
+        window = trending_score.window_for(hours)
+        key = f"{window}:{limit}"
+        cached = await self._trending_cache.get(key)
+        if cached is not None:
+            return cached
+
+        column = trending_score.TRENDING_WINDOWS[window]
+        models = await self._db.scalars(
+            select(PinModel)
+            .where(PinModel.is_private == False)
+            .order_by(column.desc())
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
\ No newline at end of file
+        pins = [self._to_entity(m) for m in models.all()]
+        await self._trending_cache.set(key, pins, settings.TRENDING_CACHE_TTL_SECONDS)
+        return pins
@@ -0,0 +1,86 @@
+"""
+Puntuación trending con decaimiento temporal, mantenida de forma incremental
+
+Cada interacción suma `peso * 2^((t - EPOCH) / vida_media)` a la puntuación
+del pin. Como todas las puntuaciones decaen al mismo ritmo, ordenar por la
+suma acumulada equivale a ordenar por la puntuación decaída "ahora", así que
+no hace falta recalcular nada al leer: `/pins/trending` es un top-K sobre una
+columna indexada.
+
+Para que el exponente no desborde con el tiempo se guarda en espacio
+logarítmico (log2 de la suma) y cada evento se combina con log-sum-exp.
+"""
+import math
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import case, func
+
+from core.database.models import PinModel
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Ventanas soportadas: horas -> columna (la vida media es la propia ventana)
+TRENDING_WINDOWS = {
+    1: PinModel.trend_1h,
+    24: PinModel.trend_24h,
+    168: PinModel.trend_7d,
+}
+
+# Peso de cada interacción
+WEIGHT_CREATE = 1.0
+WEIGHT_VIEW = 1.0
+WEIGHT_LIKE = 3.0
+WEIGHT_COMMENT = 4.0
+WEIGHT_SAVE = 5.0
+
+
+def window_for(hours: int) -> int:
+    """Menor ventana que cubre `hours` (la mayor si se pasa de todas)"""
+    for window in sorted(TRENDING_WINDOWS):
+        if hours <= window:
+            return window
+    return max(TRENDING_WINDOWS)
+
+
+def log_score(window: int, weight: float, at: Optional[datetime] = None) -> float:
+    """log2(peso * 2^((t - EPOCH) / vida_media))"""
+    at = at or datetime.now(timezone.utc)
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    hours = (at - _EPOCH).total_seconds() / 3600
+    return hours / window + math.log2(weight)
+
+
+def initial_scores(at: Optional[datetime] = None) -> Dict[str, float]:
+    """Valores de las columnas al crear un pin"""
+    return {
+        column.key: log_score(window, WEIGHT_CREATE, at)
+        for window, column in TRENDING_WINDOWS.items()
+    }
+
+
+def _log_add(column, x):
+    """log2(2^column + 2^x) sin desbordar (x puede ser expresión SQL)"""
+    return case(
+        (column >= x, column + func.log2(1 + func.pow(2, x - column))),
+        else_=x + func.log2(1 + func.pow(2, column - x)),
+    )
+
+
+def bump_values(weight: float, at: Optional[datetime] = None) -> dict:
+    """`.values()` de un UPDATE que suma un evento de `weight` a las ventanas"""
+    return {
+        column: _log_add(column, log_score(window, weight, at))
+        for window, column in TRENDING_WINDOWS.items()
+    }
+
+
+def bump_values_bulk(pin_ids: List[str], weights: Dict[str, float]) -> dict:
+    """Como bump_values pero con un peso distinto por pin (UPDATE ... CASE)"""
+    now = datetime.now(timezone.utc)
+    values = {}
+    for window, column in TRENDING_WINDOWS.items():
+        scores = {pin_id: log_score(window, weights[pin_id], now) for pin_id in pin_ids}
+        values[column] = _log_add(column, case(scores, value=PinModel.id, else_=column))
+    return values
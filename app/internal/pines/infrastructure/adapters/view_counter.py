@@ -0,0 +1,193 @@
+"""
+Contador de vistas de pins con buffer
+
+Las vistas no se escriben en MySQL una a una: se acumulan (en memoria o en
+un hash de Redis con HINCRBY) y una tarea periódica las vuelca con un único
+UPDATE ... CASE por lote, evitando la contención sobre la fila de un pin viral.
+"""
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from core.background import PeriodicTask, register_task
+from core.connection import session_scope
+from core.database.config import settings
+from core.redis_client import get_redis
+from core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class ViewBuffer(ABC):
+    """Almacén de incrementos pendientes pin_id -> vistas"""
+
+    @abstractmethod
+    async def add(self, pin_id: str, count: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    async def drain(self) -> Dict[str, int]:
+        """Extraer y vaciar los incrementos pendientes (atómico)"""
+        pass
+
+    @abstractmethod
+    async def restore(self, counts: Dict[str, int]) -> None:
+        """Devolver incrementos al buffer (si el volcado falló)"""
+        pass
+
+    @abstractmethod
+    async def pending(self) -> Tuple[int, int]:
+        """(pins pendientes, vistas pendientes)"""
+        pass
+
+
+class MemoryViewBuffer(ViewBuffer):
+    """Buffer por proceso"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+
+    async def add(self, pin_id: str, count: int = 1) -> None:
+        self._counts[pin_id] += count
+
+    async def drain(self) -> Dict[str, int]:
+        counts, self._counts = self._counts, Counter()
+        return dict(counts)
+
+    async def restore(self, counts: Dict[str, int]) -> None:
+        self._counts.update(counts)
+
+    async def pending(self) -> Tuple[int, int]:
+        return len(self._counts), sum(self._counts.values())
+
+
+class RedisViewBuffer(ViewBuffer):
+    """Buffer compartido entre réplicas (hash de Redis)"""
+
+    def __init__(self, client=None, key: str = "amura:pin_views"):
+        self._redis = client if client is not None else get_redis()
+        self._key = key
+
+    async def add(self, pin_id: str, count: int = 1) -> None:
+        await self._redis.hincrby(self._key, pin_id, count)
+
+    async def drain(self) -> Dict[str, int]:
+        # RENAME es atómico: los HINCRBY posteriores van a un hash nuevo
+        flushing_key = f"{self._key}:flushing:{uuid.uuid4().hex}"
+        try:
+            await self._redis.rename(self._key, flushing_key)
+        except Exception:
+            return {}  # no hay nada pendiente (u otra réplica lo tomó)
+        raw = await self._redis.hgetall(flushing_key)
+        await self._redis.delete(flushing_key)
+        return {
+            (k.decode() if isinstance(k, bytes) else k): int(v)
+            for k, v in raw.items()
+        }
+
+    async def restore(self, counts: Dict[str, int]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for pin_id, count in counts.items():
+                pipe.hincrby(self._key, pin_id, count)
+            await pipe.execute()
+
+    async def pending(self) -> Tuple[int, int]:
+        values = await self._redis.hvals(self._key)
+        return len(values), sum(int(v) for v in values)
+
+
+class ViewCounter:
+    """Registra vistas y las vuelca a MySQL por lotes"""
+
+    def __init__(self, buffer: ViewBuffer):
+        self._buffer = buffer
+        self._oldest_pending_at: Optional[float] = None
+
+        # ── Métricas ──────────────────────────────────────────
+        self._recorded = 0
+        self._dropped = 0
+        self._flushed_views = 0
+        self._flushes = 0
+        self._failures = 0
+        self._last_flush_at: Optional[float] = None
+        self._last_flush_lag = 0.0
+
+    async def record(self, pin_id: str) -> None:
+        """Registrar una vista (si el buffer falla, la vista se pierde)"""
+        try:
+            await self._buffer.add(pin_id)
+        except Exception as e:
+            self._dropped += 1
+            logger.warning(f"⚠️ Could not buffer view for pin {pin_id}: {e}")
+            return
+        self._recorded += 1
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.time()
+
+    async def flush(self) -> int:
+        """Volcar las vistas pendientes. Devuelve el número de vistas escritas"""
+        from internal.pines.infrastructure.adapters.mysql_pin_repository import (
+            MySQLPinRepository,
+        )
+
+        oldest = self._oldest_pending_at
+        self._oldest_pending_at = None
+        counts = await self._buffer.drain()
+        if not counts:
+            return 0
+
+        try:
+            async with session_scope() as db, UnitOfWork(db):
+                await MySQLPinRepository(db).add_views_bulk(counts)
+        except BaseException:
+            self._failures += 1
+            await self._buffer.restore(counts)
+            if oldest is not None:
+                self._oldest_pending_at = min(oldest, self._oldest_pending_at or oldest)
+            raise
+
+        now = time.time()
+        total = sum(counts.values())
+        self._flushes += 1
+        self._flushed_views += total
+        self._last_flush_at = now
+        self._last_flush_lag = now - oldest if oldest is not None else 0.0
+        logger.debug(f"👁️ Flushed {total} views for {len(counts)} pins")
+        return total
+
+    async def stats(self) -> Dict[str, Any]:
+        pending_pins, pending_views = await self._buffer.pending()
+        now = time.time()
+        return {
+            "backend": type(self._buffer).__name__,
+            "pending_pins": pending_pins,
+            "pending_views": pending_views,
+            "current_lag_seconds": round(now - self._oldest_pending_at, 3)
+            if self._oldest_pending_at is not None else 0.0,
+            "last_flush_lag_seconds": round(self._last_flush_lag, 3),
+            "last_flush_at": self._last_flush_at,
+            "recorded": self._recorded,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "flushed_views": self._flushed_views,
+            "flush_failures": self._failures,
+        }
+
+
+def _create_buffer() -> ViewBuffer:
+    if settings.VIEW_BUFFER_BACKEND == "redis":
+        return RedisViewBuffer()
+    return MemoryViewBuffer()
+
+
+# Instancia global
+view_counter = ViewCounter(_create_buffer())
+
+register_task(PeriodicTask(
+    "pin_views_flush",
+    settings.VIEW_FLUSH_INTERVAL_SECONDS,
+    view_counter.flush,
+))
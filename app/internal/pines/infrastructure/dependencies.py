@@ -2,10 +2,12 @@
 Inyección de dependencias para Pins
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.notification_outbox import NotificationOutbox
+from core.unit_of_work import UnitOfWork
 from internal.pines.infrastructure.adapters.mysql_pin_repository import MySQLPinRepository
+from internal.pines.infrastructure.adapters.mysql_feed_repository import MySQLFeedRepository
 from internal.pines.infrastructure.http.pin_controller import PinController
 from internal.pines.application.use_cases.create_pin import CreatePinUseCase
 from internal.pines.application.use_cases.get_pin import GetPinUseCase
@@ -16,19 +18,29 @@ from internal.pines.application.use_cases.delete_pin import DeletePinUseCase
 from internal.pines.application.use_cases.search_pins import SearchPinsUseCase
 from internal.pines.application.use_cases.get_feed import GetFeedUseCase
 from internal.pines.application.use_cases.get_trending import GetTrendingUseCase
+from internal.pines.application.use_cases.get_viewer_flags import GetViewerFlagsUseCase
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.infrastructure.dependencies import get_user_summary_loader
 
 
-def get_pin_controller(db: Session = Depends(get_db)) -> PinController:
+def get_pin_controller(
+    db: DBSession = Depends(get_db),
+    user_loader: UserSummaryLoader = Depends(get_user_summary_loader),
+) -> PinController:
     repo = MySQLPinRepository(db)
+    feed_repo = MySQLFeedRepository(db)
+    uow = UnitOfWork(db)
 
     return PinController(
-        create_uc=CreatePinUseCase(repo),
+        create_uc=CreatePinUseCase(repo, uow, feed_repo, NotificationOutbox(db)),
         get_uc=GetPinUseCase(repo),
         get_pins_uc=GetPinsUseCase(repo),
         get_user_pins_uc=GetUserPinsUseCase(repo),
-        update_uc=UpdatePinUseCase(repo),
-        delete_uc=DeletePinUseCase(repo),
+        update_uc=UpdatePinUseCase(repo, uow, feed_repo),
+        delete_uc=DeletePinUseCase(repo, uow),
         search_uc=SearchPinsUseCase(repo),
-        get_feed_uc=GetFeedUseCase(repo),
+        get_feed_uc=GetFeedUseCase(repo, feed_repo),
         get_trending_uc=GetTrendingUseCase(repo),
+        viewer_flags_uc=GetViewerFlagsUseCase(repo),
+        user_loader=user_loader,
     )
\ No newline at end of file
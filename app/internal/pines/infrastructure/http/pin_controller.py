@@ -1,6 +1,8 @@
 """
 Controlador HTTP de Pins
 """
+from typing import Dict, Optional
+
 from app.internal.pines.domain.entities import pin
 from internal.pines.application.use_cases.create_pin import CreatePinUseCase
 from internal.pines.application.use_cases.get_pin import GetPinUseCase
@@ -11,8 +13,11 @@ from internal.pines.application.use_cases.delete_pin import DeletePinUseCase
 from internal.pines.application.use_cases.search_pins import SearchPinsUseCase
 from internal.pines.application.use_cases.get_feed import GetFeedUseCase
 from internal.pines.application.use_cases.get_trending import GetTrendingUseCase
+from internal.pines.application.use_cases.get_viewer_flags import GetViewerFlagsUseCase
 
 from internal.pines.domain.entities.pin import Pin, PinResponse, PinSummary
+from internal.users.application.user_summary_loader import UserSummaryLoader
+from internal.users.domain.entities.user import UserSummary
 from internal.pines.application.schemas.pin_schemas import (
     CreatePinRequest,
     UpdatePinRequest,
@@ -36,6 +41,8 @@ class PinController:
         search_uc: SearchPinsUseCase,
         get_feed_uc: GetFeedUseCase,
         get_trending_uc: GetTrendingUseCase,
+        viewer_flags_uc: GetViewerFlagsUseCase,
+        user_loader: UserSummaryLoader,
     ):
         self._create_uc = create_uc
         self._get_uc = get_uc
@@ -46,18 +53,32 @@ class PinController:
         self._search_uc = search_uc
         self._get_feed_uc = get_feed_uc
         self._get_trending_uc = get_trending_uc
+        self._viewer_flags_uc = viewer_flags_uc
+        self._users = user_loader
 
     # ── Mapeo ─────────────────────────────────────────────────
 
+    async def _viewer_flags(self, pins: list, viewer_id: Optional[str]) -> dict:
+        """Likes/guardados del usuario para toda la página (una consulta)"""
+        return await self._viewer_flags_uc.execute(viewer_id, [p.id for p in pins])
+
+    async def _authors(self, pins: list) -> Dict[str, UserSummary]:
+        """Autores de los pins que no traen ya los datos del usuario (JOIN)"""
+        return await self._users.load_many(
+            p.user_id for p in pins if not getattr(p, "user_username", None)
+        )
+
     @staticmethod
-    def _to_response(pin: Pin) -> PinResponse:
+    def _to_response(
+        pin: Pin, flags: Optional[dict] = None, author: Optional[UserSummary] = None
+    ) -> PinResponse:
         return PinResponse(
         id=pin.id,
         user_id=pin.user_id,
-        user_username=getattr(pin, "user_username", ""),      # Usa el valor si existe
-        user_full_name=getattr(pin, "user_full_name", ""),
-        user_avatar_url=getattr(pin, "user_avatar_url", None),
-        user_is_verified=getattr(pin, "user_is_verified", False),
+        user_username=author.username if author else getattr(pin, "user_username", ""),
+        user_full_name=author.full_name if author else getattr(pin, "user_full_name", ""),
+        user_avatar_url=author.avatar_url if author else getattr(pin, "user_avatar_url", None),
+        user_is_verified=author.is_verified if author else getattr(pin, "user_is_verified", False),
         image_url=pin.image_url,
         title=pin.title,
         description=pin.description,
@@ -78,24 +99,28 @@ class PinController:
         is_private=pin.is_private,
         created_at=pin.created_at,
         updated_at=pin.updated_at,
-        is_liked_by_me=getattr(pin, "is_liked_by_me", False),
-        is_saved_by_me=getattr(pin, "is_saved_by_me", False),
+        is_liked_by_me=pin.id in flags["liked"] if flags else getattr(pin, "is_liked_by_me", False),
+        is_saved_by_me=pin.id in flags["saved"] if flags else getattr(pin, "is_saved_by_me", False),
     )
 
     @staticmethod
-    def _to_summary(pin: Pin) -> PinSummary:
+    def _to_summary(
+        pin: Pin, flags: Optional[dict] = None, author: Optional[UserSummary] = None
+    ) -> PinSummary:
         """Convierte entidad Pin a PinSummary"""
         return PinSummary(
             id=pin.id,
             user_id=pin.user_id,
-            user_username="",               # TODO: obtener del usuario real
-            user_avatar_url=None,           # TODO: obtener del usuario real
+            user_username=author.username if author else getattr(pin, "user_username", ""),
+            user_avatar_url=author.avatar_url if author else getattr(pin, "user_avatar_url", None),
             image_url=pin.image_url,
             title=pin.title,
             category=pin.category,
             likes_count=pin.likes_count,
             saves_count=pin.saves_count,
             created_at=pin.created_at,
+            is_liked_by_me=pin.id in flags["liked"] if flags else False,
+            is_saved_by_me=pin.id in flags["saved"] if flags else False,
         )
 
     # ── CRUD ──────────────────────────────────────────────────
@@ -118,11 +143,12 @@ class PinController:
             tags=body.tags,
             is_private=body.is_private,
         )
-        return self._to_response(pin)
+        return self._to_response(pin, author=await self._users.load(pin.user_id))
 
     async def get_pin(self, pin_id: str, user_id: str = None) -> PinResponse:
         pin = await self._get_uc.execute(pin_id, requesting_user_id=user_id)
-        return self._to_response(pin)
+        flags = await self._viewer_flags([pin], user_id)
+        return self._to_response(pin, flags, await self._users.load(pin.user_id))
 
     async def get_pins(
         self,
@@ -131,6 +157,8 @@ class PinController:
         category: str = None,
         season: str = None,
         price_range: str = None,
+        cursor: str = None,
+        viewer_id: str = None,
     ) -> PinListResponse:
         result = await self._get_pins_uc.execute(
             limit=limit,
@@ -138,13 +166,18 @@ class PinController:
             category=category,
             season=season,
             price_range=price_range,
+            cursor=cursor,
         )
+        authors = await self._authors(result["pins"])
+        flags = await self._viewer_flags(result["pins"], viewer_id)
         return PinListResponse(
-            pins=[self._to_response(p) for p in result["pins"]],
+            pins=[self._to_response(p, flags, authors.get(p.user_id)) for p in result["pins"]],
             total=result["total"],
+            count=result["count"],
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     async def get_user_pins(
@@ -153,19 +186,25 @@ class PinController:
         current_user_id: str = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str = None,
     ) -> PinListResponse:
         result = await self._get_user_pins_uc.execute(
             user_id=user_id,
             requesting_user_id=current_user_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+        authors = await self._authors(result["pins"])
+        flags = await self._viewer_flags(result["pins"], current_user_id)
         return PinListResponse(
-            pins=[self._to_response(p) for p in result["pins"]],
+            pins=[self._to_response(p, flags, authors.get(p.user_id)) for p in result["pins"]],
             total=result["total"],
+            count=result["count"],
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     async def update_pin(
@@ -188,7 +227,7 @@ class PinController:
             tags=body.tags,
             is_private=body.is_private,
         )
-        return self._to_response(pin)
+        return self._to_response(pin, author=await self._users.load(pin.user_id))
 
     async def delete_pin(self, pin_id: str, user_id: str) -> MessageResponse:
         await self._delete_uc.execute(pin_id=pin_id, user_id=user_id)
@@ -197,13 +236,15 @@ class PinController:
     # ── Búsqueda ──────────────────────────────────────────────
 
     async def search_pins(
-        self, query: str, limit: int = 20, offset: int = 0
+        self, query: str, limit: int = 20, offset: int = 0, viewer_id: str = None
     ) -> PinSummaryListResponse:
         result = await self._search_uc.execute(
             query=query, limit=limit, offset=offset
         )
+        authors = await self._authors(result["pins"])
+        flags = await self._viewer_flags(result["pins"], viewer_id)
         return PinSummaryListResponse(
-            pins=[self._to_summary(p) for p in result["pins"]],
+            pins=[self._to_summary(p, flags, authors.get(p.user_id)) for p in result["pins"]],
             total=result["total"],
             limit=result["limit"],
             offset=result["offset"],
@@ -213,27 +254,32 @@ class PinController:
     # ── Feed ──────────────────────────────────────────────────
 
     async def get_feed(
-        self, user_id: str, limit: int = 20, offset: int = 0
+        self, user_id: str, limit: int = 20, offset: int = 0, cursor: str = None
     ) -> PinFeedResponse:
         result = await self._get_feed_uc.execute(
-            user_id=user_id, limit=limit, offset=offset
+            user_id=user_id, limit=limit, offset=offset, cursor=cursor
         )
+        authors = await self._authors(result["pins"])
+        flags = await self._viewer_flags(result["pins"], user_id)
         return PinFeedResponse(
-            pins=[self._to_response(p) for p in result["pins"]],
+            pins=[self._to_response(p, flags, authors.get(p.user_id)) for p in result["pins"]],
             limit=result["limit"],
             offset=result["offset"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
 
     # ── Trending ──────────────────────────────────────────────
 
     async def get_trending(
-        self, limit: int = 20, hours: int = 24
+        self, limit: int = 20, hours: int = 24, viewer_id: str = None
     ) -> PinTrendingResponse:
         result = await self._get_trending_uc.execute(
             limit=limit, hours=hours
         )
+        authors = await self._authors(result["pins"])
+        flags = await self._viewer_flags(result["pins"], viewer_id)
         return PinTrendingResponse(
-            pins=[self._to_summary(p) for p in result["pins"]],
+            pins=[self._to_summary(p, flags, authors.get(p.user_id)) for p in result["pins"]],
             hours=result["hours"],
         )
\ No newline at end of file
@@ -18,8 +18,12 @@ from internal.pines.application.schemas.pin_schemas import (
 )
 from internal.pines.infrastructure.http.pin_controller import PinController
 from internal.pines.infrastructure.dependencies import get_pin_controller
-from internal.users.infrastructure.middlewares.auth_middleware import get_current_user_id
+from internal.users.infrastructure.middlewares.auth_middleware import (
+    get_current_user_id,
+    get_optional_user_id,
+)
 from core.image_upload import image_service
+from core.pagination import CursorParam
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +40,13 @@ router = APIRouter(prefix="/pins", tags=["Pins"])
 async def get_feed(
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: PinController = Depends(get_pin_controller),
     user_id: str = Depends(get_current_user_id),
 ):
-    return await controller.get_feed(user_id=user_id, limit=limit, offset=offset)
+    return await controller.get_feed(
+        user_id=user_id, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 @router.get(
@@ -51,8 +58,9 @@ async def get_trending(
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     hours: Annotated[int, Query(ge=1, le=168)] = 24,
     controller: PinController = Depends(get_pin_controller),
+    viewer_id: Optional[str] = Depends(get_optional_user_id),
 ):
-    return await controller.get_trending(limit=limit, hours=hours)
+    return await controller.get_trending(limit=limit, hours=hours, viewer_id=viewer_id)
 
 
 @router.get(
@@ -65,9 +73,13 @@ async def search_pins(
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
     controller: PinController = Depends(get_pin_controller),
+    viewer_id: Optional[str] = Depends(get_optional_user_id),
 ):
+    """Resultados por relevancia; se pagina con `offset` (sin cursor)"""
     try:
-        return await controller.search_pins(query=q, limit=limit, offset=offset)
+        return await controller.search_pins(
+            query=q, limit=limit, offset=offset, viewer_id=viewer_id
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -85,7 +97,9 @@ async def get_pins(
     category: Optional[str] = Query(None, example="casual"),
     season: Optional[str] = Query(None, example="primavera"),
     price_range: Optional[str] = Query(None, example="500_1000"),
+    cursor: CursorParam = None,
     controller: PinController = Depends(get_pin_controller),
+    viewer_id: Optional[str] = Depends(get_optional_user_id),
 ):
     return await controller.get_pins(
         limit=limit,
@@ -93,6 +107,8 @@ async def get_pins(
         category=category,
         season=season,
         price_range=price_range,
+        cursor=cursor,
+        viewer_id=viewer_id,
     )
 
 
@@ -107,11 +123,16 @@ async def get_user_pins(
     user_id: str,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
     controller: PinController = Depends(get_pin_controller),
     current_user_id: str = Depends(get_current_user_id),
 ):
     return await controller.get_user_pins(
-        user_id, current_user_id=current_user_id, limit=limit, offset=offset
+        user_id,
+        current_user_id=current_user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
 
 
@@ -5,11 +5,13 @@ from datetime import datetime, timezone
 from typing import Optional, List
 from internal.users.domain.entities.user import User
 from internal.users.domain.repositories.user_repository import UserRepository
+from core.unit_of_work import UnitOfWork
 
 
 class CreateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, uow: UnitOfWork):
         self._repo = user_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -53,4 +55,5 @@ class CreateUserUseCase:
             last_login=None,
         )
 
-        return await self._repo.create(user)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.create(user)
\ No newline at end of file
@@ -2,11 +2,13 @@
 Caso de uso: Eliminar (desactivar) cuenta de usuario
 """
 from internal.users.domain.repositories.user_repository import UserRepository
+from core.unit_of_work import UnitOfWork
 
 
 class DeleteUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, uow: UnitOfWork):
         self._repo = user_repository
+        self._uow = uow
 
     async def execute(self, user_id: str, requesting_user_id: str) -> bool:
         if user_id != requesting_user_id:
@@ -17,4 +19,5 @@ class DeleteUserUseCase:
             raise ValueError("Usuario no encontrado")
 
         # Soft delete
-        return await self._repo.delete(user_id)
\ No newline at end of file
+        async with self._uow:
+            return await self._repo.delete(user_id)
\ No newline at end of file
@@ -2,16 +2,19 @@
 Caso de uso: Login de usuario con seguridad
 """
 from datetime import datetime, timezone, timedelta
+from typing import Optional
 from internal.users.domain.entities.user import User
 from internal.users.domain.repositories.user_repository import UserRepository
+from core.unit_of_work import UnitOfWork
 
 MAX_LOGIN_ATTEMPTS = 5
 LOCK_DURATION_MINUTES = 30
 
 
 class LoginUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, uow: UnitOfWork):
         self._repo = user_repository
+        self._uow = uow
 
     async def execute(self, identity: str) -> User:
         """
@@ -34,19 +37,28 @@ class LoginUserUseCase:
 
         return user
 
-    async def on_login_success(self, user_id: str) -> None:
-        """Llamar después de verificar password exitosamente"""
-        await self._repo.reset_login_attempts(user_id)
-        await self._repo.update_last_login(user_id)
+    async def on_login_success(
+        self, user_id: str, new_password_hash: Optional[str] = None
+    ) -> None:
+        """
+        Llamar después de verificar password exitosamente. Si el hash se
+        regeneró con otro coste de bcrypt se guarda en el mismo commit.
+        """
+        async with self._uow:
+            await self._repo.reset_login_attempts(user_id)
+            await self._repo.update_last_login(user_id)
+            if new_password_hash:
+                await self._repo.update_password_hash(user_id, new_password_hash)
 
     async def on_login_failure(self, user_id: str, current_attempts: int) -> None:
         """Llamar cuando el password es incorrecto"""
         new_attempts = current_attempts + 1
-        await self._repo.increment_login_attempts(user_id)
+        async with self._uow:
+            await self._repo.increment_login_attempts(user_id)
 
-        # Bloquear cuenta si se exceden intentos
-        if new_attempts >= MAX_LOGIN_ATTEMPTS:
-            lock_until = datetime.now(timezone.utc) + timedelta(
-                minutes=LOCK_DURATION_MINUTES
-            )
-            await self._repo.lock_account(user_id, lock_until)
\ No newline at end of file
+            # Bloquear cuenta si se exceden intentos
+            if new_attempts >= MAX_LOGIN_ATTEMPTS:
+                lock_until = datetime.now(timezone.utc) + timedelta(
+                    minutes=LOCK_DURATION_MINUTES
+                )
+                await self._repo.lock_account(user_id, lock_until)
\ No newline at end of file
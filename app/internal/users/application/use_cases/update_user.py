@@ -4,11 +4,13 @@ Caso de uso: Actualizar perfil de usuario
 from datetime import datetime, timezone
 from internal.users.domain.entities.user import User
 from internal.users.domain.repositories.user_repository import UserRepository
+from core.unit_of_work import UnitOfWork
 
 
 class UpdateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, uow: UnitOfWork):
         self._repo = user_repository
+        self._uow = uow
 
     async def execute(
         self,
@@ -28,7 +30,8 @@ class UpdateUserUseCase:
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         updated_user = user.model_copy(update=update_data)
-        return await self._repo.update(updated_user)
+        async with self._uow:
+            return await self._repo.update(updated_user)
 
     async def change_password(
         self,
@@ -44,4 +47,5 @@ class UpdateUserUseCase:
             "password_hash": new_password_hash,
             "updated_at": datetime.now(timezone.utc),
         })
-        await self._repo.update(updated_user)
\ No newline at end of file
+        async with self._uow:
+            await self._repo.update(updated_user)
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Cargador por request de resúmenes de usuario (autor de comentarios, likes,
+follows y pins)
+
+Los controladores piden los autores de toda la página de golpe y el
+cargador los resuelve con una sola llamada a `get_summaries` (cache
+compartida + un IN para los que falten). Vive lo que dura el request: los
+ids ya resueltos no se vuelven a pedir aunque otro controlador los necesite.
+"""
+from typing import Dict, Iterable, Optional, Set
+
+from internal.users.domain.entities.user import UserSummary
+from internal.users.domain.repositories.user_repository import UserRepository
+
+
+class UserSummaryLoader:
+
+    def __init__(self, user_repository: UserRepository):
+        self._repo = user_repository
+        self._loaded: Dict[str, Optional[UserSummary]] = {}
+        self._pending: Set[str] = set()
+
+    def prime(self, user_ids: Iterable[str]) -> None:
+        """Anotar ids para resolverlos en la próxima carga"""
+        self._pending.update(
+            user_id for user_id in user_ids
+            if user_id and user_id not in self._loaded
+        )
+
+    async def load_many(self, user_ids: Iterable[str]) -> Dict[str, UserSummary]:
+        """user_id -> UserSummary (los ids inexistentes no aparecen)"""
+        user_ids = list(user_ids)
+        self.prime(user_ids)
+        if self._pending:
+            pending = list(self._pending)
+            self._pending.clear()
+            found = await self._repo.get_summaries(pending)
+            for user_id in pending:
+                self._loaded[user_id] = found.get(user_id)
+        return {
+            user_id: self._loaded[user_id]
+            for user_id in user_ids
+            if self._loaded.get(user_id) is not None
+        }
+
+    async def load(self, user_id: str) -> Optional[UserSummary]:
+        return (await self.load_many([user_id])).get(user_id)
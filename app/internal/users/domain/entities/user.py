@@ -71,6 +71,26 @@ class UserProfile(BaseModel):
     class Config:
         from_attributes = True
 
+class UserSummary(BaseModel):
+    """Datos mínimos del autor para listas (comentarios, likes, follows, pins)"""
+    id: str
+    username: str
+    full_name: str
+    avatar_url: Optional[str] = None
+    is_verified: bool = False
+
+    class Config:
+        from_attributes = True
+
+class Principal(BaseModel):
+    """Identidad autenticada: lo que la capa de auth consulta en cada request"""
+    id: str
+    role: str = "user"
+    is_active: bool = True
+
+    class Config:
+        from_attributes = True
+
 class UserMe(BaseModel):
     """Datos del usuario autenticado - Incluye email pero no password"""
     id: str
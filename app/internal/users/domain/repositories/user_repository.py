@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
-from app.internal.users.domain.entities.user import User
+from app.internal.users.domain.entities.user import User, UserSummary, Principal
 
 class UserRepository(ABC):
     """Interface del repositorio de usuarios (Port)"""
@@ -14,6 +14,16 @@ class UserRepository(ABC):
     async def get_by_id(self, user_id: str) -> Optional[User]:
         pass
     
+    @abstractmethod
+    async def get_summaries(self, user_ids: List[str]) -> Dict[str, UserSummary]:
+        """Resúmenes de varios usuarios (user_id -> UserSummary), una sola consulta"""
+        pass
+    
+    @abstractmethod
+    async def get_principal(self, user_id: str) -> Optional[Principal]:
+        """Identidad para autenticación (id, rol, activo)"""
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         pass
@@ -74,6 +84,11 @@ class UserRepository(ABC):
         """Bloquear cuenta temporalmente"""
         pass
     
+    @abstractmethod
+    async def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        """Reemplazar el hash (rehash con otro coste de bcrypt)"""
+        pass
+    
     @abstractmethod
     async def update_last_login(self, user_id: str) -> None:
         """Actualizar timestamp de último login"""
@@ -101,4 +116,13 @@ class UserRepository(ABC):
         }
         """
         pass
-    
\ No newline at end of file
+
+    @abstractmethod
+    async def reconcile_counters(
+        self, after_id: str, batch_size: int
+    ) -> Tuple[Optional[str], int]:
+        """
+        Corregir los contadores desnormalizados de un lote de usuarios.
+        Returns: (último id procesado o None al terminar, usuarios corregidos)
+        """
+        pass
@@ -1,23 +1,37 @@
 """
 Implementación MySQL (SQLAlchemy) del repositorio de Users (Adapter)
 """
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timezone
 import uuid
 import json
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import select, update, func, or_
 
-from internal.users.domain.entities.user import User
+from core.cache import CacheBackend, cache as default_cache
+from core.connection import DBSession
+from core.database.config import settings
+from core.unit_of_work import after_commit
+
+from internal.users.domain.entities.user import User, UserSummary, Principal
 from internal.users.domain.repositories.user_repository import UserRepository
 from internal.users.infrastructure.database.user_model import UserModel
+from internal.users.infrastructure.adapters.user_counters import (
+    USER_COUNTERS,
+    invalidate_user_stats,
+    user_stats_cache,
+)
+from core.database.models import PinModel, FollowModel, BoardModel
 
 
 class MySQLUserRepository(UserRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: DBSession, cache: Optional[CacheBackend] = None):
         self._db = db
+        # Cache compartida de resúmenes: user_id -> UserSummary
+        self._summaries = cache if cache is not None else default_cache.namespace("user_summary")
+        # Identidad para auth: user_id -> Principal (ver auth_middleware)
+        self._principals = default_cache.namespace("principal")
 
     # ── Mapeo ─────────────────────────────────────────────────
 
@@ -92,43 +106,96 @@ class MySQLUserRepository(UserRepository):
             last_login=None,
         )
         self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        await self._db.flush()
+        await self._db.refresh(model)
         return self._to_entity(model)
 
     async def get_by_id(self, user_id: str) -> Optional[User]:
-        model = self._db.query(UserModel).filter(
-            UserModel.id == user_id,
-        ).first()
+        model = await self._db.scalar(
+            select(UserModel).where(UserModel.id == user_id)
+        )
         return self._to_entity(model) if model else None
 
+    async def get_summaries(self, user_ids: List[str]) -> Dict[str, UserSummary]:
+        """Lee de la cache y resuelve los que falten con un único IN (...)"""
+        return await self._summaries.get_many_or_set(
+            list(dict.fromkeys(user_ids)),
+            self._load_summaries,
+            settings.USER_SUMMARY_CACHE_TTL_SECONDS,
+        )
+
+    async def _load_summaries(self, user_ids: List[str]) -> Dict[str, UserSummary]:
+        result = await self._db.execute(
+            select(
+                UserModel.id,
+                UserModel.username,
+                UserModel.full_name,
+                UserModel.avatar_url,
+                UserModel.is_verified,
+            ).where(UserModel.id.in_(user_ids))
+        )
+        return {
+            row.id: UserSummary(
+                id=row.id,
+                username=row.username,
+                full_name=row.full_name,
+                avatar_url=row.avatar_url,
+                is_verified=row.is_verified or False,
+            )
+            for row in result.all()
+        }
+
+    async def get_principal(self, user_id: str) -> Optional[Principal]:
+        """Cacheado; las cuentas desactivadas también se cachean (is_active=False)"""
+        return await self._principals.get_or_set(
+            user_id,
+            lambda: self._load_principal(user_id),
+            settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+
+    async def _load_principal(self, user_id: str) -> Optional[Principal]:
+        row = (await self._db.execute(
+            select(UserModel.id, UserModel.role, UserModel.is_active)
+            .where(UserModel.id == user_id)
+        )).first()
+        if row is None:
+            return None
+        return Principal(id=row.id, role=row.role or "user", is_active=bool(row.is_active))
+
+    async def _evict(self, user_id: str) -> None:
+        """Quitar de las caches de resumen e identidad (después del commit)"""
+        await self._summaries.delete(user_id)
+        await self._principals.delete(user_id)
+
     async def get_by_email(self, email: str) -> Optional[User]:
-        model = self._db.query(UserModel).filter(
-            UserModel.email == email,
-        ).first()
+        model = await self._db.scalar(
+            select(UserModel).where(UserModel.email == email)
+        )
         return self._to_entity(model) if model else None
 
     async def get_by_username(self, username: str) -> Optional[User]:
-        model = self._db.query(UserModel).filter(
-            UserModel.username == username,
-        ).first()
+        model = await self._db.scalar(
+            select(UserModel).where(UserModel.username == username)
+        )
         return self._to_entity(model) if model else None
 
     async def get_by_identity(self, identity: str) -> Optional[User]:
         """Busca por email o username"""
         identity_lower = identity.lower().strip()
-        model = self._db.query(UserModel).filter(
-            or_(
-                UserModel.email == identity_lower,
-                UserModel.username == identity_lower,
+        model = await self._db.scalar(
+            select(UserModel).where(
+                or_(
+                    UserModel.email == identity_lower,
+                    UserModel.username == identity_lower,
+                )
             )
-        ).first()
+        )
         return self._to_entity(model) if model else None
 
     async def update(self, user: User) -> User:
-        model = self._db.query(UserModel).filter(
-            UserModel.id == user.id
-        ).first()
+        model = await self._db.scalar(
+            select(UserModel).where(UserModel.id == user.id)
+        )
         if model:
             model.full_name = user.full_name
             model.bio = user.bio
@@ -138,50 +205,51 @@ class MySQLUserRepository(UserRepository):
             model.password_hash = user.password_hash
             model.is_active = user.is_active
             model.updated_at = datetime.now(timezone.utc)
-            self._db.commit()
-            self._db.refresh(model)
+            await self._db.flush()
+            await self._db.refresh(model)
+            after_commit(self._db, self._evict, user.id)
             return self._to_entity(model)
         return user
 
     async def delete(self, user_id: str) -> bool:
         """Soft delete - desactiva la cuenta"""
-        model = self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).first()
+        model = await self._db.scalar(
+            select(UserModel).where(UserModel.id == user_id)
+        )
         if model:
             model.is_active = False
             model.updated_at = datetime.now(timezone.utc)
-            self._db.commit()
+            await self._db.flush()
+            after_commit(self._db, self._evict, user_id)
             return True
         return False
 
     # ── Validaciones ──────────────────────────────────────────
 
     async def exists_by_email(self, email: str) -> bool:
-        count = (
-            self._db.query(func.count(UserModel.id))
-            .filter(UserModel.email == email)
-            .scalar()
+        count = await self._db.scalar(
+            select(func.count(UserModel.id))
+            .where(UserModel.email == email)
         )
         return (count or 0) > 0
 
     async def exists_by_username(self, username: str) -> bool:
-        count = (
-            self._db.query(func.count(UserModel.id))
-            .filter(UserModel.username == username)
-            .scalar()
+        count = await self._db.scalar(
+            select(func.count(UserModel.id))
+            .where(UserModel.username == username)
         )
         return (count or 0) > 0
 
     # ── Seguridad / Login ─────────────────────────────────────
 
     async def update_last_login(self, user_id: str) -> None:
-        self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).update({
-            UserModel.last_login: datetime.now(timezone.utc),
-        })
-        self._db.commit()
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                last_login=datetime.now(timezone.utc),
+            )
+        )
 
     async def update_login_attempts(
         self,
@@ -189,38 +257,51 @@ class MySQLUserRepository(UserRepository):
         attempts: int,
         locked_until: Optional[datetime],
     ) -> None:
-        self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).update({
-            UserModel.login_attempts: attempts,
-            UserModel.locked_until: locked_until,
-        })
-        self._db.commit()
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                login_attempts=attempts,
+                locked_until=locked_until,
+            )
+        )
 
     async def increment_login_attempts(self, user_id: str) -> None:
-        self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).update({
-            UserModel.login_attempts: UserModel.login_attempts + 1,
-        })
-        self._db.commit()
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                login_attempts=UserModel.login_attempts + 1,
+            )
+        )
 
     async def reset_login_attempts(self, user_id: str) -> None:
-        self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).update({
-            UserModel.login_attempts: 0,
-            UserModel.locked_until: None,
-        })
-        self._db.commit()
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                login_attempts=0,
+                locked_until=None,
+            )
+        )
 
     async def lock_account(self, user_id: str, until: datetime) -> None:
-        self._db.query(UserModel).filter(
-            UserModel.id == user_id
-        ).update({
-            UserModel.locked_until: until,
-        })
-        self._db.commit()
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                locked_until=until,
+            )
+        )
+
+    async def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                password_hash=password_hash,
+            )
+        )
 
     # ── Búsqueda ──────────────────────────────────────────────
 
@@ -231,9 +312,9 @@ class MySQLUserRepository(UserRepository):
         offset: int = 0,
     ) -> List[User]:
         search_term = f"%{query}%"
-        models = (
-            self._db.query(UserModel)
-            .filter(
+        models = await self._db.scalars(
+            select(UserModel)
+            .where(
                 UserModel.is_active == True,
                 or_(
                     UserModel.username.ilike(search_term),
@@ -243,59 +324,95 @@ class MySQLUserRepository(UserRepository):
             .order_by(UserModel.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
-        return [self._to_entity(m) for m in models]
+        return [self._to_entity(m) for m in models.all()]
 
     # ── Estadísticas ──────────────────────────────────────────
 
     async def get_user_stats(self, user_id: str) -> dict:
         """
-        Obtener estadísticas del usuario.
-        TODO: Integrar con tablas reales de pins, follows, boards.
-        Por ahora retorna conteos básicos.
+        Estadísticas del usuario desde los contadores desnormalizados
+        (una sola fila, cacheada; se invalida al cambiar un contador)
         """
-        # Importar modelos si existen
+        cached = await user_stats_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        row = (await self._db.execute(
+            select(
+                UserModel.pins_count,
+                UserModel.followers_count,
+                UserModel.following_count,
+                UserModel.boards_count,
+            ).where(UserModel.id == user_id)
+        )).first()
         stats = {
-            "total_pins": 0,
-            "total_followers": 0,
-            "total_following": 0,
-            "total_boards": 0,
+            "total_pins": row.pins_count if row else 0,
+            "total_followers": row.followers_count if row else 0,
+            "total_following": row.following_count if row else 0,
+            "total_boards": row.boards_count if row else 0,
         }
+        await user_stats_cache.set(user_id, stats, settings.USER_STATS_CACHE_TTL_SECONDS)
+        return stats
 
-        try:
-            from core.database.models import PinModel
-            stats["total_pins"] = (
-                self._db.query(func.count(PinModel.id))
-                .filter(PinModel.user_id == user_id)
-                .scalar() or 0
-            )
-        except ImportError:
-            pass
-
-        try:
-            from core.database.models import FollowModel
-            stats["total_followers"] = (
-                self._db.query(func.count(FollowModel.id))
-                .filter(FollowModel.following_id == user_id)
-                .scalar() or 0
-            )
-            stats["total_following"] = (
-                self._db.query(func.count(FollowModel.id))
-                .filter(FollowModel.follower_id == user_id)
-                .scalar() or 0
+    async def reconcile_counters(
+        self, after_id: str, batch_size: int
+    ) -> Tuple[Optional[str], int]:
+        """
+        Recalcular con COUNT(*) los contadores de los `batch_size` usuarios
+        siguientes a `after_id` y corregir los que no cuadren. La corrección
+        es condicional al valor leído, así no bloquea ni pisa los
+        incrementos concurrentes.
+        Devuelve (último id del lote o None si no quedan más, corregidos).
+        """
+        rows = (await self._db.execute(
+            select(UserModel.id, *(getattr(UserModel, f) for f in USER_COUNTERS))
+            .where(UserModel.id > after_id)
+            .order_by(UserModel.id)
+            .limit(batch_size)
+        )).all()
+        if not rows:
+            return None, 0
+        user_ids = [row.id for row in rows]
+
+        async def grouped(column) -> Dict[str, int]:
+            result = await self._db.execute(
+                select(column, func.count())
+                .where(column.in_(user_ids))
+                .group_by(column)
             )
-        except ImportError:
-            pass
-
-        try:
-            from core.database.models import BoardModel
-            stats["total_boards"] = (
-                self._db.query(func.count(BoardModel.id))
-                .filter(BoardModel.user_id == user_id)
-                .scalar() or 0
+            return dict(result.all())
+
+        actual = {
+            "pins_count": await grouped(PinModel.user_id),
+            "followers_count": await grouped(FollowModel.following_id),
+            "following_count": await grouped(FollowModel.follower_id),
+            "boards_count": await grouped(BoardModel.user_id),
+        }
+
+        drifted = []
+        for row in rows:
+            values = {
+                field: actual[field].get(row.id, 0)
+                for field in USER_COUNTERS
+                if (getattr(row, field) or 0) != actual[field].get(row.id, 0)
+            }
+            if not values:
+                continue
+            # Solo si nadie tocó el contador desde la lectura: un incremento
+            # confirmado entre medias no se pisa (se revisa en la próxima pasada)
+            result = await self._db.execute(
+                update(UserModel)
+                .where(
+                    UserModel.id == row.id,
+                    *(getattr(UserModel, field) == getattr(row, field) for field in values),
+                )
+                .values(values)
             )
-        except ImportError:
-            pass
+            if result.rowcount:
+                drifted.append(row.id)
+        if drifted:
+            after_commit(self._db, invalidate_user_stats, drifted)
 
-        return stats
\ No newline at end of file
+        last_id = user_ids[-1] if len(rows) == batch_size else None
+        return last_id, len(drifted)
@@ -0,0 +1,72 @@
+"""
+Contadores desnormalizados de usuario (pins, seguidores, seguidos, tableros)
+
+Los repositorios de follows, pins y boards los actualizan en la misma
+transacción que la fila que crean o borran (la unidad de trabajo del caso
+de uso), y una tarea periódica los recalcula por lotes para corregir
+cualquier deriva.
+"""
+import logging
+from typing import Iterable
+
+from sqlalchemy import update
+
+from core.background import PeriodicTask, register_task
+from core.cache import cache
+from core.connection import DBSession, session_scope
+from core.database.config import settings
+from core.database.models import UserModel
+from core.unit_of_work import UnitOfWork, after_commit
+
+logger = logging.getLogger(__name__)
+
+USER_COUNTERS = ("pins_count", "followers_count", "following_count", "boards_count")
+
+# Estadísticas de perfil: user_id -> dict (ver MySQLUserRepository.get_user_stats)
+user_stats_cache = cache.namespace("user_stats")
+
+
+async def add_to_user_counter(db: DBSession, user_id: str, field: str, delta: int) -> None:
+    """
+    Suma `delta` a un contador sin dejarlo negativo. No hace commit: la
+    cache de estadísticas se invalida cuando se confirme la transacción
+    """
+    column = getattr(UserModel, field)
+    stmt = update(UserModel).where(UserModel.id == user_id)
+    if delta < 0:
+        stmt = stmt.where(column > 0)
+    await db.execute(stmt.values({column: column + delta}))
+    after_commit(db, invalidate_user_stats, [user_id])
+
+
+async def invalidate_user_stats(user_ids: Iterable[str]) -> None:
+    """Llamar después del commit (ver `after_commit`)"""
+    await user_stats_cache.delete_many(list(user_ids))
+
+
+async def reconcile_user_counters() -> None:
+    """Recalcular los contadores de todos los usuarios, por lotes"""
+    from internal.users.infrastructure.adapters.mysql_user_repository import (
+        MySQLUserRepository,
+    )
+
+    after_id, fixed = "", 0
+    while True:
+        async with session_scope() as db, UnitOfWork(db):
+            last_id, batch_fixed = await MySQLUserRepository(db).reconcile_counters(
+                after_id, settings.USER_COUNTERS_RECONCILE_BATCH_SIZE
+            )
+        fixed += batch_fixed
+        if last_id is None:
+            break
+        after_id = last_id
+    if fixed:
+        logger.warning(f"🔧 Fixed counter drift on {fixed} users")
+
+
+register_task(PeriodicTask(
+    "user_counters_reconcile",
+    settings.USER_COUNTERS_RECONCILE_INTERVAL_SECONDS,
+    reconcile_user_counters,
+    run_on_stop=False,
+))
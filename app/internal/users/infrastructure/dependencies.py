@@ -2,10 +2,11 @@
 Inyección de dependencias para Users
 """
 from fastapi import Depends
-from sqlalchemy.orm import Session
 
-from core.connection import get_db
+from core.connection import DBSession, get_db
+from core.unit_of_work import UnitOfWork
 from internal.users.infrastructure.adapters.mysql_user_repository import MySQLUserRepository
+from internal.users.application.user_summary_loader import UserSummaryLoader
 
 # Auth
 from internal.users.infrastructure.http.auth_controller import AuthController
@@ -20,21 +21,31 @@ from internal.users.application.use_cases.delete_user import DeleteUserUseCase
 from internal.users.application.use_cases.search_users import SearchUsersUseCase
 
 
-def get_auth_controller(db: Session = Depends(get_db)) -> AuthController:
+def get_auth_controller(db: DBSession = Depends(get_db)) -> AuthController:
     repo = MySQLUserRepository(db)
+    uow = UnitOfWork(db)
 
     return AuthController(
-        create_user_uc=CreateUserUseCase(repo),
-        login_user_uc=LoginUserUseCase(repo),
+        create_user_uc=CreateUserUseCase(repo, uow),
+        login_user_uc=LoginUserUseCase(repo, uow),
     )
 
 
-def get_user_controller(db: Session = Depends(get_db)) -> UserController:
+def get_user_controller(db: DBSession = Depends(get_db)) -> UserController:
     repo = MySQLUserRepository(db)
+    uow = UnitOfWork(db)
 
     return UserController(
         get_user_uc=GetUserUseCase(repo),
-        update_user_uc=UpdateUserUseCase(repo),
-        delete_user_uc=DeleteUserUseCase(repo),
+        update_user_uc=UpdateUserUseCase(repo, uow),
+        delete_user_uc=DeleteUserUseCase(repo, uow),
         search_users_uc=SearchUsersUseCase(repo),
-    )
\ No newline at end of file
+    )
+
+
+def get_user_summary_loader(db: DBSession = Depends(get_db)) -> UserSummaryLoader:
+    """
+    Un cargador por request: FastAPI cachea la dependencia, así que todos
+    los controladores del mismo request comparten los autores ya resueltos
+    """
+    return UserSummaryLoader(MySQLUserRepository(db))
@@ -1,7 +1,7 @@
 """
 Controlador HTTP de Autenticación
 """
-from core.security import hash_password, verify_password
+from core.security import hash_password_async, verify_and_rehash_async
 
 from internal.users.application.use_cases.create_user import CreateUserUseCase
 from internal.users.application.use_cases.login_user import LoginUserUseCase
@@ -46,7 +46,7 @@ class AuthController:
     # ── Register ──────────────────────────────────────────────
 
     async def register(self, body: RegisterRequest) -> AuthResponse:
-        password_hash = hash_password(body.password)
+        password_hash = await hash_password_async(body.password)
 
         user = await self._create_user_uc.execute(
             username=body.username,
@@ -70,14 +70,19 @@ class AuthController:
     async def login(self, body: LoginRequest) -> AuthResponse:
         user = await self._login_user_uc.execute(identity=body.identity)
 
-        if not verify_password(body.password, user.password_hash):
+        # Si BCRYPT_ROUNDS cambió, el hash nuevo sale del mismo viaje al pool
+        valid, new_hash = await verify_and_rehash_async(body.password, user.password_hash)
+        if not valid:
             await self._login_user_uc.on_login_failure(
                 user_id=user.id,
                 current_attempts=user.login_attempts,
             )
             raise ValueError("Credenciales inválidas")
 
-        await self._login_user_uc.on_login_success(user_id=user.id)
+        await self._login_user_uc.on_login_success(
+            user_id=user.id,
+            new_password_hash=new_hash,
+        )
 
         token = create_access_token(data={"sub": user.id})
 
@@ -1,7 +1,7 @@
 """
 Controlador HTTP de Users
 """
-from passlib.context import CryptContext
+from core.security import hash_password_async, verify_password_async
 
 from internal.users.application.use_cases.get_user import GetUserUseCase
 from internal.users.application.use_cases.update_user import UpdateUserUseCase
@@ -20,9 +20,6 @@ from internal.users.application.schemas.user_schema import (
 )
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class UserController:
     def __init__(
         self,
@@ -107,11 +104,11 @@ class UserController:
         user = await self._get_user_uc.execute_by_id(user_id)
 
         # Verificar password actual
-        if not pwd_context.verify(body.current_password, user.password_hash):
+        if not await verify_password_async(body.current_password, user.password_hash):
             raise ValueError("La contraseña actual es incorrecta")
 
         # Hashear nueva contraseña
-        new_hash = pwd_context.hash(body.new_password)
+        new_hash = await hash_password_async(body.new_password)
         await self._update_user_uc.change_password(user_id, new_hash)
 
         return MessageResponse(message="Contraseña actualizada correctamente")
@@ -1,6 +1,16 @@
 """
 Middleware de autenticación JWT
+
+Cada request autenticado resuelve token -> claims -> Principal:
+- Los tokens ya verificados se guardan en una LRU en proceso (nunca en
+  Redis) hasta su `exp`, así el scroll del feed no re-verifica la firma en
+  cada página.
+- El Principal (id, rol, activo) sale de la cache compartida "principal"
+  (MySQLUserRepository.get_principal), que se invalida al editar o
+  desactivar la cuenta: un token válido de una cuenta desactivada deja de
+  servir en cuanto expira esa entrada.
 """
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
@@ -10,6 +20,12 @@ from jose import JWTError, jwt
 
 import os
 
+from core.cache import LRUCache
+from core.connection import DBSession, get_db
+from core.database.config import settings
+from internal.users.domain.entities.user import Principal
+from internal.users.infrastructure.adapters.mysql_user_repository import MySQLUserRepository
+
 # ── Configuración JWT ─────────────────────────────────────────
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "amura-super-secret-key-change-in-production")
@@ -18,6 +34,9 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "1440"))  # 24
 
 security = HTTPBearer()
 
+# token -> claims de tokens con firma ya verificada
+_verified_tokens = LRUCache(max_entries=settings.JWT_CACHE_MAX_ENTRIES)
+
 
 # ── Funciones de Token ────────────────────────────────────────
 
@@ -34,43 +53,80 @@ def create_access_token(
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def decode_access_token(token: str) -> dict:
     """Decodificar token JWT"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token inválido o expirado",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Token inválido o expirado")
+
+
+async def verify_access_token(token: str) -> dict:
+    """decode_access_token con cache de tokens ya verificados (hasta su exp)"""
+    claims = await _verified_tokens.get(token)
+    if claims is not None:
+        return claims
+    claims = decode_access_token(token)
+    exp = claims.get("exp")
+    ttl = exp - time.time() if exp is not None else None
+    if ttl is None or ttl > 0:
+        await _verified_tokens.set(token, claims, ttl)
+    return claims
+
+
+def token_cache_stats() -> dict:
+    return _verified_tokens.stats()
+
+
+async def resolve_principal(token: str, db: DBSession) -> Principal:
+    """Token -> Principal activo; 401 si el token o la cuenta no valen"""
+    claims = await verify_access_token(token)
+    user_id = claims.get("sub")
+    if not user_id:
+        raise _unauthorized("Token no contiene información del usuario")
+    principal = await MySQLUserRepository(db).get_principal(user_id)
+    if principal is None or not principal.is_active:
+        raise _unauthorized("La cuenta no existe o está desactivada")
+    return principal
 
 
 # ── Dependencias de autenticación ────────────────────────────
 
-async def get_current_user_id(
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: DBSession = Depends(get_db),
+) -> Principal:
+    """
+    Dependencia FastAPI: usuario autenticado y activo (id, rol).
+    Usar en rutas que necesiten el rol.
+    """
+    return await resolve_principal(credentials.credentials, db)
+
+
+async def get_current_user_id(
+    principal: Principal = Depends(get_current_principal),
 ) -> str:
     """
     Dependencia FastAPI: extrae user_id del token JWT.
     Usar en rutas protegidas.
     """
-    payload = decode_access_token(credentials.credentials)
-    user_id: str = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token no contiene información del usuario",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user_id
+    return principal.id
 
 
 async def get_optional_user_id(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
     ),
+    db: DBSession = Depends(get_db),
 ) -> Optional[str]:
     """
     Dependencia opcional: retorna user_id si hay token, None si no.
@@ -79,7 +135,6 @@ async def get_optional_user_id(
     if not credentials:
         return None
     try:
-        payload = decode_access_token(credentials.credentials)
-        return payload.get("sub")
+        return (await resolve_principal(credentials.credentials, db)).id
     except HTTPException:
         return None
\ No newline at end of file
@@ -15,7 +15,18 @@ from core.exceptions import (
     UserNotFoundException,
     UnauthorizedException,
 )
-from core.connection import engine, Base
+from core.connection import engine, Base, dispose_engines
+from core.pagination import InvalidCursorError
+from core.executors import executor_stats, shutdown_executors
+from core.cache import cache
+from core.redis_client import close_redis
+from core.background import (
+    background_stats,
+    start_background_tasks,
+    stop_background_tasks,
+)
+from internal.pines.infrastructure.adapters.view_counter import view_counter
+from internal.users.infrastructure.middlewares.auth_middleware import token_cache_stats
 
 # ── Importar modelos para que SQLAlchemy los registre ─────────
 from core.database.models import (
@@ -43,6 +54,9 @@ from core.upload_routes import router as upload_router
 
 # ── WebSocket ─────────────────────────────────────────────────
 from core.websocket_routes import router as ws_router
+from core.websocket import manager
+from core.notification_outbox import notification_dispatcher
+from core.notifications import notification_coalescer
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -57,8 +71,18 @@ async def lifespan(app: FastAPI):
     if settings.DEBUG:
         logger.info("🗄️ Creating database tables...")
         Base.metadata.create_all(bind=engine)
+    await manager.start()
+    notification_dispatcher.start()
+    start_background_tasks()
     yield
     logger.info("👋 Shutting down Amura API...")
+    await notification_dispatcher.stop()
+    # Vaciar buffers antes de cerrar conexiones
+    await stop_background_tasks()
+    await manager.stop()
+    await close_redis()
+    await dispose_engines()
+    shutdown_executors()
 
 
 # ==================== APP ====================
@@ -217,6 +241,14 @@ async def unauthorized_handler(request: Request, exc: UnauthorizedException):
     )
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"error": "Invalid Cursor", "message": str(exc)},
+    )
+
+
 # ==================== ROUTES ====================
 
 # Health check
@@ -234,6 +266,72 @@ async def health_check():
     }
 
 
+@app.get(
+    "/health/executors",
+    tags=["Health"],
+    summary="Métricas de los pools de trabajo bloqueante",
+)
+async def executors_health():
+    return executor_stats()
+
+
+@app.get(
+    "/health/cache",
+    tags=["Health"],
+    summary="Métricas de la cache",
+)
+async def cache_health():
+    return cache.stats()
+
+
+@app.get(
+    "/health/auth",
+    tags=["Health"],
+    summary="Cache de tokens JWT verificados",
+)
+async def auth_health():
+    return token_cache_stats()
+
+
+@app.get(
+    "/health/websocket",
+    tags=["Health"],
+    summary="Conexiones locales y backplane de WebSocket",
+)
+async def websocket_health():
+    return manager.stats()
+
+
+@app.get(
+    "/health/notifications",
+    tags=["Health"],
+    summary="Dispatcher del outbox de notificaciones",
+)
+async def notifications_health():
+    return {
+        "dispatcher": notification_dispatcher.stats(),
+        "coalescer": notification_coalescer.stats(),
+    }
+
+
+@app.get(
+    "/health/background",
+    tags=["Health"],
+    summary="Estado de las tareas periódicas",
+)
+async def background_health():
+    return background_stats()
+
+
+@app.get(
+    "/health/views",
+    tags=["Health"],
+    summary="Buffer del contador de vistas (pendientes y lag de volcado)",
+)
+async def views_health():
+    return await view_counter.stats()
+
+
 # API routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(users_router, prefix="/api/v1")
@@ -0,0 +1,76 @@
+"""
+Benchmark de la dependencia de autenticación de Amura API
+
+Compara el coste por request de:
+- decode_access_token: verificar la firma HS256 con python-jose cada vez.
+- verify_access_token: lo mismo con la LRU de tokens ya verificados.
+- resolve_principal: token + Principal desde la cache (lo que hace
+  get_current_user_id en cada request del feed).
+
+No necesita MySQL: el Principal se precarga en la cache "principal".
+
+Ejecutar:
+    python benchmarks/auth_dependency.py
+    python benchmarks/auth_dependency.py --iterations 50000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Igual que run.py: la raíz del repo y app/ en el path
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [_ROOT, os.path.join(_ROOT, "app")]
+# Config mínima: el benchmark no toca la base de datos
+for _key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(_key, "benchmark")
+
+from core.cache import cache  # noqa: E402
+from internal.users.domain.entities.user import Principal  # noqa: E402
+from internal.users.infrastructure.middlewares.auth_middleware import (  # noqa: E402
+    create_access_token,
+    decode_access_token,
+    resolve_principal,
+    token_cache_stats,
+    verify_access_token,
+)
+
+USER_ID = "benchmark-user"
+
+
+async def _measure(label: str, iterations: int, call) -> None:
+    await call()  # calentar caches
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>22} {elapsed / iterations * 1e6:>10.2f} µs/req {iterations / elapsed:>12.0f} req/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": USER_ID})
+    await cache.namespace("principal").set(USER_ID, Principal(id=USER_ID), 3600)
+
+    async def uncached():
+        decode_access_token(token)
+
+    async def cached():
+        await verify_access_token(token)
+
+    async def principal():
+        # db=None: con la cache caliente no se abre sesión
+        await resolve_principal(token, None)
+
+    await _measure("decode (sin cache)", args.iterations, uncached)
+    await _measure("verify (cache token)", args.iterations, cached)
+    await _measure("principal (cache)", args.iterations, principal)
+    print(f"token cache: {token_cache_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
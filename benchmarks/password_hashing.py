@@ -0,0 +1,99 @@
+"""
+Benchmark de login (bcrypt) para Amura API
+
+Mide logins/s (verify_and_rehash) con el hash en el event loop, en el pool
+de hilos y en el pool de procesos, para cada coste de bcrypt, junto con el
+peor retraso que sufre el event loop mientras tanto (lo que notaría el resto
+de requests durante una ráfaga de logins).
+
+Ejecutar:
+    python benchmarks/password_hashing.py
+    python benchmarks/password_hashing.py --rounds 10 12 --logins 64 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Igual que run.py: la raíz del repo y app/ en el path
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [_ROOT, os.path.join(_ROOT, "app")]
+# Config mínima: el benchmark no toca la base de datos
+for _key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(_key, "benchmark")
+
+from core.executors import BoundedExecutor  # noqa: E402
+from core.security import hash_password, verify_and_rehash  # noqa: E402
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Peor retraso (s) de un sleep(interval) mientras corre el benchmark"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def _run(mode: str, hashed: str, rounds: int, logins: int, workers: int) -> dict:
+    executor = None
+    if mode != "inline":
+        executor = BoundedExecutor(
+            f"bench-{mode}", max_workers=workers, max_queue=logins, processes=mode == "process"
+        )
+        # Arrancar los workers antes de medir (spawn tarda)
+        await asyncio.gather(*(executor.run(hash_password, "warmup", 4) for _ in range(workers)))
+
+    async def login() -> None:
+        if executor is None:
+            ok, _ = verify_and_rehash(PASSWORD, hashed, rounds)
+            await asyncio.sleep(0)
+        else:
+            ok, _ = await executor.run(verify_and_rehash, PASSWORD, hashed, rounds)
+        assert ok
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_loop_lag(stop))
+    await asyncio.sleep(0.02)
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    worst_lag = await lag_task
+    if executor is not None:
+        executor.shutdown()
+
+    cores = 1 if executor is None else min(workers, os.cpu_count() or 1)
+    return {
+        "mode": mode,
+        "logins_per_s": logins / elapsed,
+        "per_core": logins / elapsed / cores,
+        "max_loop_lag_ms": worst_lag * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 12])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}  workers: {args.workers}  logins: {args.logins}")
+    print(f"{'rounds':>6} {'modo':>8} {'logins/s':>10} {'por core':>10} {'lag loop':>10}")
+    for rounds in args.rounds:
+        hashed = hash_password(PASSWORD, rounds)
+        for mode in ("inline", "thread", "process"):
+            r = await _run(mode, hashed, rounds, args.logins, args.workers)
+            print(
+                f"{rounds:>6} {r['mode']:>8} {r['logins_per_s']:>10.1f} "
+                f"{r['per_core']:>10.1f} {r['max_loop_lag_ms']:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
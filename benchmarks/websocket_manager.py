@@ -0,0 +1,116 @@
+"""
+Micro-benchmark del ConnectionManager de Amura API
+
+Mide connect, subscribe y disconnect con muchas conexiones y suscripciones
+(por defecto 100k conexiones y 1M suscripciones repartidas en 10k canales),
+que es lo que pasa en una reconexión masiva tras un deploy.
+
+Como referencia, cronometra también una muestra de desconexiones con el
+algoritmo anterior (recorrer todos los canales en cada desconexión) y lo
+extrapola al total.
+
+No necesita MySQL ni Redis (backplane en memoria).
+
+Ejecutar:
+    python benchmarks/websocket_manager.py
+    python benchmarks/websocket_manager.py --connections 20000 --subscriptions 200000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+# Igual que run.py: la raíz del repo y app/ en el path
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [_ROOT, os.path.join(_ROOT, "app")]
+# Config mínima: el benchmark no toca la base de datos
+for _key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(_key, "benchmark")
+
+from core.backplane import MemoryBackplane  # noqa: E402
+from core.websocket import ConnectionManager  # noqa: E402
+
+
+class _FakeWebSocket:
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict) -> None:
+        pass
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:>28} {elapsed * 1000:>10.1f} ms {elapsed / count * 1e6:>9.2f} µs/op")
+
+
+def _legacy_disconnect(channels: dict, user_id: str) -> None:
+    """Lo que hacía disconnect antes: recorrer todos los canales"""
+    for channel in list(channels.keys()):
+        channels[channel].discard(user_id)
+        if not channels[channel]:
+            del channels[channel]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--connections", type=int, default=100_000)
+    parser.add_argument("--subscriptions", type=int, default=1_000_000)
+    parser.add_argument("--channels", type=int, default=10_000)
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="desconexiones a cronometrar con el algoritmo anterior")
+    args = parser.parse_args()
+
+    manager = ConnectionManager(MemoryBackplane())
+    rng = random.Random(42)
+    users = [f"user-{i}" for i in range(args.connections)]
+    sockets = [_FakeWebSocket() for _ in users]
+
+    started = time.perf_counter()
+    for ws, user_id in zip(sockets, users):
+        await manager.connect(ws, user_id)
+    _report("connect", args.connections, time.perf_counter() - started)
+
+    per_user = max(args.subscriptions // args.connections, 1)
+    started = time.perf_counter()
+    for user_id in users:
+        for _ in range(per_user):
+            manager.subscribe(user_id, f"pin:{rng.randrange(args.channels)}")
+    subscriptions = per_user * args.connections
+    _report("subscribe", subscriptions, time.perf_counter() - started)
+
+    stats = manager.stats()
+    print(
+        f"{'':>28} {stats['local_connections']} conexiones, "
+        f"{stats['subscriptions']} suscripciones, {stats['channels']} canales"
+    )
+
+    # Referencia: el algoritmo anterior sobre una copia de los canales
+    sample = min(args.legacy_sample, args.connections)
+    legacy_channels = {name: set(members) for name, members in manager._channels.items()}
+    started = time.perf_counter()
+    for user_id in users[:sample]:
+        _legacy_disconnect(legacy_channels, user_id)
+    legacy = (time.perf_counter() - started) / sample
+    print(
+        f"{'disconnect (anterior)':>28} {legacy * args.connections * 1000:>10.1f} ms "
+        f"{legacy * 1e6:>9.2f} µs/op  (extrapolado de {sample})"
+    )
+
+    order = list(range(args.connections))
+    rng.shuffle(order)
+    started = time.perf_counter()
+    for i in order:
+        await manager.disconnect(sockets[i], users[i])
+    _report("disconnect", args.connections, time.perf_counter() - started)
+
+    stats = manager.stats()
+    assert stats["local_connections"] == 0 and stats["channels"] == 0, stats
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
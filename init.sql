@@ -30,6 +30,10 @@ CREATE TABLE IF NOT EXISTS users (
     locked_until TIMESTAMP NULL,
     password_reset_token VARCHAR(255) NULL,
     password_reset_token_expiry TIMESTAMP NULL,
+    pins_count INT NOT NULL DEFAULT 0,
+    followers_count INT NOT NULL DEFAULT 0,
+    following_count INT NOT NULL DEFAULT 0,
+    boards_count INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     last_login TIMESTAMP NULL,
@@ -64,6 +68,10 @@ CREATE TABLE IF NOT EXISTS pins (
     colors JSON,
     tags JSON,
     is_private BOOLEAN DEFAULT FALSE,
+    search_text TEXT,
+    trend_1h DOUBLE NOT NULL DEFAULT 0,
+    trend_24h DOUBLE NOT NULL DEFAULT 0,
+    trend_7d DOUBLE NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -72,7 +80,12 @@ CREATE TABLE IF NOT EXISTS pins (
     INDEX idx_season (season),
     INDEX idx_created_at (created_at),
     INDEX idx_likes_count (likes_count),
-    INDEX idx_is_private (is_private)
+    INDEX idx_is_private (is_private),
+    INDEX idx_user_created (user_id, created_at),
+    INDEX idx_trend_1h (trend_1h),
+    INDEX idx_trend_24h (trend_24h),
+    INDEX idx_trend_7d (trend_7d),
+    FULLTEXT INDEX ft_pins_search (search_text)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- =====================================================
@@ -189,4 +202,44 @@ CREATE TABLE IF NOT EXISTS comments (
     INDEX idx_user_id (user_id),
     INDEX idx_parent_comment_id (parent_comment_id),
     INDEX idx_created_at (created_at)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
\ No newline at end of file
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- TABLA: feed_items (timeline materializado)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS feed_items (
+    user_id VARCHAR(36) NOT NULL,
+    pin_id VARCHAR(36) NOT NULL,
+    author_id VARCHAR(36) NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (user_id, pin_id),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (pin_id) REFERENCES pins(id) ON DELETE CASCADE,
+    INDEX idx_feed_user_created (user_id, created_at),
+    INDEX idx_feed_pin_id (pin_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- TABLA: feed_fanin_authors (cuentas leídas con fan-in)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS feed_fanin_authors (
+    user_id VARCHAR(36) PRIMARY KEY,
+    followers_count INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+-- =====================================================
+-- TABLA: notification_outbox (notificaciones pendientes)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(32) NOT NULL,
+    actor_id VARCHAR(36) NOT NULL,
+    recipient_id VARCHAR(36) NULL,
+    pin_id VARCHAR(36) NULL,
+    payload JSON NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,34 @@
+-- =====================================================
+-- 001: feed materializado (fan-out / fan-in)
+-- =====================================================
+
+USE stylepin;
+
+ALTER TABLE pins ADD INDEX idx_user_created (user_id, created_at);
+
+-- =====================================================
+-- TABLA: feed_items (timeline materializado)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS feed_items (
+    user_id VARCHAR(36) NOT NULL,
+    pin_id VARCHAR(36) NOT NULL,
+    author_id VARCHAR(36) NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (user_id, pin_id),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (pin_id) REFERENCES pins(id) ON DELETE CASCADE,
+    INDEX idx_feed_user_created (user_id, created_at),
+    INDEX idx_feed_pin_id (pin_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- TABLA: feed_fanin_authors (cuentas leídas con fan-in)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS feed_fanin_authors (
+    user_id VARCHAR(36) PRIMARY KEY,
+    followers_count INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
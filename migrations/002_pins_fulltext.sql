@@ -0,0 +1,17 @@
+-- =====================================================
+-- 002: búsqueda FULLTEXT de pins
+-- =====================================================
+
+USE stylepin;
+
+ALTER TABLE pins ADD COLUMN search_text TEXT AFTER is_private;
+
+-- Backfill: los JSON se guardan como texto; corchetes y comillas
+-- actúan como separadores para el parser FULLTEXT
+UPDATE pins
+SET search_text = CONCAT_WS(' ',
+    title, description, category,
+    styles, occasions, brands, colors, tags
+);
+
+ALTER TABLE pins ADD FULLTEXT INDEX ft_pins_search (search_text);
@@ -0,0 +1,27 @@
+-- =====================================================
+-- 003: puntuación trending incremental por ventana
+-- =====================================================
+
+USE stylepin;
+
+ALTER TABLE pins
+    ADD COLUMN trend_1h DOUBLE NOT NULL DEFAULT 0 AFTER search_text,
+    ADD COLUMN trend_24h DOUBLE NOT NULL DEFAULT 0 AFTER trend_1h,
+    ADD COLUMN trend_7d DOUBLE NOT NULL DEFAULT 0 AFTER trend_24h;
+
+-- Backfill aproximado: toda la interacción histórica se fecha en la
+-- creación del pin. Mismos pesos que trending_score.py
+-- (creación 1, vista 1, like 3, comentario 4, guardado 5).
+UPDATE pins
+SET
+    trend_1h  = TIMESTAMPDIFF(SECOND, '2024-01-01 00:00:00', created_at) / 3600 / 1
+                + LOG2(1 + views_count + 3 * likes_count + 4 * comments_count + 5 * saves_count),
+    trend_24h = TIMESTAMPDIFF(SECOND, '2024-01-01 00:00:00', created_at) / 3600 / 24
+                + LOG2(1 + views_count + 3 * likes_count + 4 * comments_count + 5 * saves_count),
+    trend_7d  = TIMESTAMPDIFF(SECOND, '2024-01-01 00:00:00', created_at) / 3600 / 168
+                + LOG2(1 + views_count + 3 * likes_count + 4 * comments_count + 5 * saves_count);
+
+ALTER TABLE pins
+    ADD INDEX idx_trend_1h (trend_1h),
+    ADD INDEX idx_trend_24h (trend_24h),
+    ADD INDEX idx_trend_7d (trend_7d);
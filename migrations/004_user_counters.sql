@@ -0,0 +1,18 @@
+-- =====================================================
+-- 004: contadores desnormalizados en users
+-- =====================================================
+
+USE stylepin;
+
+ALTER TABLE users
+    ADD COLUMN pins_count INT NOT NULL DEFAULT 0 AFTER password_reset_token_expiry,
+    ADD COLUMN followers_count INT NOT NULL DEFAULT 0 AFTER pins_count,
+    ADD COLUMN following_count INT NOT NULL DEFAULT 0 AFTER followers_count,
+    ADD COLUMN boards_count INT NOT NULL DEFAULT 0 AFTER following_count;
+
+UPDATE users u
+SET
+    pins_count      = (SELECT COUNT(*) FROM pins p WHERE p.user_id = u.id),
+    followers_count = (SELECT COUNT(*) FROM follows f WHERE f.following_id = u.id),
+    following_count = (SELECT COUNT(*) FROM follows f WHERE f.follower_id = u.id),
+    boards_count    = (SELECT COUNT(*) FROM boards b WHERE b.user_id = u.id);
@@ -0,0 +1,16 @@
+-- =====================================================
+-- 005: outbox de notificaciones (entrega fuera del request)
+-- =====================================================
+
+USE stylepin;
+
+-- Sin FKs: es una cola; el dispatcher ignora pins/usuarios ya borrados
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(32) NOT NULL,
+    actor_id VARCHAR(36) NOT NULL,
+    recipient_id VARCHAR(36) NULL,
+    pin_id VARCHAR(36) NULL,
+    payload JSON NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
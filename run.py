@@ -13,5 +13,6 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE,
     )
\ No newline at end of file
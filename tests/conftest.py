@@ -0,0 +1,100 @@
+"""
+Fixtures comunes de los tests de Amura API
+
+Los tests corren contra SQLite en memoria (aiosqlite) con el esquema de
+`core.database.models`; no necesitan MySQL ni Redis. Requieren pytest y
+aiosqlite.
+"""
+import asyncio
+import math
+import os
+import sys
+
+import pytest
+
+# Igual que run.py: la raíz del repo y app/ en el path
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [_ROOT, os.path.join(_ROOT, "app")]
+# Config mínima: la conexión real a MySQL no se abre nunca
+for _key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(_key, "test")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+import core.connection  # noqa: E402
+from core.connection import Base  # noqa: E402
+import core.database.models  # noqa: E402,F401  (registra las tablas)
+
+
+class QueryCounter:
+    """Sentencias SQL ejecutadas mientras está activo"""
+
+    def __init__(self):
+        self.statements = []
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements.clear()
+        self.active = True
+        return self
+
+    def __exit__(self, *exc):
+        self.active = False
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def run():
+    """Ejecutar una corrutina en un loop propio (sin pytest-asyncio)"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+def _mysql_functions(dbapi_connection, connection_record) -> None:
+    """Funciones de MySQL que usan los repositorios y SQLite no trae"""
+    dbapi_connection.create_function("log2", 1, math.log2)
+    dbapi_connection.create_function("pow", 2, math.pow)
+    dbapi_connection.create_function("last_insert_id", 1, lambda value: value)
+
+
+@pytest.fixture
+def engine(run):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listen(engine.sync_engine, "connect", _mysql_functions)
+
+    async def create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    run(create_schema())
+    yield engine
+    run(engine.dispose())
+
+
+@pytest.fixture
+def queries(engine):
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def db_scope(session_factory, monkeypatch):
+    """`core.connection.session_scope` (tareas en segundo plano) sobre SQLite"""
+    monkeypatch.setattr(core.connection, "AsyncSessionLocal", session_factory)
+    return session_factory
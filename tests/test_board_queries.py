@@ -0,0 +1,63 @@
+"""
+Listado de boards públicos: una sola consulta por página (JOIN con users)
+"""
+from core.database.models import BoardModel, UserModel
+from internal.boards.application.use_cases.get_all_boards import GetAllBoardsUseCase
+from internal.boards.infrastructure.adapters.mysql_board_repository import MySQLBoardRepository
+
+
+async def _seed(db, users: int, boards: int) -> None:
+    for i in range(users):
+        db.add(UserModel(
+            id=f"user-{i}",
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            password_hash="x",
+            full_name=f"User {i}",
+        ))
+    for i in range(boards):
+        db.add(BoardModel(
+            id=f"board-{i}",
+            user_id=f"user-{i % users}",
+            name=f"Board {i}",
+            is_private=(i % 5 == 0),
+        ))
+    await db.commit()
+
+
+def test_get_all_boards_runs_one_query_per_page(run, session_factory, queries):
+    async def scenario():
+        async with session_factory() as db:
+            await _seed(db, users=7, boards=60)
+            use_case = GetAllBoardsUseCase(MySQLBoardRepository(db))
+
+            pages = []
+            for offset in (0, 20, 40):
+                with queries:
+                    pages.append(await use_case.execute(limit=20, offset=offset))
+                assert queries.count == 1, queries.statements
+            return pages
+
+    pages = run(scenario())
+
+    boards = [board for page in pages for board in page]
+    assert len(boards) == 48  # 60 menos los 12 privados
+    assert len({board.id for board in boards}) == 48
+    assert all(board.user_username == f"user{board.user_id.split('-')[1]}" for board in boards)
+
+
+def test_get_all_boards_filtered_by_user_runs_one_query(run, session_factory, queries):
+    async def scenario():
+        async with session_factory() as db:
+            await _seed(db, users=3, boards=30)
+            with queries:
+                boards = await GetAllBoardsUseCase(MySQLBoardRepository(db)).execute(
+                    limit=50, user_id="user-1"
+                )
+            return boards
+
+    boards = run(scenario())
+
+    assert queries.count == 1, queries.statements
+    assert boards and {board.user_id for board in boards} == {"user-1"}
+    assert {board.user_username for board in boards} == {"user1"}
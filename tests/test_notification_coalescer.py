@@ -0,0 +1,159 @@
+"""
+Coalescedor de notificaciones: primera inmediata, resúmenes por ventana,
+max_batch y flush concurrente con publish
+"""
+from core.notifications import NotificationCoalescer
+
+
+def _like(owner: str, pin_id: str, username: str):
+    return owner, {
+        "type": "new_like",
+        "pin_id": pin_id,
+        "pin_title": "Outfit",
+        "liker_username": username,
+        "message": f"❤️ {username} le dio like a tu pin 'Outfit'",
+    }, username
+
+
+class _Recorder:
+    def __init__(self):
+        self.frames = []
+        self.on_send = None
+
+    async def __call__(self, user_id: str, message: dict) -> None:
+        self.frames.append((user_id, message))
+        if self.on_send is not None:
+            hook, self.on_send = self.on_send, None
+            await hook()
+
+    def events(self) -> int:
+        return sum(message.get("count", 1) for _, message in self.frames)
+
+
+def test_first_event_is_sent_immediately(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=100)
+
+    run(coalescer.publish(*_like("owner", "pin-1", "ana")))
+
+    assert [message["liker_username"] for _, message in sent.frames] == ["ana"]
+    assert "count" not in sent.frames[0][1]
+
+
+def test_events_in_window_are_merged_into_one_digest(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=100)
+
+    async def scenario():
+        for username in ("ana", "bea", "carla", "dani", "bea", "eva"):
+            await coalescer.publish(*_like("owner", "pin-1", username))
+        await coalescer.publish(*_like("owner", "pin-2", "ana"))  # otro pin, otra ventana
+        assert len(sent.frames) == 2
+        await coalescer.flush()
+
+    run(scenario())
+
+    assert len(sent.frames) == 3
+    digest = sent.frames[2][1]
+    assert digest["pin_id"] == "pin-1"
+    assert digest["count"] == 5
+    assert digest["actors"] == ["bea", "carla", "dani"]
+    assert digest["message"] == "❤️ bea y otras 4 personas le dieron like a tu pin 'Outfit'"
+
+
+def test_single_pending_event_is_sent_as_is(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=100)
+
+    async def scenario():
+        await coalescer.publish(*_like("owner", "pin-1", "ana"))
+        await coalescer.publish(*_like("owner", "pin-1", "bea"))
+        await coalescer.flush()
+
+    run(scenario())
+
+    assert sent.frames[1][1]["message"] == "❤️ bea le dio like a tu pin 'Outfit'"
+
+
+def test_windows_close_after_a_quiet_interval(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=100)
+
+    async def scenario():
+        await coalescer.publish(*_like("owner", "pin-1", "ana"))
+        await coalescer.publish(*_like("owner", "pin-1", "bea"))
+        await coalescer.flush()   # envía el resumen, la ventana sigue abierta
+        assert coalescer.stats()["open_windows"] == 1
+        await coalescer.flush()   # intervalo sin novedades: se cierra
+        assert coalescer.stats()["open_windows"] == 0
+        await coalescer.publish(*_like("owner", "pin-1", "carla"))
+
+    run(scenario())
+
+    # Tras cerrarse, el siguiente vuelve a salir al momento
+    assert [message["message"].split()[1] for _, message in sent.frames] == ["ana", "bea", "carla"]
+
+
+def test_max_batch_flushes_early(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=3)
+
+    async def scenario():
+        for i in range(8):
+            await coalescer.publish(*_like("owner", "pin-1", f"fan{i}"))
+        assert [message.get("count", 1) for _, message in sent.frames] == [1, 3, 3]
+        await coalescer.flush()
+
+    run(scenario())
+
+    assert [message.get("count", 1) for _, message in sent.frames] == [1, 3, 3, 1]
+    assert sent.events() == 8
+
+
+def test_zero_window_sends_every_event(run):
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=0, max_batch=100)
+
+    async def scenario():
+        for i in range(4):
+            await coalescer.publish(*_like("owner", "pin-1", f"fan{i}"))
+
+    run(scenario())
+
+    assert len(sent.frames) == 4
+
+
+def test_publish_during_flush_is_not_lost(run):
+    """Likes que llegan mientras flush espera a un envío"""
+    sent = _Recorder()
+    coalescer = NotificationCoalescer(sent, window_seconds=2, max_batch=100)
+    published = 0
+
+    async def publish(pin: str, username: str):
+        nonlocal published
+        published += 1
+        await coalescer.publish(*_like(f"owner-{pin}", f"pin-{pin}", username))
+
+    async def scenario():
+        for pin in "ABCDE":
+            await publish(pin, f"{pin}1")
+            await publish(pin, f"{pin}2")
+
+        async def concurrent_likes():
+            await publish("B", "B3")
+            await publish("B", "B4")
+            await publish("F", "F1")  # ventana nueva durante el flush
+
+        sent.on_send = concurrent_likes  # durante el primer envío del flush
+        await coalescer.flush()
+        await coalescer.flush()
+        await coalescer.flush()
+
+    run(scenario())
+
+    assert sent.events() == published
+    usernames = set()
+    for _, message in sent.frames:
+        usernames.update(message.get("actors") or [message["liker_username"]])
+    assert {"B3", "B4", "F1"} <= usernames
+    assert coalescer.stats()["open_windows"] == 0
@@ -0,0 +1,171 @@
+"""
+Outbox de notificaciones: un pin nuevo llega solo a los seguidores
+conectados, con la lista de seguidores cacheada e invalidada al
+seguir/dejar de seguir
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from core import notifications
+from core.backplane import MemoryBackplane
+from core.database.models import NotificationOutboxModel, UserModel
+from core.notification_outbox import EVENT_NEW_PIN, NotificationDispatcher, NotificationOutbox
+from core.unit_of_work import UnitOfWork
+from core.websocket import ConnectionManager
+from internal.follows.domain.entities.follow import Follow
+from internal.follows.infrastructure.adapters.mysql_follow_repository import (
+    MySQLFollowRepository,
+    follower_ids_cache,
+)
+from internal.pines.infrastructure.adapters.mysql_pin_repository import MySQLPinRepository
+from internal.pines.application.use_cases.create_pin import CreatePinUseCase
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict) -> None:
+        self.messages.append(message)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+    def types(self):
+        return [message["type"] for message in self.messages]
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = ConnectionManager(MemoryBackplane())
+    monkeypatch.setattr(notifications, "manager", manager)
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def _no_follower_cache(run):
+    yield
+    run(follower_ids_cache.delete("author"))
+
+
+async def _drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def _seed_users(db, names) -> None:
+    for name in names:
+        db.add(UserModel(
+            id=name, username=name, email=f"{name}@example.com",
+            password_hash="x", full_name=name.title(),
+        ))
+    await db.commit()
+
+
+async def _follow(db, follower_id: str, following_id: str) -> None:
+    async with UnitOfWork(db):
+        await MySQLFollowRepository(db).create(Follow(
+            id="", follower_id=follower_id, following_id=following_id,
+            created_at=datetime.now(timezone.utc),
+        ))
+
+
+async def _publish_pin(db, title: str) -> None:
+    uow = UnitOfWork(db)
+    await CreatePinUseCase(MySQLPinRepository(db), uow, None, NotificationOutbox(db)).execute(
+        user_id="author", title=title, image_url="x", category="accesorio"
+    )
+
+
+def test_new_pin_reaches_only_online_followers(run, db_scope, manager):
+    sockets = {name: _FakeWebSocket() for name in ("online_fan", "stranger", "author")}
+    dispatcher = NotificationDispatcher(batch_size=50)
+
+    async def scenario():
+        async with db_scope() as db:
+            await _seed_users(db, ["author", "online_fan", "offline_fan", "stranger"])
+            await _follow(db, "online_fan", "author")
+            await _follow(db, "offline_fan", "author")
+            for name, ws in sockets.items():
+                await manager.connect(ws, name)
+
+            await _publish_pin(db, "Look de otoño")
+            assert await dispatcher.dispatch_once() == 1
+            await _drain()
+            for name, ws in sockets.items():
+                await manager.disconnect(ws, name)
+
+    run(scenario())
+
+    assert sockets["online_fan"].types() == ["new_pin"]
+    assert sockets["online_fan"].messages[0]["pin_title"] == "Look de otoño"
+    assert sockets["stranger"].types() == []
+    assert sockets["author"].types() == []
+    stats = dispatcher.stats()
+    assert stats["delivered"] == 1 and stats["skipped"] == 0
+
+
+def test_new_pin_with_no_follower_online_is_skipped(run, db_scope, manager):
+    dispatcher = NotificationDispatcher(batch_size=50)
+
+    async def scenario():
+        async with db_scope() as db:
+            await _seed_users(db, ["author", "offline_fan"])
+            await _follow(db, "offline_fan", "author")
+            await _publish_pin(db, "Nadie mira")
+            assert await dispatcher.dispatch_once() == 1
+            assert await dispatcher.dispatch_once() == 0  # la fila se consumió
+
+    run(scenario())
+
+    stats = dispatcher.stats()
+    assert stats["delivered"] == 0 and stats["skipped"] == 1
+
+
+def test_follower_ids_cache_is_invalidated_on_follow_and_unfollow(run, db_scope, queries):
+    async def scenario():
+        async with db_scope() as db:
+            await _seed_users(db, ["author", "fan1", "fan2"])
+            await _follow(db, "fan1", "author")
+            repo = MySQLFollowRepository(db)
+
+            assert await repo.get_follower_ids("author") == ["fan1"]
+            with queries:
+                assert await repo.get_follower_ids("author") == ["fan1"]
+            assert queries.count == 0  # desde la cache
+
+            await _follow(db, "fan2", "author")
+            assert sorted(await repo.get_follower_ids("author")) == ["fan1", "fan2"]
+
+            async with UnitOfWork(db):
+                await repo.delete("fan1", "author")
+            assert await repo.get_follower_ids("author") == ["fan2"]
+
+            # Un rollback no invalida (no cambió nada)
+            await repo.get_follower_ids("author")
+            with pytest.raises(RuntimeError):
+                async with UnitOfWork(db):
+                    await repo.delete("fan2", "author")
+                    raise RuntimeError
+            with queries:
+                assert await repo.get_follower_ids("author") == ["fan2"]
+            assert queries.count == 0
+
+    run(scenario())
+
+
+def test_new_pin_event_is_written_with_the_pin(run, db_scope):
+    async def scenario():
+        async with db_scope() as db:
+            await _seed_users(db, ["author"])
+            await _publish_pin(db, "Con aviso")
+            rows = (await db.scalars(select(NotificationOutboxModel))).all()
+            return [(row.event_type, row.actor_id) for row in rows]
+
+    assert run(scenario()) == [(EVENT_NEW_PIN, "author")]
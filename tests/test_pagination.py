@@ -0,0 +1,137 @@
+"""
+Cursores keyset: codificación, cursores inválidos (400) y empates en
+created_at
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from core.database.models import PinModel, UserModel
+from core.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    parse_cursor,
+    split_page,
+)
+from internal.pines.application.use_cases.get_pins import GetPinsUseCase
+from internal.pines.infrastructure.adapters.mysql_pin_repository import MySQLPinRepository
+
+_T0 = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def _b64(payload: bytes) -> str:
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    token = encode_cursor(created_at, "pin-42")
+
+    assert "=" not in token and "/" not in token and "+" not in token
+    assert decode_cursor(token) == Cursor(created_at, "pin-42")
+    assert parse_cursor(token) == Cursor(created_at, "pin-42")
+    assert parse_cursor(None) is None
+    assert parse_cursor("") is None
+
+
+@pytest.mark.parametrize("token", [
+    "not base64 at all!",
+    "abc",                                            # padding imposible
+    _b64(b"not json"),
+    _b64(b"[]"),                                      # JSON sin claves
+    _b64(json.dumps({"i": "pin-1"}).encode()),        # falta la fecha
+    _b64(json.dumps({"t": "ayer", "i": "pin-1"}).encode()),
+    _b64(b"\xff\xfe"),                                # no es UTF-8
+])
+def test_invalid_cursor_raises(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_tampered_cursor_raises():
+    token = encode_cursor(_T0, "pin-1")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token[:-3] + "!!!")
+
+
+def test_invalid_cursor_is_not_a_value_error():
+    """Las rutas mapean ValueError a 404; el cursor inválido debe dar 400"""
+    assert not issubclass(InvalidCursorError, ValueError)
+
+
+def test_invalid_cursor_handler_returns_400(run):
+    import main
+
+    response = run(main.invalid_cursor_handler(None, InvalidCursorError("Cursor de paginación inválido")))
+
+    assert response.status_code == 400
+    assert json.loads(response.body)["error"] == "Invalid Cursor"
+
+
+def test_split_page():
+    items = [SimpleNamespace(created_at=_T0 - timedelta(seconds=i), id=f"pin-{i}") for i in range(5)]
+
+    page, has_more, next_cursor = split_page(items, 3)
+    assert [item.id for item in page] == ["pin-0", "pin-1", "pin-2"]
+    assert has_more
+    assert decode_cursor(next_cursor) == Cursor(page[-1].created_at, "pin-2")
+
+    page, has_more, next_cursor = split_page(items[:3], 3)
+    assert len(page) == 3 and not has_more and next_cursor is None
+
+
+async def _seed(db) -> list:
+    """12 pins: grupos de 4 con el mismo created_at"""
+    db.add(UserModel(
+        id="author", username="author", email="author@example.com",
+        password_hash="x", full_name="Author",
+    ))
+    pins = []
+    for i in range(12):
+        pin = PinModel(
+            id=f"pin-{i:02d}", user_id="author", image_url="x", title=f"Pin {i}",
+            category="accesorio", created_at=_T0 - timedelta(minutes=i // 4),
+        )
+        db.add(pin)
+        pins.append((pin.created_at, pin.id))
+    await db.commit()
+    return [pin_id for _, pin_id in sorted(pins, reverse=True)]
+
+
+def test_keyset_pages_break_ties_on_created_at_by_id(run, session_factory):
+    async def scenario():
+        async with session_factory() as db:
+            expected = await _seed(db)
+            use_case = GetPinsUseCase(MySQLPinRepository(db))
+
+            seen, cursor = [], None
+            while True:
+                page = await use_case.execute(limit=3, cursor=cursor)
+                seen.extend(pin.id for pin in page["pins"])
+                assert page["count"] == page["total"] == len(page["pins"])
+                if not page["has_more"]:
+                    assert page["next_cursor"] is None
+                    break
+                cursor = page["next_cursor"]
+
+            # Un pin nuevo mientras se hace scroll no desplaza las páginas
+            db.add(PinModel(
+                id="pin-new", user_id="author", image_url="x", title="Nuevo",
+                category="accesorio", created_at=_T0 + timedelta(hours=1),
+            ))
+            await db.commit()
+            first = await use_case.execute(limit=3)
+            second = await use_case.execute(limit=3, cursor=encode_cursor(_T0, expected[2]))
+            return expected, seen, first, second
+
+    expected, seen, first, second = run(scenario())
+
+    assert seen == expected                      # ni saltos ni repetidos
+    assert len(set(seen)) == 12
+    assert first["pins"][0].id == "pin-new"
+    assert [pin.id for pin in second["pins"]] == expected[3:6]
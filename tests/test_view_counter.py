@@ -0,0 +1,129 @@
+"""
+Contador de vistas con buffer: volcado por lotes, restauración si falla y
+métricas de retraso
+"""
+import pytest
+from sqlalchemy import select
+
+from core.database.models import PinModel, UserModel
+from internal.pines.infrastructure.adapters import view_counter as view_counter_module
+from internal.pines.infrastructure.adapters.mysql_pin_repository import MySQLPinRepository
+from internal.pines.infrastructure.adapters.view_counter import MemoryViewBuffer, ViewCounter
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(view_counter_module, "time", clock)
+    return clock
+
+
+async def _seed(db, pins: int) -> None:
+    db.add(UserModel(
+        id="author", username="author", email="author@example.com",
+        password_hash="x", full_name="Author",
+    ))
+    for i in range(pins):
+        db.add(PinModel(
+            id=f"pin-{i}", user_id="author", image_url="x", title=f"Pin {i}",
+            category="accesorio", views_count=0,
+        ))
+    await db.commit()
+
+
+async def _views(db) -> dict:
+    result = await db.execute(select(PinModel.id, PinModel.views_count))
+    return dict(result.all())
+
+
+def test_memory_buffer_drain_and_restore(run):
+    async def scenario():
+        buffer = MemoryViewBuffer()
+        await buffer.add("a")
+        await buffer.add("a")
+        await buffer.add("b", 3)
+        assert await buffer.pending() == (2, 5)
+
+        drained = await buffer.drain()
+        assert drained == {"a": 2, "b": 3}
+        assert await buffer.pending() == (0, 0)
+
+        await buffer.add("a")  # llega mientras se vuelca
+        await buffer.restore(drained)
+        assert await buffer.drain() == {"a": 3, "b": 3}
+
+    run(scenario())
+
+
+def test_flush_writes_views_in_one_batch(run, db_scope, queries, clock):
+    async def scenario():
+        async with db_scope() as db:
+            await _seed(db, pins=3)
+
+        counter = ViewCounter(MemoryViewBuffer())
+        for pin_id in ("pin-0", "pin-0", "pin-1"):
+            await counter.record(pin_id)
+        clock.now += 4
+
+        stats = await counter.stats()
+        assert stats["pending_views"] == 3
+        assert stats["current_lag_seconds"] == 4
+
+        with queries:
+            assert await counter.flush() == 3
+        updates = [s for s in queries.statements if s.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 1
+
+        async with db_scope() as db:
+            assert await _views(db) == {"pin-0": 2, "pin-1": 1, "pin-2": 0}
+
+        stats = await counter.stats()
+        assert stats["pending_views"] == 0
+        assert stats["current_lag_seconds"] == 0
+        assert stats["last_flush_lag_seconds"] == 4
+        assert stats["flushes"] == 1 and stats["flushed_views"] == 3
+        assert await counter.flush() == 0  # nada pendiente
+
+    run(scenario())
+
+
+def test_failed_flush_restores_counts(run, db_scope, clock, monkeypatch):
+    async def scenario():
+        async with db_scope() as db:
+            await _seed(db, pins=2)
+
+        counter = ViewCounter(MemoryViewBuffer())
+        await counter.record("pin-0")
+        await counter.record("pin-1")
+        started = clock.now
+        clock.now += 2
+
+        async def broken(self, counts):
+            raise RuntimeError("db down")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(MySQLPinRepository, "add_views_bulk", broken)
+            with pytest.raises(RuntimeError):
+                await counter.flush()
+
+        stats = await counter.stats()
+        assert stats["flush_failures"] == 1
+        assert stats["pending_views"] == 2
+        # El retraso sigue contando desde la primera vista sin volcar
+        assert stats["current_lag_seconds"] == clock.now - started
+
+        await counter.record("pin-0")
+        assert await counter.flush() == 3
+        async with db_scope() as db:
+            assert await _views(db) == {"pin-0": 2, "pin-1": 1}
+        assert (await counter.stats())["last_flush_lag_seconds"] == clock.now - started
+
+    run(scenario())
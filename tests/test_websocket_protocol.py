@@ -0,0 +1,155 @@
+"""
+Protocolo de cable del WebSocket: negociación, codificación (JSON con
+orjson, msgpack) y agrupación de eventos por ventana en un solo frame
+"""
+import asyncio
+import json
+
+import pytest
+
+from core import websocket_protocol
+from core.backplane import MemoryBackplane
+from core.websocket import ConnectionManager
+from core.websocket_protocol import (
+    ENCODING_JSON,
+    ENCODING_MSGPACK,
+    LEGACY_PROTOCOL,
+    WireProtocol,
+    available_encodings,
+)
+
+
+class _FakeWebSocket:
+    """Registra cada frame tal como llegaría al cliente"""
+
+    def __init__(self):
+        self.frames = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict) -> None:
+        self.frames.append(("json", message))
+
+    async def send_text(self, text: str) -> None:
+        self.frames.append(("text", text))
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.frames.append(("bytes", data))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+
+def _event(n: int) -> dict:
+    return {"type": "pin_liked", "pin_id": f"p{n}", "count": n}
+
+
+# ── Negociación ─────────────────────────────────────────────
+
+def test_negotiate_defaults_to_legacy_json():
+    protocol = WireProtocol.negotiate()
+    assert protocol.legacy
+    assert protocol.max_events == 1
+    assert LEGACY_PROTOCOL.legacy
+
+
+def test_negotiate_falls_back_to_json_for_unknown_or_missing_encoding(monkeypatch):
+    assert WireProtocol.negotiate(batch=True, encoding="protobuf").encoding == ENCODING_JSON
+    assert WireProtocol.negotiate(batch=True, encoding=None).encoding == ENCODING_JSON
+
+    monkeypatch.setattr(websocket_protocol, "msgpack", None)
+    assert available_encodings() == [ENCODING_JSON]
+    assert WireProtocol.negotiate(batch=True, encoding="MSGPACK").encoding == ENCODING_JSON
+
+
+def test_describe_reports_the_effective_protocol():
+    assert WireProtocol(batch=True, window_ms=25).describe() == {
+        "batch": True,
+        "encoding": ENCODING_JSON,
+        "batch_window_ms": 25,
+        "available_encodings": available_encodings(),
+    }
+    assert LEGACY_PROTOCOL.describe()["batch_window_ms"] == 0
+
+
+# ── Codificación ────────────────────────────────────────────
+
+def test_legacy_sends_one_json_message(run):
+    ws = _FakeWebSocket()
+    run(LEGACY_PROTOCOL.send(ws, [_event(1)]))
+    assert ws.frames == [("json", _event(1))]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_batch_is_one_text_frame(run, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(websocket_protocol, "orjson", None)
+    ws = _FakeWebSocket()
+
+    run(WireProtocol(batch=True).send(ws, [_event(1), _event(2)]))
+
+    [(kind, text)] = ws.frames
+    assert kind == "text"
+    assert json.loads(text) == {"type": "batch", "events": [_event(1), _event(2)]}
+
+
+def test_msgpack_batch_round_trips(run):
+    msgpack = pytest.importorskip("msgpack")
+    ws = _FakeWebSocket()
+
+    run(WireProtocol(batch=True, encoding=ENCODING_MSGPACK).send(ws, [_event(1), _event(2)]))
+
+    [(kind, data)] = ws.frames
+    assert kind == "bytes"
+    assert msgpack.unpackb(data) == {"type": "batch", "events": [_event(1), _event(2)]}
+
+
+def test_msgpack_without_batch_sends_the_bare_event(run):
+    msgpack = pytest.importorskip("msgpack")
+    ws = _FakeWebSocket()
+
+    run(WireProtocol(encoding=ENCODING_MSGPACK).send(ws, [_event(1)]))
+
+    [(kind, data)] = ws.frames
+    assert kind == "bytes" and msgpack.unpackb(data) == _event(1)
+
+
+# ── Ventana de batch ────────────────────────────────────────
+
+async def _send_burst(protocol: WireProtocol, events: int, wait: float):
+    manager = ConnectionManager(MemoryBackplane())
+    ws = _FakeWebSocket()
+    await manager.connect(ws, "u1", protocol=protocol)
+    for n in range(events):
+        await manager.send_personal("u1", _event(n))
+    await asyncio.sleep(wait)
+    await manager.disconnect(ws, "u1")
+    return ws.frames, manager.stats()["send_queues"]
+
+
+def test_events_inside_the_window_share_one_frame(run):
+    frames, stats = run(_send_burst(WireProtocol(batch=True, window_ms=20), events=5, wait=0.1))
+
+    [(kind, text)] = frames
+    assert kind == "text"
+    assert json.loads(text)["events"] == [_event(n) for n in range(5)]
+    assert stats["sent"] == 5 and stats["frames"] == 1
+
+
+def test_batch_is_split_at_max_events(run):
+    protocol = WireProtocol(batch=True, window_ms=20, max_events=2)
+    frames, stats = run(_send_burst(protocol, events=5, wait=0.2))
+
+    sizes = [len(json.loads(text)["events"]) for _, text in frames]
+    assert sizes == [2, 2, 1]
+    assert stats["sent"] == 5 and stats["frames"] == 3
+
+
+def test_legacy_connection_sends_one_frame_per_event(run):
+    frames, stats = run(_send_burst(LEGACY_PROTOCOL, events=3, wait=0.05))
+
+    assert frames == [("json", _event(n)) for n in range(3)]
+    assert stats["frames"] == 3